@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -12,9 +14,42 @@ class Settings(BaseSettings):
     algorithm: str = Field(..., alias="ALGORITHM", description="Алгоритм шифрування JWT")
     access_token_expire_minutes: int = Field(..., alias="ACCESS_TOKEN_EXPIRE_MINUTES", description="Час дії access токена в хвилинах")
     refresh_token_expire_days: int = Field(..., alias="REFRESH_TOKEN_EXPIRE_DAYS", description="Час дії refresh токена в днях")
+    token_cache_size: int = Field(4096, alias="TOKEN_CACHE_SIZE", description="Кількість перевірених токенів у кеші процесу (0 вимикає кеш)")
 
     database_url: str = Field(..., alias="DATABASE_URL", description="URL підключення до бази даних")
+    migrate_on_startup: bool = Field(True, alias="MIGRATE_ON_STARTUP", description="Застосовувати міграції Alembic під час запуску застосунку")
+    db_pool_size: int = Field(5, alias="DB_POOL_SIZE", description="Кількість постійних з'єднань з базою в пулі кожного процесу")
+    db_max_overflow: int = Field(10, alias="DB_MAX_OVERFLOW", description="Кількість додаткових з'єднань понад DB_POOL_SIZE під час піків")
+    db_pool_timeout: float = Field(30.0, alias="DB_POOL_TIMEOUT", description="Максимальний час очікування на вільне з'єднання в секундах")
+    db_pool_recycle: int = Field(1800, alias="DB_POOL_RECYCLE", description="Вік з'єднання в секундах, після якого воно перевідкривається")
+    db_pool_pre_ping: bool = Field(True, alias="DB_POOL_PRE_PING", description="Перевіряти з'єднання перед видачею з пулу")
+    db_pool_use_lifo: bool = Field(True, alias="DB_POOL_USE_LIFO", description="Видавати останнє повернене з'єднання, щоб зайві простоювали і закривалися")
+    database_replica_url: Optional[str] = Field(None, alias="DATABASE_REPLICA_URL", description="URL репліки бази даних для читань; без нього всі запити йдуть на основну базу")
+    replica_max_lag: float = Field(5.0, alias="REPLICA_MAX_LAG", description="Максимальне відставання репліки в секундах, за якого з неї ще читають")
+    replica_check_interval: float = Field(1.0, alias="REPLICA_CHECK_INTERVAL", description="Інтервал перевірки відставання репліки в секундах")
+    replica_retry_delay: float = Field(10.0, alias="REPLICA_RETRY_DELAY", description="Час у секундах, на який репліка виключається після помилки з'єднання")
+    slow_query_ms: float = Field(200.0, alias="SLOW_QUERY_MS", description="Тривалість SQL запиту в мс, після якої він записується в журнал як повільний")
+    n_plus_one_threshold: int = Field(10, alias="N_PLUS_ONE_THRESHOLD", description="Кількість однакових SELECT в одному HTTP-запиті, що вважається ймовірною проблемою N+1")
+    query_debug_headers: bool = Field(False, alias="QUERY_DEBUG_HEADERS", description="Повертати кількість і час SQL запитів у заголовках відповіді")
     redis_url: str = Field("redis://localhost:6379/0", alias="REDIS_URL", description="URL Redis сервера")
+    user_cache_ttl: int = Field(3600, alias="USER_CACHE_TTL", description="Час життя знімка користувача в Redis у секундах")
+    user_l1_cache_size: int = Field(1024, alias="USER_L1_CACHE_SIZE", description="Кількість користувачів у кеші пам'яті процесу (0 вимикає кеш)")
+    user_l1_cache_ttl: float = Field(5.0, alias="USER_L1_CACHE_TTL", description="Час життя запису в кеші пам'яті процесу в секундах")
+
+    response_cache_enabled: bool = Field(False, alias="RESPONSE_CACHE_ENABLED", description="Кешувати відповіді читання контактів у Redis")
+    response_cache_list_ttl: int = Field(60, alias="RESPONSE_CACHE_LIST_TTL", description="Час життя кешованого списку контактів у секундах")
+    response_cache_detail_ttl: int = Field(300, alias="RESPONSE_CACHE_DETAIL_TTL", description="Час життя кешованого контакту в секундах")
+    response_cache_lock_ttl: float = Field(5.0, alias="RESPONSE_CACHE_LOCK_TTL", description="Час життя замку обчислення відповіді в секундах")
+
+    metrics_enabled: bool = Field(True, alias="METRICS_ENABLED", description="Збирати метрики запитів і віддавати їх на /metrics")
+
+    rate_limit_enabled: bool = Field(True, alias="RATE_LIMIT_ENABLED", description="Перевіряти ліміти частоти запитів")
+    rate_limit_backend: str = Field("redis", alias="RATE_LIMIT_BACKEND", description="Сховище лічильників лімітів: redis або local")
+    rate_limit_default: str = Field("120/minute", alias="RATE_LIMIT_DEFAULT", description="Ліміт запитів до кожного маршруту контактів і профілю на користувача")
+    rate_limit_register: str = Field("5/minute", alias="RATE_LIMIT_REGISTER", description="Ліміт реєстрацій з однієї IP-адреси")
+    rate_limit_login: str = Field("10/minute", alias="RATE_LIMIT_LOGIN", description="Ліміт спроб входу з однієї IP-адреси")
+
+    password_hash_workers: int = Field(4, alias="PASSWORD_HASH_WORKERS", description="Кількість потоків для хешування паролів bcrypt")
 
     mail_username: str = Field(..., alias="MAIL_USERNAME", description="Ім'я користувача для SMTP")
     mail_password: str = Field(..., alias="MAIL_PASSWORD", description="Пароль для SMTP")
@@ -22,11 +57,28 @@ class Settings(BaseSettings):
     mail_port: int = Field(..., alias="MAIL_PORT", description="Порт поштового сервера")
     mail_server: str = Field(..., alias="MAIL_SERVER", description="Адреса поштового сервера")
     mail_from_name: str = Field("No-Reply", alias="MAIL_FROM_NAME", description="Ім'я відправника в листі")
+    mail_starttls: bool = Field(True, alias="MAIL_STARTTLS", description="Використовувати STARTTLS для SMTP")
+    mail_ssl_tls: bool = Field(False, alias="MAIL_SSL_TLS", description="Підключатися до SMTP через TLS")
+    mail_use_credentials: bool = Field(True, alias="MAIL_USE_CREDENTIALS", description="Автентифікуватися на SMTP сервері")
+    mail_validate_certs: bool = Field(False, alias="MAIL_VALIDATE_CERTS", description="Перевіряти сертифікат SMTP сервера")
+
+    smtp_pool_size: int = Field(4, alias="SMTP_POOL_SIZE", description="Кількість SMTP з'єднань обробника вихідної пошти")
+    outbox_batch_size: int = Field(50, alias="OUTBOX_BATCH_SIZE", description="Кількість листів, що обробляються за один прохід")
+    outbox_poll_interval: float = Field(1.0, alias="OUTBOX_POLL_INTERVAL", description="Пауза між перевірками порожньої черги в секундах")
+    outbox_max_attempts: int = Field(5, alias="OUTBOX_MAX_ATTEMPTS", description="Максимальна кількість спроб надсилання листа")
+    outbox_backoff_base: float = Field(2.0, alias="OUTBOX_BACKOFF_BASE", description="Базова затримка перед повторною спробою в секундах")
+    outbox_backoff_max: float = Field(600.0, alias="OUTBOX_BACKOFF_MAX", description="Максимальна затримка перед повторною спробою в секундах")
+    outbox_worker_in_app: bool = Field(False, alias="OUTBOX_WORKER_IN_APP", description="Запускати обробник вихідної пошти всередині веб-застосунку")
 
     cloudinary_name: str = Field(..., alias="CLOUDINARY_NAME", description="Ім’я облікового запису Cloudinary")
     cloudinary_api_key: str = Field(..., alias="CLOUDINARY_API_KEY", description="API ключ Cloudinary")
     cloudinary_api_secret: str = Field(..., alias="CLOUDINARY_API_SECRET", description="Секрет Cloudinary")
 
+    avatar_storage: str = Field("cloudinary", alias="AVATAR_STORAGE", description="Сховище аватарів: cloudinary або local")
+    avatar_max_bytes: int = Field(5 * 1024 * 1024, alias="AVATAR_MAX_BYTES", description="Максимальний розмір аватару в байтах")
+    avatar_local_dir: str = Field("media/avatars", alias="AVATAR_LOCAL_DIR", description="Каталог для аватарів у локальному сховищі")
+    avatar_local_url: str = Field("/media/avatars", alias="AVATAR_LOCAL_URL", description="URL-префікс аватарів у локальному сховищі")
+
     testing: bool = Field(False, alias="TESTING", description="Режим тестування, використовується для запуску SQLite")
 
     class Config:
@@ -1,16 +1,42 @@
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.conf.config import settings
+from app.database.instrumentation import instrument_queries
+from app.database.pool import InstrumentedQueuePool, PoolMetrics
 
 if settings.testing:
     DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 else:
     DATABASE_URL = settings.database_url
 
-engine = create_async_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if settings.testing else {},
-)
+
+def pool_options(url: str) -> dict:
+    """
+    Повертає параметри пулу з'єднань з налаштувань застосунку.
+
+    SQLite (зокрема база в пам'яті для тестів) використовує пул SQLAlchemy
+    за замовчуванням, тож параметри розміру до нього не застосовуються.
+
+    :param url: URL бази даних.
+    :return: Іменовані аргументи для ``create_async_engine``.
+    """
+    if url.startswith("sqlite"):
+        return {"connect_args": {"check_same_thread": False}}
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_use_lifo": settings.db_pool_use_lifo,
+    }
+
+
+engine = create_async_engine(DATABASE_URL, **pool_options(DATABASE_URL))
+pool_metrics = PoolMetrics().attach(engine)
+instrument_queries(engine)
 
 AsyncSessionLocal = sessionmaker(
     bind=engine,
@@ -22,7 +48,8 @@ Base = declarative_base()
 async def init_db() -> None:
     """
     Ініціалізує базу даних: створює всі таблиці, якщо вони ще не існують.
-    Використовується при запуску FastAPI або в тестах.
+    Використовується для SQLite у пам'яті (режим тестування); робочі бази
+    оновлюються міграціями (див. :mod:`app.database.schema`).
     """
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -31,8 +58,27 @@ async def get_db() -> AsyncSession:
     """
     Генерує асинхронну сесію бази даних.
 
+    Лише відкриває сесію: схема готується один раз під час запуску застосунку.
+
     :yield: Сесія бази даних AsyncSession.
     """
-    await init_db()
     async with AsyncSessionLocal() as session:
-        yield session
\ No newline at end of file
+        yield session
+
+
+DIALECT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def insert_or_skip(model, db: AsyncSession, *conflict_columns):
+    """
+    Створює ``INSERT ... ON CONFLICT (...) DO NOTHING`` для діалекту сесії.
+
+    Рядки, що порушують унікальний індекс за ``conflict_columns``,
+    пропускаються без помилки й не потрапляють у ``RETURNING``.
+
+    :param model: Модель або таблиця.
+    :param db: Сесія бази даних.
+    :param conflict_columns: Стовпці унікального індексу.
+    :return: Запит INSERT.
+    """
+    return DIALECT_INSERTS[db.bind.dialect.name](model).on_conflict_do_nothing(index_elements=conflict_columns)
@@ -0,0 +1,109 @@
+"""
+Модуль перевірки планів SQL запитів.
+
+:func:`record_statements` записує запити, які рушій виконав усередині блоку
+``with`` (наприклад, під час обробки одного HTTP-запиту), а
+:func:`sequential_scans` виконує ``EXPLAIN`` для кожного з них і повертає
+таблиці, які база читає повним скануванням замість пошуку за індексом.
+
+Підтримуються SQLite (``EXPLAIN QUERY PLAN``) і PostgreSQL
+(``EXPLAIN (FORMAT JSON)`` з ``enable_seqscan = off``: якщо послідовне
+сканування лишається в плані навіть так, придатного індексу немає).
+"""
+
+import json
+import re
+from contextlib import contextmanager
+from typing import Iterator, List, NamedTuple, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.database.instrumentation import statement_kind
+
+EXPLAINED_KINDS = {"SELECT", "UPDATE", "DELETE", "WITH"}
+_SQLITE_SCAN = re.compile(r"^SCAN (\w+)")
+
+
+class RecordedStatement(NamedTuple):
+    """
+    Виконаний SQL запит з параметрами.
+    """
+
+    statement: str
+    parameters: Sequence
+
+
+@contextmanager
+def record_statements(engine: AsyncEngine) -> Iterator[List[RecordedStatement]]:
+    """
+    Записує SELECT, UPDATE і DELETE, виконані рушієм усередині блоку ``with``.
+
+    Для ``executemany`` зберігається перший набір параметрів.
+
+    :param engine: Асинхронний рушій SQLAlchemy.
+    :yield: Список записаних запитів (заповнюється під час виконання блоку).
+    """
+    recorded: List[RecordedStatement] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement_kind(statement) in EXPLAINED_KINDS:
+            recorded.append(RecordedStatement(statement, parameters[0] if executemany else parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        yield recorded
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+
+def _sqlite_scans(conn: Connection, recorded: RecordedStatement) -> List[str]:
+    rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {recorded.statement}", recorded.parameters).fetchall()
+    tables = []
+    for row in rows:
+        match = _SQLITE_SCAN.match(row[-1])
+        if match and "VIRTUAL TABLE" not in row[-1]:
+            tables.append(match.group(1))
+    return tables
+
+
+def _postgres_nodes(node: dict) -> Iterator[dict]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from _postgres_nodes(child)
+
+
+def _postgres_scans(conn: Connection, recorded: RecordedStatement) -> List[str]:
+    conn.exec_driver_sql("SET enable_seqscan = off")
+    try:
+        plan = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {recorded.statement}", recorded.parameters).scalar()
+    finally:
+        conn.exec_driver_sql("RESET enable_seqscan")
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return [
+        node["Relation Name"]
+        for node in _postgres_nodes(plan[0]["Plan"])
+        if node["Node Type"] == "Seq Scan"
+    ]
+
+
+def sequential_scans(conn: Connection, recorded: RecordedStatement) -> List[str]:
+    """
+    Повертає таблиці, які запит читає повним скануванням.
+
+    Сканування віртуальних таблиць FTS5 у SQLite не враховується: вони мають
+    власний індекс.
+
+    :param conn: Синхронне з'єднання (наприклад, у ``AsyncConnection.run_sync``).
+    :param recorded: Записаний запит.
+    :return: Назви таблиць; порожній список, якщо всі таблиці читаються за індексом.
+    :raises NotImplementedError: Для діалектів, крім SQLite і PostgreSQL.
+    """
+    dialect = conn.dialect.name
+    if dialect == "sqlite":
+        return _sqlite_scans(conn, recorded)
+    if dialect == "postgresql":
+        return _postgres_scans(conn, recorded)
+    raise NotImplementedError(f"EXPLAIN is not supported for {dialect}")
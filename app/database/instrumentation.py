@@ -0,0 +1,194 @@
+"""
+Модуль інструментування SQL запитів.
+
+Обробники подій рушія SQLAlchemy вимірюють тривалість кожного запиту
+й записують її в метрики за типом запиту (SELECT, INSERT, UPDATE, DELETE).
+
+Кожен запит до бази також прив'язується до поточного HTTP-запиту через
+``ContextVar``, який встановлює :class:`QueryTrackingMiddleware`. Для
+HTTP-запиту рахуються кількість і сумарний час SQL запитів. Повільні запити
+(``SLOW_QUERY_MS``) записуються в журнал у нормалізованому вигляді, а
+однаковий SELECT, повторений ``N_PLUS_ONE_THRESHOLD`` разів, позначається
+як ймовірна проблема N+1. З ``QUERY_DEBUG_HEADERS=True`` кількість і час
+запитів повертаються в заголовках відповіді.
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.conf.config import settings
+from app.services.metrics import db_metrics, queries_per_request
+
+logger = logging.getLogger(__name__)
+
+STATEMENT_KINDS = {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"}
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Query-Time-Ms"
+
+_WHITESPACE = re.compile(r"\s+")
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b|\$\d+|%\(\w+\)s|(?<!:):\w+")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+class QueryStats:
+    """
+    SQL запити, виконані під час обробки одного HTTP-запиту.
+    """
+
+    __slots__ = ("count", "seconds", "selects")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.selects: Counter = Counter()
+
+    def repeated_selects(self, threshold: int) -> Counter:
+        """
+        Повертає нормалізовані SELECT, виконані щонайменше ``threshold`` разів.
+
+        :param threshold: Мінімальна кількість повторів.
+        :return: Лічильник підозрілих запитів.
+        """
+        return Counter({sql: n for sql, n in self.selects.items() if n >= threshold})
+
+
+current_queries: ContextVar[Optional[QueryStats]] = ContextVar("current_queries", default=None)
+
+
+def statement_kind(statement: str) -> str:
+    """
+    Визначає тип SQL запиту за першим ключовим словом.
+
+    :param statement: Текст запиту.
+    :return: Тип запиту або ``OTHER``.
+    """
+    keyword = statement.lstrip()[:6].upper()
+    return keyword if keyword in STATEMENT_KINDS else "WITH" if keyword.startswith("WITH") else "OTHER"
+
+
+@lru_cache(maxsize=1024)
+def normalize_sql(statement: str) -> str:
+    """
+    Нормалізує SQL для журналу і групування: прибирає зайві пробіли,
+    замінює літерали й параметри на ``?`` і згортає списки ``IN (?, ?, ...)``.
+
+    :param statement: Текст запиту.
+    :return: Нормалізований запит.
+    """
+    sql = _LITERALS.sub("?", _WHITESPACE.sub(" ", statement).strip())
+    return _IN_LIST.sub("(?...)", sql)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    kind = statement_kind(statement)
+    db_metrics.observe(kind, elapsed)
+
+    stats = current_queries.get()
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += elapsed
+        if kind == "SELECT":
+            stats.selects[normalize_sql(statement)] += 1
+    if elapsed * 1000 >= settings.slow_query_ms:
+        logger.warning("Slow query (%.1f ms): %s", elapsed * 1000, normalize_sql(statement))
+
+
+def _handle_error(exception_context) -> None:
+    started = exception_context.connection.info.get("query_started") if exception_context.connection else None
+    if started:
+        started.pop()
+
+
+def instrument_queries(engine: AsyncEngine) -> None:
+    """
+    Підписує обробники вимірювання запитів на події рушія.
+
+    :param engine: Асинхронний рушій SQLAlchemy.
+    """
+    target = engine.sync_engine
+    event.listen(target, "before_cursor_execute", _before_cursor_execute)
+    event.listen(target, "after_cursor_execute", _after_cursor_execute)
+    event.listen(target, "handle_error", _handle_error)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Рахує SQL запити, виконані всередині блоку ``with``.
+
+    Зручно в тестах і скриптах::
+
+        with track_queries() as queries:
+            await read_contacts(...)
+        assert queries.count <= 2
+
+    :yield: Лічильник запитів.
+    """
+    stats = QueryStats()
+    token = current_queries.set(stats)
+    try:
+        yield stats
+    finally:
+        current_queries.reset(token)
+
+
+def report_repeated_selects(stats: QueryStats, method: str, path: str) -> None:
+    """
+    Записує в журнал SELECT, що повторюються в межах одного HTTP-запиту (ймовірний N+1).
+
+    :param stats: Запити HTTP-запиту.
+    :param method: HTTP метод.
+    :param path: Шлях запиту.
+    """
+    for sql, count in stats.repeated_selects(settings.n_plus_one_threshold).items():
+        logger.warning("Possible N+1 in %s %s: %d x %s", method, path, count, sql)
+
+
+class QueryTrackingMiddleware:
+    """
+    ASGI middleware, що прив'язує SQL запити до HTTP-запиту.
+
+    :param app: ASGI застосунок.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start" and settings.query_debug_headers:
+                message = {**message, "headers": [
+                    *message.get("headers", []),
+                    (QUERY_COUNT_HEADER.lower().encode(), str(stats.count).encode()),
+                    (QUERY_TIME_HEADER.lower().encode(), f"{stats.seconds * 1000:.2f}".encode()),
+                ]}
+            await send(message)
+
+        token = current_queries.set(stats)
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            current_queries.reset(token)
+            queries_per_request.observe(stats.count)
+            if stats.selects:
+                report_repeated_selects(stats, scope["method"], scope["path"])
@@ -0,0 +1,140 @@
+"""
+Модуль інструментування пулу з'єднань з базою даних.
+
+:class:`InstrumentedQueuePool` вимірює, скільки часу запит чекає на вільне
+з'єднання, а :class:`PoolMetrics` через події пулу SQLAlchemy рахує видачі,
+повернення, відкриті й закриті з'єднання. Знімок метрик показує, чи
+вистачає ``DB_POOL_SIZE`` і ``DB_MAX_OVERFLOW`` для поточної кількості
+процесів: зростання часу очікування і використання overflow означають, що
+запити стоять у черзі за з'єднанням.
+"""
+
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+from app.services.metrics import Histogram
+
+WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+
+class PoolMetrics:
+    """
+    Лічильники пулу з'єднань одного рушія.
+    """
+
+    def __init__(self):
+        self.pool: Optional[Pool] = None
+        self.wait = Histogram(WAIT_BUCKETS)
+        self.timeouts = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.opened = 0
+        self.closed = 0
+        self.invalidated = 0
+        self.peak_checked_out = 0
+        self.peak_overflow = 0
+
+    def attach(self, engine: AsyncEngine) -> "PoolMetrics":
+        """
+        Підписується на події пулу рушія.
+
+        :param engine: Асинхронний рушій SQLAlchemy.
+        :return: Ці метрики.
+        """
+        self.pool = engine.sync_engine.pool
+        if isinstance(self.pool, InstrumentedQueuePool):
+            self.pool.metrics = self
+        target = engine.sync_engine
+        event.listen(target, "connect", self._on_connect)
+        event.listen(target, "close", self._on_close)
+        event.listen(target, "invalidate", self._on_invalidate)
+        event.listen(target, "checkout", self._on_checkout)
+        event.listen(target, "checkin", self._on_checkin)
+        return self
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        self.opened += 1
+
+    def _on_close(self, dbapi_connection, connection_record) -> None:
+        self.closed += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        self.invalidated += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        self.checkouts += 1
+        checked_out = getattr(self.pool, "checkedout", None)
+        self.peak_checked_out = max(
+            self.peak_checked_out, checked_out() if checked_out else self.checkouts - self.checkins
+        )
+        overflow = getattr(self.pool, "overflow", None)
+        if overflow is not None:
+            self.peak_overflow = max(self.peak_overflow, overflow())
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        self.checkins += 1
+
+    def observe_wait(self, seconds: float) -> None:
+        """
+        Записує час очікування на з'єднання.
+
+        :param seconds: Тривалість у секундах.
+        """
+        self.wait.observe(seconds)
+
+    def snapshot(self) -> Dict[str, object]:
+        """
+        Повертає знімок стану і лічильників пулу.
+
+        :return: Розмір пулу, видані й вільні з'єднання, поточний і піковий overflow,
+            гістограма очікування, тайм-аути та кількість відкритих, закритих
+            і інвалідованих з'єднань.
+        """
+        pool = self.pool
+        state = {"pool_class": type(pool).__name__ if pool is not None else None}
+        for name in ("size", "checkedout", "checkedin", "overflow"):
+            method = getattr(pool, name, None)
+            state[name] = method() if method is not None else None
+        return {
+            **state,
+            "peak_checked_out": self.peak_checked_out,
+            "peak_overflow": self.peak_overflow,
+            "checkouts": self.checkouts,
+            "wait_seconds": self.wait.snapshot(),
+            "timeouts": self.timeouts,
+            "connections_opened": self.opened,
+            "connections_closed": self.closed,
+            "connections_invalidated": self.invalidated,
+        }
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Асинхронний пул з черговістю, що вимірює час очікування на з'єднання.
+    """
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            if self.metrics is not None:
+                self.metrics.timeouts += 1
+            raise
+        if self.metrics is not None:
+            self.metrics.observe_wait(time.perf_counter() - started)
+        return connection
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        if self.metrics is not None:
+            self.metrics.pool = pool
+        return pool
@@ -0,0 +1,289 @@
+"""
+Модуль маршрутизації читань на репліку бази даних.
+
+Якщо задано ``DATABASE_REPLICA_URL``, обробники, що лише читають дані
+(список, деталі й пошук контактів, промах кешу користувача в ``/users/me``),
+отримують сесію репліки, а записи, як і раніше, йдуть на основну базу.
+
+Репліка використовується, лише поки вона доступна і відстає не більше ніж
+на ``REPLICA_MAX_LAG`` секунд. Відставання перевіряється запитом до репліки
+не частіше ніж раз на ``REPLICA_CHECK_INTERVAL`` секунд; після помилки
+з'єднання репліка на ``REPLICA_RETRY_DELAY`` секунд виключається, і всі
+читання йдуть на основну базу.
+
+Після зміни контактів користувача його читання йдуть на основну базу
+протягом ``REPLICA_MAX_LAG + REPLICA_CHECK_INTERVAL`` секунд (read-your-writes):
+за цей час репліка, що допущена до читань, гарантовано отримує запис.
+Позначка останнього запису зберігається в Redis (спільна для процесів)
+і в пам'яті процесу.
+
+Якщо запит до репліки падає з помилкою з'єднання, репліка виключається,
+а той самий запит повторюється на основній базі (:class:`FallbackSession`),
+тож поточний HTTP-запит не завершується помилкою.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from aioredis.exceptions import RedisError
+from sqlalchemy import text
+from sqlalchemy.exc import InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.conf.config import settings
+from app.database.db import AsyncSessionLocal, pool_options
+from app.database.instrumentation import instrument_queries
+from app.database.pool import PoolMetrics
+from app.services.cache import redis
+from app.services.lru import TTLCache
+
+logger = logging.getLogger(__name__)
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+RECENT_WRITE_PREFIX = "recent-write:"
+RECENT_WRITES_SIZE = 10_000
+REPLICA_ERRORS = (OperationalError, InterfaceError, OSError, asyncio.TimeoutError)
+
+DEFAULT_LAG_QUERY = "SELECT 0"
+LAG_QUERIES = {
+    "postgresql": (
+        "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+        "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+    ),
+}
+
+
+class FallbackSession:
+    """
+    Сесія репліки, що повторює невдале читання на основній базі.
+
+    Решта атрибутів і методів делегується сесії репліки. Після першої
+    помилки з'єднання всі наступні запити сесії йдуть на основну базу.
+
+    :param replica: Сесія репліки.
+    :param primary: Сесія основної бази даних.
+    :param on_error: Виклик, що виключає репліку.
+    """
+
+    def __init__(self, replica: AsyncSession, primary: AsyncSession, on_error: Callable[[], None]):
+        self._replica = replica
+        self._primary = primary
+        self._on_error = on_error
+        self._failed = False
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._replica, name)
+
+    async def _call(self, method: str, *args, **kwargs) -> Any:
+        if not self._failed:
+            try:
+                return await getattr(self._replica, method)(*args, **kwargs)
+            except REPLICA_ERRORS:
+                logger.warning("Replica read failed, retrying on the primary", exc_info=True)
+                self._failed = True
+                self._on_error()
+        return await getattr(self._primary, method)(*args, **kwargs)
+
+    async def execute(self, *args, **kwargs) -> Any:
+        """
+        Виконує запит на репліці, а після помилки з'єднання — на основній базі.
+        """
+        return await self._call("execute", *args, **kwargs)
+
+    async def stream(self, *args, **kwargs) -> Any:
+        """
+        Відкриває потоковий результат на репліці, а після помилки з'єднання — на основній базі.
+        """
+        return await self._call("stream", *args, **kwargs)
+
+
+class ReplicaRouter:
+    """
+    Вибирає базу для читання: репліку або основну.
+
+    :param replica: Фабрика сесій репліки або None, якщо репліку не налаштовано.
+    :param max_lag: Максимальне відставання репліки в секундах.
+    :param check_interval: Інтервал перевірки відставання в секундах.
+    :param retry_delay: Час у секундах, на який репліка виключається після помилки.
+    """
+
+    def __init__(
+        self,
+        replica: Optional[sessionmaker],
+        max_lag: float,
+        check_interval: float,
+        retry_delay: float,
+    ):
+        self.replica = replica
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.retry_delay = retry_delay
+        self.window = max_lag + check_interval
+        self.lag: Optional[float] = None
+        self._recent_writes = TTLCache(RECENT_WRITES_SIZE, self.window)
+        self._checked_at = float("-inf")
+        self._down_until = 0.0
+        self._probe: Optional[asyncio.Task] = None
+        self.replica_reads = 0
+        self.primary_reads = 0
+        self.fallbacks = {"read_your_writes": 0, "lag": 0, "unavailable": 0}
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Чи налаштовано репліку.
+        """
+        return self.replica is not None
+
+    async def record_write(self, user_id: int) -> None:
+        """
+        Позначає запис даних користувача, щоб його наступні читання йшли на основну базу.
+
+        :param user_id: ID користувача.
+        """
+        if not self.enabled:
+            return
+        self._recent_writes.set(user_id, True)
+        try:
+            await redis.set(f"{RECENT_WRITE_PREFIX}{user_id}", "1", px=int(self.window * 1000))
+        except (RedisError, OSError):
+            logger.warning("Could not record a recent write for user %s", user_id, exc_info=True)
+
+    async def _wrote_recently(self, user_id: int) -> bool:
+        if user_id in self._recent_writes:
+            return True
+        try:
+            return bool(await redis.exists(f"{RECENT_WRITE_PREFIX}{user_id}"))
+        except (RedisError, OSError):
+            return True
+
+    def mark_down(self) -> None:
+        """
+        Виключає репліку на ``retry_delay`` секунд після помилки з'єднання.
+        """
+        logger.warning("Replica is unavailable, reads fall back to the primary for %.0f s", self.retry_delay)
+        self._down_until = time.monotonic() + self.retry_delay
+        self.lag = None
+
+    async def _measure_lag(self, session: AsyncSession) -> float:
+        query = LAG_QUERIES.get(session.bind.dialect.name, DEFAULT_LAG_QUERY)
+        return float((await session.execute(text(query))).scalar() or 0.0)
+
+    async def _check(self) -> None:
+        try:
+            async with self.replica() as session:
+                self.lag = await self._measure_lag(session)
+        except REPLICA_ERRORS:
+            logger.warning("Replica lag check failed", exc_info=True)
+            self.mark_down()
+        finally:
+            self._checked_at = time.monotonic()
+            self._probe = None
+
+    async def _available(self) -> bool:
+        now = time.monotonic()
+        if now < self._down_until:
+            self.fallbacks["unavailable"] += 1
+            return False
+        if now - self._checked_at >= self.check_interval:
+            if self._probe is None:
+                self._probe = asyncio.create_task(self._check())
+            if self.lag is None:
+                await asyncio.shield(self._probe)
+        if self.lag is None:
+            self.fallbacks["unavailable"] += 1
+            return False
+        if self.lag > self.max_lag:
+            self.fallbacks["lag"] += 1
+            return False
+        return True
+
+    async def use_replica(self, user_id: Optional[int] = None) -> bool:
+        """
+        Визначає, чи можна прочитати дані з репліки.
+
+        Перевірка відставання виконується у фоні, тож запит чекає на неї лише
+        тоді, коли стан репліки ще невідомий.
+
+        :param user_id: ID користувача, чиї дані читаються.
+        :return: True, якщо читання можна спрямувати на репліку.
+        """
+        if not self.enabled:
+            return False
+        use = await self._available()
+        if use and user_id is not None and await self._wrote_recently(user_id):
+            self.fallbacks["read_your_writes"] += 1
+            use = False
+        if use:
+            self.replica_reads += 1
+        else:
+            self.primary_reads += 1
+        return use
+
+    @asynccontextmanager
+    async def session(self, primary: Optional[AsyncSession] = None) -> AsyncIterator[AsyncSession]:
+        """
+        Відкриває сесію репліки; помилка з'єднання виключає репліку.
+
+        :param primary: Сесія основної бази, на якій повторюється невдале
+            читання; без неї помилка передається викликачу.
+        :yield: Сесія репліки (:class:`FallbackSession`, якщо задано ``primary``).
+        """
+        async with self.replica() as session:
+            try:
+                yield session if primary is None else FallbackSession(session, primary, self.mark_down)
+            except REPLICA_ERRORS:
+                self.mark_down()
+                raise
+
+    @asynccontextmanager
+    async def session_with_fallback(self) -> AsyncIterator[AsyncSession]:
+        """
+        Відкриває сесію репліки з власною сесією основної бази для повтору читань.
+
+        Використовується там, де сесія відкривається поза залежностями
+        маршруту (потоковий експорт).
+
+        :yield: Сесія репліки з повтором на основній базі.
+        """
+        async with AsyncSessionLocal() as primary, self.session(primary) as session:
+            yield session
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Повертає стан репліки і лічильники маршрутизації читань.
+
+        :return: Чи налаштовано репліку, останнє відставання, кількість читань
+            з репліки й основної бази та причини повернення на основну базу.
+        """
+        return {
+            "enabled": self.enabled,
+            "lag_seconds": self.lag,
+            "available": self.enabled and time.monotonic() >= self._down_until,
+            "replica_reads": self.replica_reads,
+            "primary_reads": self.primary_reads,
+            "fallbacks": dict(self.fallbacks),
+        }
+
+
+REPLICA_URL = None if settings.testing else settings.database_replica_url
+
+replica_engine = create_async_engine(REPLICA_URL, **pool_options(REPLICA_URL)) if REPLICA_URL else None
+replica_pool_metrics = PoolMetrics().attach(replica_engine) if replica_engine else None
+if replica_engine is not None:
+    instrument_queries(replica_engine)
+
+ReplicaSessionLocal = (
+    sessionmaker(bind=replica_engine, class_=AsyncSession, expire_on_commit=False) if replica_engine else None
+)
+
+replica_router = ReplicaRouter(
+    ReplicaSessionLocal,
+    settings.replica_max_lag,
+    settings.replica_check_interval,
+    settings.replica_retry_delay,
+)
@@ -0,0 +1,131 @@
+"""
+Модуль керування життєвим циклом схеми бази даних.
+
+Схема змінюється лише версійними міграціями Alembic (каталог ``migrations``).
+Міграції застосовуються один раз — окремою командою ``alembic upgrade head``
+або під час запуску застосунку — і ніколи на шляху обробки запиту.
+Перевірка готовності схеми кешується після першого успішного результату.
+"""
+
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+
+from app.conf.config import settings
+from app.database.db import engine, init_db
+from app.models.models import SEARCH_TABLE
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+ALEMBIC_INI = BASE_DIR / "alembic.ini"
+
+_schema_ready = False
+
+
+def alembic_config() -> Config:
+    """
+    Створює конфігурацію Alembic з абсолютним шляхом до каталогу міграцій.
+
+    :return: Об'єкт Config.
+    """
+    cfg = Config(str(ALEMBIC_INI))
+    cfg.set_main_option("script_location", str(BASE_DIR / "migrations"))
+    return cfg
+
+
+def include_name(name, type_, parent_names) -> bool:
+    """
+    Фільтр автогенерації Alembic: пропускає об'єкти пошукового індексу,
+    що створюються сирим DDL і не описані в метаданих моделей.
+
+    :param name: Назва об'єкта схеми.
+    :param type_: Тип об'єкта (``table``, ``index`` тощо).
+    :param parent_names: Назви батьківських об'єктів.
+    :return: False для службових таблиць і індексів пошуку.
+    """
+    if type_ == "table":
+        return not (name or "").startswith(SEARCH_TABLE)
+    if type_ == "index":
+        return not (name or "").startswith("ix_contacts_search_")
+    return True
+
+
+def run_migrations(connection) -> None:
+    """
+    Застосовує всі міграції до останньої версії (head) на синхронному з'єднанні.
+
+    :param connection: З'єднання SQLAlchemy (через ``AsyncConnection.run_sync``).
+    """
+    cfg = alembic_config()
+    cfg.attributes["connection"] = connection
+    command.upgrade(cfg, "head")
+
+
+def is_at_head(connection) -> bool:
+    """
+    Перевіряє, чи поточна версія схеми збігається з останньою міграцією.
+
+    :param connection: З'єднання SQLAlchemy.
+    :return: True, якщо схема актуальна.
+    """
+    heads = set(ScriptDirectory.from_config(alembic_config()).get_heads())
+    current = set(MigrationContext.configure(connection).get_current_heads())
+    return current == heads
+
+
+async def upgrade_schema() -> None:
+    """
+    Застосовує міграції Alembic до основної бази даних.
+    """
+    global _schema_ready
+    async with engine.begin() as conn:
+        await conn.run_sync(run_migrations)
+    _schema_ready = True
+
+
+async def is_schema_ready() -> bool:
+    """
+    Кешована перевірка готовності схеми.
+
+    Звертається до бази лише доти, доки схема не буде визнана актуальною;
+    після цього повертає результат без жодного запиту.
+
+    :return: True, якщо схема на останній версії.
+    """
+    global _schema_ready
+    if _schema_ready:
+        return True
+    async with engine.connect() as conn:
+        _schema_ready = await conn.run_sync(is_at_head)
+    return _schema_ready
+
+
+async def prepare_schema() -> None:
+    """
+    Готує схему під час запуску застосунку.
+
+    У режимі тестування створює таблиці напряму з моделей (SQLite у пам'яті).
+    Інакше застосовує міграції, якщо увімкнено ``MIGRATE_ON_STARTUP``,
+    і перевіряє, що схема актуальна.
+
+    :raises RuntimeError: Якщо схема відстає від останньої міграції.
+    """
+    global _schema_ready
+    if settings.testing:
+        await init_db()
+        _schema_ready = True
+        return
+    if settings.migrate_on_startup:
+        await upgrade_schema()
+    if not await is_schema_ready():
+        raise RuntimeError("Database schema is out of date, run `alembic upgrade head`")
+
+
+def reset_schema_state() -> None:
+    """
+    Скидає кешований стан готовності схеми (наприклад, після drop_all у тестах).
+    """
+    global _schema_ready
+    _schema_ready = False
@@ -1,12 +1,20 @@
-from fastapi import FastAPI
+from pathlib import Path
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
+from fastapi.staticfiles import StaticFiles
 
-from app.database.db import Base, engine
+from app.conf.config import settings
+from app.database.db import pool_metrics
+from app.database.instrumentation import QueryTrackingMiddleware
+from app.database.schema import prepare_schema
+from app.repository.user_cache import start_invalidation_listener, stop_invalidation_listener
 from app.routes.auth import router as auth_router
 from app.routes.contacts import router as contacts_router
 from app.routes.users import router as users_router
+from app.services.hashing import password_hasher
+from app.services.metrics import MetricsMiddleware, render_prometheus
+from app.services.outbox import start_outbox_worker, stop_outbox_worker
 
 app = FastAPI(
     title="Contact Book API",
@@ -14,29 +22,59 @@ app = FastAPI(
     version="1.0.0",
 )
 
-limiter = Limiter(key_func=lambda request: request.client.host)
-limiter.enabled = False 
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "X-RateLimit-Limit", "X-RateLimit-Remaining", "Retry-After", "X-DB-Query-Count", "X-DB-Query-Time-Ms"],
 )
 
+app.add_middleware(QueryTrackingMiddleware)
+
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """
+        Метрики процесу в текстовому форматі Prometheus.
+        """
+        body = render_prometheus(pool_metrics.snapshot(), password_hasher.stats())
+        return Response(body, media_type="text/plain; version=0.0.4")
+
 app.include_router(auth_router)
 app.include_router(contacts_router)
 app.include_router(users_router)
 
+if settings.avatar_storage == "local":
+    Path(settings.avatar_local_dir).mkdir(parents=True, exist_ok=True)
+    app.mount(settings.avatar_local_url, StaticFiles(directory=settings.avatar_local_dir), name="avatars")
+
 @app.on_event("startup")
 async def on_startup():
     """
     Подія запуску FastAPI застосунку.
 
-    Створює всі таблиці в базі даних, використовуючи SQLAlchemy metadata.
+    Один раз готує схему бази даних (міграції Alembic або create_all у тестах),
+    запускає слухача інвалідації кешу користувачів і, якщо налаштовано,
+    обробник вихідної пошти.
+    """
+    await prepare_schema()
+    start_invalidation_listener()
+    if settings.outbox_worker_in_app:
+        start_outbox_worker()
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    """
+    Подія зупинки FastAPI застосунку.
+
+    Зупиняє слухача інвалідації кешу й обробник вихідної пошти та дочікується
+    завершення операцій у пулі хешування паролів.
     """
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
\ No newline at end of file
+    await stop_invalidation_listener()
+    await stop_outbox_worker()
+    password_hasher.shutdown()
@@ -1,7 +1,9 @@
+from datetime import date, datetime
 from enum import Enum as PyEnum
-from sqlalchemy import Column, Integer, String, Date, Boolean, ForeignKey, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import DDL, Column, Integer, String, Text, Date, DateTime, Boolean, ForeignKey, Enum, Index, event
+from sqlalchemy.orm import relationship, validates
 from app.database.db import Base
+from app.services.birthdays import birthday_key
 
 
 class UserRole(PyEnum):
@@ -30,7 +32,7 @@ class User(Base):
     """
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     email = Column(String, unique=True, index=True, nullable=False)
     hashed_password = Column(String, nullable=False)
     is_verified = Column(Boolean, default=False)
@@ -52,19 +54,131 @@ class Contact(Base):
         - email: Email контакту
         - phone: Номер телефону
         - birthday: Дата народження
+        - birthday_key: Ключ дня народження MMDD для пошуку найближчих днів народження
         - additional_info: Додаткова інформація
         - user_id: Зовнішній ключ до користувача
         - owner: Власник контакту (користувач)
+
+    Усі запити до контактів фільтрують за ``user_id``, тому індекси складені
+    й починаються з ``user_id``; вони відповідають ключам сортування списку
+    (див. :class:`app.schemas.schemas.ContactSort`), курсорній пагінації та
+    пошуку днів народження. Окремих індексів за іменем чи email немає:
+    без ``user_id`` ці стовпці не використовуються. Плани запитів кожного
+    маршруту перевіряються в ``tests/test_query_plans.py``.
+    Email контакту унікальний у межах користувача (``uq_contacts_user_id_email``);
+    цей індекс обслуговує і сортування за email.
     """
     __tablename__ = "contacts"
+    __table_args__ = (
+        Index("ix_contacts_user_id_name", "user_id", "last_name", "first_name", "id"),
+        Index("ix_contacts_user_id_id", "user_id", "id"),
+        Index("ix_contacts_user_id_birthday_key", "user_id", "birthday_key"),
+        Index("uq_contacts_user_id_email", "user_id", "email", unique=True),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    first_name = Column(String, index=True)
-    last_name = Column(String, index=True)
-    email = Column(String, index=True)
+    id = Column(Integer, primary_key=True)
+    first_name = Column(String)
+    last_name = Column(String)
+    email = Column(String)
     phone = Column(String)
     birthday = Column(Date)
+    birthday_key = Column(Integer, nullable=True)
     additional_info = Column(String, nullable=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
 
-    owner = relationship("User", back_populates="contacts")
\ No newline at end of file
+    owner = relationship("User", back_populates="contacts")
+
+    @validates("birthday")
+    def _sync_birthday_key(self, key, value):
+        """
+        Оновлює ``birthday_key`` при кожному присвоєнні дати народження.
+        """
+        self.birthday_key = birthday_key(value) if isinstance(value, date) else None
+        return value
+
+
+
+class OutboxStatus(PyEnum):
+    """
+    Стан листа у черзі вихідної пошти.
+    - PENDING: очікує надсилання
+    - SENDING: взятий обробником (до ``next_attempt_at``)
+    - SENT: надісланий
+    - FAILED: вичерпано спроби надсилання
+    """
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+class EmailOutbox(Base):
+    """
+    Модель листа у черзі вихідної пошти (outbox).
+
+    Атрибути:
+        - id: Унікальний ідентифікатор
+        - recipient: Адреса отримувача
+        - subject: Тема листа
+        - body: Текст листа
+        - status: Стан листа
+        - attempts: Кількість спроб надсилання
+        - next_attempt_at: Час наступної спроби (для SENDING — кінець оренди обробником)
+        - last_error: Текст останньої помилки
+        - created_at: Час постановки в чергу
+        - sent_at: Час успішного надсилання
+    """
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    recipient = Column(String, nullable=False)
+    subject = Column(String, nullable=False)
+    body = Column(Text, nullable=False)
+    status = Column(Enum(OutboxStatus), default=OutboxStatus.PENDING, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    next_attempt_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    last_error = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    sent_at = Column(DateTime, nullable=True)
+
+# Пошуковий індекс контактів.
+# PostgreSQL: GIN-індекси за tsvector і pg_trgm над спільним «документом» контакту.
+# SQLite: зовнішня FTS5-таблиця з токенізатором trigram, синхронізована тригерами.
+SEARCH_DOCUMENT = "coalesce(first_name, '') || ' ' || coalesce(last_name, '') || ' ' || coalesce(email, '')"
+SEARCH_TABLE = "contacts_fts"
+
+POSTGRES_SEARCH_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE EXTENSION IF NOT EXISTS btree_gin",
+    f"CREATE INDEX IF NOT EXISTS ix_contacts_search_fts ON contacts "
+    f"USING gin (user_id, to_tsvector('simple', {SEARCH_DOCUMENT}))",
+    f"CREATE INDEX IF NOT EXISTS ix_contacts_search_trgm ON contacts "
+    f"USING gin (user_id, ({SEARCH_DOCUMENT}) gin_trgm_ops)",
+]
+
+SQLITE_SEARCH_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+    f"first_name, last_name, email, content='contacts', content_rowid='id', tokenize='trigram')",
+    f"CREATE TRIGGER IF NOT EXISTS contacts_fts_ai AFTER INSERT ON contacts BEGIN "
+    f"INSERT INTO {SEARCH_TABLE}(rowid, first_name, last_name, email) "
+    f"VALUES (new.id, new.first_name, new.last_name, new.email); END",
+    f"CREATE TRIGGER IF NOT EXISTS contacts_fts_ad AFTER DELETE ON contacts BEGIN "
+    f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, first_name, last_name, email) "
+    f"VALUES ('delete', old.id, old.first_name, old.last_name, old.email); END",
+    f"CREATE TRIGGER IF NOT EXISTS contacts_fts_au AFTER UPDATE ON contacts BEGIN "
+    f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, first_name, last_name, email) "
+    f"VALUES ('delete', old.id, old.first_name, old.last_name, old.email); "
+    f"INSERT INTO {SEARCH_TABLE}(rowid, first_name, last_name, email) "
+    f"VALUES (new.id, new.first_name, new.last_name, new.email); END",
+]
+
+for _statement in POSTGRES_SEARCH_DDL:
+    event.listen(Contact.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+for _statement in SQLITE_SEARCH_DDL:
+    event.listen(Contact.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(
+    Contact.__table__, "before_drop", DDL(f"DROP TABLE IF EXISTS {SEARCH_TABLE}").execute_if(dialect="sqlite")
+)
@@ -0,0 +1,195 @@
+"""
+Кеш знімків користувачів у Redis.
+
+Кешем володіє репозиторій: кожна мутація користувача записує свіжий знімок
+(write-through), а зміна email видаляє запис за старим ключем. Читачі після
+промаху заповнюють кеш лише командою ``SET NX``, тому знімок, прочитаний з бази
+до паралельного оновлення, не може перезаписати вже записаний свіжий.
+
+Перед Redis стоїть невеликий кеш у пам'яті кожного процесу (L1). Після мутації
+процес оновлює свій L1 і публікує змінені email у канал Redis, а решта процесів
+видаляють ці записи зі своїх L1. Короткий TTL записів L1 обмежує застарілість,
+якщо повідомлення було втрачено.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Optional
+from uuid import uuid4
+
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.conf.config import settings
+from app.models.models import User, UserRole
+from app.services.cache import redis
+from app.services.lru import TTLCache
+
+logger = logging.getLogger(__name__)
+
+USER_CACHE_PREFIX = "user:"
+USER_CACHE_CHANNEL = "user-cache:invalidate"
+WORKER_ID = uuid4().hex
+RECONNECT_DELAY = 1.0
+
+local_users = TTLCache(settings.user_l1_cache_size, settings.user_l1_cache_ttl)
+_listener: Optional[asyncio.Task] = None
+
+
+def user_cache_key(email: str) -> str:
+    """
+    Повертає ключ Redis для знімка користувача.
+
+    :param email: Email користувача.
+    :return: Ключ кешу.
+    """
+    return f"{USER_CACHE_PREFIX}{email}"
+
+
+def _snapshot(user: User) -> dict:
+    return {
+        "id": user.id,
+        "email": user.email,
+        "is_verified": user.is_verified,
+        "avatar_url": user.avatar_url,
+        "role": user.role.value,
+    }
+
+
+def _build(data: dict) -> User:
+    user = User(**{**data, "role": UserRole(data["role"])})
+    make_transient_to_detached(user)
+    return user
+
+
+async def get_cached_user(email: str) -> Optional[User]:
+    """
+    Повертає користувача з кешу (спершу з L1, потім з Redis).
+
+    Об'єкт повертається у стані detached, тож його можна приєднати до сесії
+    і змінювати без додаткового запиту до бази.
+
+    :param email: Email користувача.
+    :return: Об'єкт користувача або None, якщо запису немає.
+    """
+    data = local_users.get(email)
+    if data is None:
+        raw = await redis.get(user_cache_key(email))
+        if not raw:
+            return None
+        data = json.loads(raw)
+        local_users.set(email, data)
+    return _build(data)
+
+
+def user_prefetch_key(email: str) -> Optional[str]:
+    """
+    Повертає ключ Redis, який варто прочитати наперед разом з іншими командами.
+
+    Використовується, щоб об'єднати читання знімка з іншою командою Redis
+    (наприклад, перевіркою ліміту запитів) в один конвеєр.
+
+    :param email: Email користувача.
+    :return: Ключ кешу або None, якщо свіжий запис уже є в L1.
+    """
+    return None if email in local_users else user_cache_key(email)
+
+
+def prime_local_user(email: str, raw: Optional[str]) -> None:
+    """
+    Зберігає в L1 знімок, прочитаний наперед з Redis.
+
+    :param email: Email користувача.
+    :param raw: Значення ключа Redis (None, якщо запису немає).
+    """
+    if raw:
+        local_users.set(email, json.loads(raw))
+
+
+async def fill_user_cache(user: User) -> None:
+    """
+    Заповнює кеш після промаху, не перезаписуючи наявний запис.
+
+    :param user: Користувач, прочитаний з бази даних.
+    """
+    data = _snapshot(user)
+    if await redis.set(user_cache_key(user.email), json.dumps(data), ex=settings.user_cache_ttl, nx=True):
+        local_users.set(user.email, data)
+
+
+async def write_user_cache(user: User, old_email: Optional[str] = None) -> None:
+    """
+    Записує свіжий знімок користувача після його зміни і сповіщає інші процеси.
+
+    :param user: Оновлений користувач.
+    :param old_email: Попередній email, якщо він змінився.
+    """
+    data = _snapshot(user)
+    emails = [user.email]
+    if old_email and old_email != user.email:
+        await redis.delete(user_cache_key(old_email))
+        local_users.delete(old_email)
+        emails.append(old_email)
+    await redis.set(user_cache_key(user.email), json.dumps(data), ex=settings.user_cache_ttl)
+    local_users.set(user.email, data)
+    await redis.publish(USER_CACHE_CHANNEL, json.dumps({"origin": WORKER_ID, "emails": emails}))
+
+
+def apply_invalidation(message: str) -> None:
+    """
+    Видаляє з L1 записи, змінені іншим процесом.
+
+    :param message: Повідомлення з каналу інвалідації.
+    """
+    payload = json.loads(message)
+    if payload["origin"] == WORKER_ID:
+        return
+    for email in payload["emails"]:
+        local_users.delete(email)
+
+
+async def listen_for_invalidations() -> None:
+    """
+    Слухає канал інвалідації, перепідписуючись після розриву з'єднання.
+
+    Після кожної (пере)підписки L1 очищується, бо повідомлення, надіслані
+    під час розриву, могли бути втрачені.
+    """
+    while True:
+        pubsub = redis.pubsub()
+        try:
+            await pubsub.subscribe(USER_CACHE_CHANNEL)
+            local_users.clear()
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    apply_invalidation(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("User cache invalidation listener failed, reconnecting", exc_info=True)
+            await asyncio.sleep(RECONNECT_DELAY)
+        finally:
+            await pubsub.close()
+
+
+def start_invalidation_listener() -> None:
+    """
+    Запускає фонову задачу слухача інвалідації.
+    """
+    global _listener
+    if _listener is None or _listener.done():
+        _listener = asyncio.create_task(listen_for_invalidations())
+
+
+async def stop_invalidation_listener() -> None:
+    """
+    Зупиняє фонову задачу слухача інвалідації.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.cancel()
+        try:
+            await _listener
+        except asyncio.CancelledError:
+            pass
+        _listener = None
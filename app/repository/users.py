@@ -5,8 +5,23 @@ from fastapi import HTTPException, status
 from typing import Optional
 
 from app.models.models import User
+from app.repository.user_cache import write_user_cache
 from app.schemas.schemas import UserCreate, UserUpdate
 
+
+async def _attach(user: User, db: AsyncSession) -> User:
+    """
+    Приєднує до сесії користувача, отриманого з кешу (стан detached),
+    без додаткового запиту до бази даних.
+
+    :param user: Об'єкт користувача.
+    :param db: Сесія бази даних.
+    :return: Екземпляр користувача, що належить сесії.
+    """
+    if user in db:
+        return user
+    return await db.merge(user, load=False)
+
 async def get_user_by_email(email: str, db: AsyncSession) -> Optional[User]:
     """
     Отримати користувача за email.
@@ -18,19 +33,24 @@ async def get_user_by_email(email: str, db: AsyncSession) -> Optional[User]:
     res = await db.execute(select(User).where(User.email == email))
     return res.scalar_one_or_none()
 
-async def create_user(body: UserCreate, hashed_password: str, db: AsyncSession) -> User:
+async def create_user(body: UserCreate, hashed_password: str, db: AsyncSession, commit: bool = True) -> User:
     """
     Створити нового користувача.
 
     :param body: Дані нового користувача (email, password).
     :param hashed_password: Хеш пароля.
     :param db: Сесія бази даних.
+    :param commit: Чи фіксувати транзакцію; False — користувач лише
+        записується в поточну транзакцію (``flush``), і її фіксує викликач.
     :return: Створений об'єкт User.
     :raises HTTPException: Якщо email вже існує.
     """
     u = User(email=body.email, hashed_password=hashed_password)
     db.add(u)
     try:
+        if not commit:
+            await db.flush()
+            return u
         await db.commit()
     except IntegrityError:
         await db.rollback()
@@ -49,6 +69,7 @@ async def update_token(user: User, token: Optional[str], db: AsyncSession) -> No
     :param token: Новий refresh токен.
     :param db: Сесія бази даних.
     """
+    user = await _attach(user, db)
     user.refresh_token = token
     await db.commit()
 
@@ -60,9 +81,11 @@ async def confirm_user(user: User, db: AsyncSession) -> User:
     :param db: Сесія бази даних.
     :return: Оновлений об'єкт User.
     """
+    user = await _attach(user, db)
     user.is_verified = True
     await db.commit()
     await db.refresh(user)
+    await write_user_cache(user)
     return user
 
 async def update_avatar(user: User, url: str, db: AsyncSession) -> User:
@@ -74,9 +97,11 @@ async def update_avatar(user: User, url: str, db: AsyncSession) -> User:
     :param db: Сесія бази даних.
     :return: Оновлений об'єкт User.
     """
+    user = await _attach(user, db)
     user.avatar_url = url
     await db.commit()
     await db.refresh(user)
+    await write_user_cache(user)
     return user
 
 async def update_user_data(user: User, body: UserUpdate, db: AsyncSession) -> User:
@@ -88,8 +113,27 @@ async def update_user_data(user: User, body: UserUpdate, db: AsyncSession) -> Us
     :param db: Сесія бази даних.
     :return: Оновлений об'єкт User.
     """
+    user = await _attach(user, db)
+    old_email = user.email
     for field, value in body.dict(exclude_unset=True).items():
         setattr(user, field, value)
     await db.commit()
     await db.refresh(user)
+    await write_user_cache(user, old_email=old_email)
+    return user
+
+
+async def update_password(user: User, hashed_password: str, db: AsyncSession) -> User:
+    """
+    Оновити пароль користувача.
+
+    :param user: Об'єкт користувача.
+    :param hashed_password: Хеш нового пароля.
+    :param db: Сесія бази даних.
+    :return: Оновлений об'єкт User.
+    """
+    user = await _attach(user, db)
+    user.hashed_password = hashed_password
+    await db.commit()
+    await write_user_cache(user)
     return user
\ No newline at end of file
@@ -1,30 +1,30 @@
 from fastapi import (
-    APIRouter, Body, Depends, HTTPException, status,
-    BackgroundTasks, Request
+    APIRouter, Body, Depends, HTTPException, status
 )
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
 from app.conf.config import settings
 from app.database.db import get_db
 from app.schemas.schemas import UserCreate, UserResponse, TokenModel
 from app.repository.users import (
     get_user_by_email, create_user,
-    update_token, confirm_user
+    update_token, confirm_user, update_password
 )
+from app.repository.user_cache import write_user_cache
 from app.services.auth import auth_service
-from app.services.email import send_verification_email, send_reset_email
+from app.services.rate_limit import rate_limit
+from app.services.email import enqueue_verification_email, enqueue_reset_email
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
-limiter = Limiter(key_func=get_remote_address)
 
-@router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-@limiter.limit("5/minute")
+@router.post(
+    "/register",
+    response_model=UserResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(rate_limit(settings.rate_limit_register, per_user=False))],
+)
 async def register(
-    request: Request,
-    background_tasks: BackgroundTasks,
     payload: UserCreate = Body(...),
     db: AsyncSession = Depends(get_db),
 ):
@@ -32,27 +32,32 @@ async def register(
     Реєстрація нового користувача.
 
     Перевіряє, чи існує користувач з вказаним email.
-    Якщо ні — створює користувача, хешує пароль та надсилає лист із підтвердженням.
+    Якщо ні — створює користувача, хешує пароль та ставить у чергу лист із підтвердженням.
+    Користувач і лист зберігаються в одній транзакції.
     У режимі тестування користувач автоматично верифікується.
     """
     existing = await get_user_by_email(payload.email, db)
     if existing:
         raise HTTPException(status.HTTP_409_CONFLICT, "Email already exists")
 
-    hashed = auth_service.hash_password(payload.password)
-    user = await create_user(payload, hashed, db)
+    hashed = await auth_service.hash_password(payload.password)
+    user = await create_user(payload, hashed, db, commit=False)
 
     token = auth_service.create_access_token({"sub": user.email})
 
     if settings.testing:
         user.is_verified = True
-        await db.commit()
     else:
-        background_tasks.add_task(send_verification_email, user.email, token)
+        await enqueue_verification_email(user.email, token, db, commit=False)
+    await db.commit()
 
     return user
 
-@router.post("/login", response_model=TokenModel)
+@router.post(
+    "/login",
+    response_model=TokenModel,
+    dependencies=[Depends(rate_limit(settings.rate_limit_login, per_user=False))],
+)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: AsyncSession = Depends(get_db),
@@ -65,7 +70,7 @@ async def login(
     """
     user = await get_user_by_email(form_data.username, db)
 
-    if not user or not auth_service.verify_password(form_data.password, user.hashed_password):
+    if not user or not await auth_service.verify_password(form_data.password, user.hashed_password):
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Invalid credentials")
 
     if not user.is_verified:
@@ -75,6 +80,7 @@ async def login(
     refresh = auth_service.create_refresh_token({"sub": user.email})
 
     await update_token(user, refresh, db)
+    await write_user_cache(user)
 
     return {"access_token": access, "refresh_token": refresh, "token_type": "bearer"}
 
@@ -101,20 +107,19 @@ async def verify_email(
 
 @router.post("/reset-password-request", status_code=status.HTTP_200_OK)
 async def reset_request(
-    background_tasks: BackgroundTasks,
     email: str = Body(...),
     db: AsyncSession = Depends(get_db),
 ):
     """
     Запит на скидання пароля.
 
-    Якщо email знайдено, надсилається лист із інструкціями щодо скидання пароля.
+    Якщо email знайдено, у чергу ставиться лист із інструкціями щодо скидання пароля.
     """
     user = await get_user_by_email(email, db)
 
     if user:
         token = auth_service.create_access_token({"sub": user.email})
-        background_tasks.add_task(send_reset_email, user.email, token)
+        await enqueue_reset_email(user.email, token, db)
 
     return {"msg": "If that email exists, instructions have been sent."}
 
@@ -136,7 +141,6 @@ async def reset_password(
     if not user:
         raise HTTPException(status.HTTP_400_BAD_REQUEST, "Invalid token")
 
-    user.hashed_password = auth_service.hash_password(new_password)
-    await db.commit()
+    await update_password(user, await auth_service.hash_password(new_password), db)
 
     return {"msg": "Password has been reset"}
\ No newline at end of file
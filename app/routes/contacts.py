@@ -1,16 +1,77 @@
-from datetime import datetime, timedelta
-from typing import List, Optional
+from datetime import date
+from typing import Any, List, Optional, Sequence, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Row, case, delete, func, or_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.future import select
 
-from app.database.db import get_db
+from app.conf.config import settings
+from app.database.db import AsyncSessionLocal, get_db, insert_or_skip
+from app.database.replica import replica_router
 from app.models.models import Contact
-from app.schemas.schemas import ContactCreate, ContactResponse, ContactUpdate
-from app.services.auth import auth_service
+from app.schemas.schemas import (
+    ContactBase, ContactBatchItem, ContactBatchResult, ContactBatchSelector, ContactBatchUpdate, ContactCreate,
+    ContactImportResult, ContactResponse, ContactSort, ContactUpdate, ExportFormat, ImportFormat
+)
+from app.services import exporter, importer
+from app.services.auth import auth_service, get_read_db
+from app.services.rate_limit import rate_limit
+from app.services.birthdays import birthday_key, upcoming_birthday_ranges
+from app.services.cache import bump_contacts_version, get_contacts_version
+from app.services.conditional import matches_any, not_modified
+from app.services.fieldsets import CONTACT_FIELDS, Fields, contact_adapter, contact_columns, contact_fields
+from app.services.pagination import decode_cursor, encode_cursor, keyset_condition, nulls_largest
+from app.services.response_cache import CachedResponse, response_cache
+from app.services.search import MIN_QUERY_LENGTH, build_search_query
+from app.services.serialization import dump_rows
 
-router = APIRouter(prefix="/contacts", tags=["Contacts"])
+router = APIRouter(
+    prefix="/contacts",
+    tags=["Contacts"],
+    dependencies=[Depends(rate_limit(settings.rate_limit_default))],
+)
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+EMAIL_IN_USE = "Email already in use"
+
+CONTACT = TypeAdapter(ContactResponse)
+
+SORT_COLUMNS = {
+    "name": (Contact.last_name, Contact.first_name, Contact.id),
+    "email": (Contact.email, Contact.id),
+    "id": (Contact.id,),
+}
+
+
+def _contact_values(payload: ContactBase, exclude_unset: bool = False) -> dict:
+    """
+    Повертає значення стовпців контакту разом з ``birthday_key``.
+
+    Запити INSERT і UPDATE оминають валідатор моделі, тож ключ дня
+    народження обчислюється тут.
+
+    :param payload: Дані контакту.
+    :param exclude_unset: Пропустити поля, яких немає в запиті.
+    :return: Словник значень стовпців.
+    """
+    values = payload.dict(exclude_unset=exclude_unset)
+    if "birthday" in values:
+        values["birthday_key"] = birthday_key(values["birthday"])
+    return values
+
+
+async def _contacts_changed(user_id: int) -> None:
+    """
+    Оновлює версію контактів користувача і позначає запис для read-your-writes.
+
+    :param user_id: ID власника контактів.
+    """
+    await bump_contacts_version(user_id)
+    await replica_router.record_write(user_id)
 
 
 @router.post("/", response_model=ContactResponse, status_code=status.HTTP_201_CREATED)
@@ -20,57 +81,430 @@ async def create_contact(
     current_user=Depends(auth_service.get_current_user),
 ):
     """
-    Створити новий контакт.
+    Створити новий контакт одним запитом ``INSERT ... RETURNING``.
+
+    Email контакту унікальний у межах користувача; дублікат пропускається
+    базою (``ON CONFLICT DO NOTHING``) і повертається помилка 400.
 
     :param payload: Дані нового контакту.
     :param db: Сесія бази даних.
     :param current_user: Поточний авторизований користувач.
-    :return: Створений контакт.
+    :return: Створений контакт або помилка 400, якщо email уже використовується.
     """
-    new_contact = Contact(**payload.dict(), user_id=current_user.id)
-    db.add(new_contact)
+    result = await db.execute(
+        insert_or_skip(Contact, db, Contact.user_id, Contact.email)
+        .values(**_contact_values(payload), user_id=current_user.id)
+        .returning(Contact)
+    )
+    contact = result.scalar_one_or_none()
     await db.commit()
-    await db.refresh(new_contact)
-    return new_contact
+    if contact is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=EMAIL_IN_USE)
+    await _contacts_changed(current_user.id)
+    return contact
+
+
+@router.post(
+    "/import",
+    response_model=ContactImportResult,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "text/csv": {"schema": {"type": "string"}},
+                "application/x-ndjson": {"schema": {"type": "string"}},
+            },
+        },
+    },
+)
+async def import_contacts(
+    request: Request,
+    format: Optional[ImportFormat] = Query(None, description="Формат тіла; за замовчуванням визначається з Content-Type"),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(auth_service.get_current_user),
+) -> ContactImportResult:
+    """
+    Масово імпортувати контакти з CSV (з рядком заголовка) або JSON Lines.
+
+    Тіло запиту читається потоково, рядки перевіряються схемою контакту
+    й вставляються пакетами. Помилкові рядки не зупиняють імпорт,
+    а повертаються у звіті.
+
+    :param request: Запит, тіло якого читається потоково.
+    :param format: Формат даних.
+    :param db: Сесія бази даних.
+    :param current_user: Поточний авторизований користувач.
+    :return: Кількість вставлених і відхилених рядків та перші помилки.
+    """
+    fmt = format or importer.format_from_content_type(request.headers.get("content-type"))
+    if fmt is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Use text/csv or application/x-ndjson",
+        )
+    try:
+        return await importer.import_contacts(request.stream(), fmt, current_user.id, db)
+    finally:
+        await _contacts_changed(current_user.id)
 
 
 @router.get("/", response_model=List[ContactResponse])
 async def read_contacts(
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000, description="Кількість контактів на сторінці"),
+    after: Optional[str] = Query(None, description="Курсор з заголовка X-Next-Cursor попередньої сторінки"),
+    sort: ContactSort = Query(ContactSort.NAME, description="Ключ сортування; префікс '-' — спадний порядок"),
+    fields: Optional[Fields] = Depends(contact_fields),
+    db: AsyncSession = Depends(get_read_db),
     current_user=Depends(auth_service.get_current_user),
 ) -> List[ContactResponse]:
     """
-    Отримати всі контакти поточного користувача.
+    Отримати сторінку контактів поточного користувача.
 
-    :param db: Сесія бази даних.
+    Параметр ``fields`` обмежує поля кожного контакту (і стовпці SQL запиту).
+
+    Використовує курсорну (keyset) пагінацію: якщо є наступна сторінка,
+    її курсор повертається в заголовку ``X-Next-Cursor``. Відповідь має ETag;
+    якщо він збігається з ``If-None-Match``, повертається 304 без запиту до бази.
+    Якщо увімкнено ``RESPONSE_CACHE_ENABLED``, серіалізована сторінка кешується в Redis.
+    Сторінка читається Core-запитом і серіалізується без ORM об'єктів
+    (:mod:`app.services.serialization`).
+
+    :param request: Запит із можливим заголовком ``If-None-Match``.
+    :param response: Відповідь, у яку додаються курсор наступної сторінки та ETag.
+    :param limit: Розмір сторінки.
+    :param after: Курсор попередньої сторінки.
+    :param sort: Ключ сортування.
+    :param fields: Поля відповіді (None — усі).
+    :param db: Сесія бази даних для читання (репліка або основна база).
     :param current_user: Поточний авторизований користувач.
     :return: Список контактів.
     """
-    result = await db.execute(select(Contact).where(Contact.user_id == current_user.id))
+    version = await get_contacts_version(current_user.id)
+    unchanged = not_modified(request, response, version)
+    if unchanged is not None:
+        return unchanged
+
+    async def render() -> CachedResponse:
+        rows, cursor = await _contacts_page(db, current_user.id, limit, after, sort, fields or CONTACT_FIELDS)
+        return CachedResponse(dump_rows(rows, fields or CONTACT_FIELDS), {NEXT_CURSOR_HEADER: cursor} if cursor else {})
+
+    if response_cache.enabled and version is not None:
+        key = response_cache.key(current_user.id, version, request)
+        cached = await response_cache.fetch(key, settings.response_cache_list_ttl, render)
+        return cached.to_response(response)
+    return (await render()).to_response(response)
+
+
+async def _contacts_page(
+    db: AsyncSession,
+    user_id: int,
+    limit: int,
+    after: Optional[str],
+    sort: ContactSort,
+    fields: Fields = CONTACT_FIELDS,
+) -> Tuple[Sequence[Row], Optional[str]]:
+    descending = sort.value.startswith("-")
+    columns = SORT_COLUMNS[sort.value.lstrip("-")]
+    stmt = select(*contact_columns(fields, [c.key for c in columns])).where(Contact.user_id == user_id)
+    if after:
+        nulls_last = nulls_largest(db.bind.dialect.name)
+        stmt = stmt.where(keyset_condition(columns, decode_cursor(after, sort.value), descending, nulls_last))
+    stmt = stmt.order_by(*(c.desc() if descending else c.asc() for c in columns)).limit(limit + 1)
+
+    result = await db.execute(stmt)
+    rows = result.all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(sort.value, [getattr(last, c.key) for c in columns])
+
+
+def _dump(adapter: TypeAdapter, value: Any) -> bytes:
+    return adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+
+
+@router.get("/search", response_model=List[ContactResponse])
+async def search_contacts(
+    response: Response,
+    q: str = Query(..., min_length=MIN_QUERY_LENGTH, max_length=100, description="Ім'я, прізвище або email (повністю, частково або з помилкою)"),
+    limit: int = Query(20, ge=1, le=100, description="Кількість результатів на сторінці"),
+    after: Optional[str] = Query(None, description="Курсор з заголовка X-Next-Cursor попередньої сторінки"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user=Depends(auth_service.get_current_user),
+) -> List[ContactResponse]:
+    """
+    Пошук контактів поточного користувача за ім'ям, прізвищем або email.
+
+    Запит коротший за ``MIN_QUERY_LENGTH`` символів (без крайових пробілів)
+    відхиляється з 422: його не обслуговує жоден пошуковий індекс.
+
+    Спершу шукає точні збіги (цілі слова або підрядки); якщо їх немає —
+    виконує нечіткий пошук, стійкий до помилок у написанні. Результати
+    впорядковані за релевантністю, курсор наступної сторінки повертається
+    в заголовку ``X-Next-Cursor``. На відміну від списку контактів, курсор
+    пошуку містить зсув (OFFSET) і етап пошуку (див. :mod:`app.services.search`).
+
+    :param response: Відповідь, у яку додається курсор наступної сторінки.
+    :param q: Пошуковий рядок.
+    :param limit: Розмір сторінки.
+    :param after: Курсор попередньої сторінки.
+    :param db: Сесія бази даних для читання (репліка або основна база).
+    :param current_user: Поточний авторизований користувач.
+    :return: Список знайдених контактів.
+    """
+    if len(q.strip()) < MIN_QUERY_LENGTH:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Search query must contain at least {MIN_QUERY_LENGTH} characters",
+        )
+    offset, fuzzy = 0, False
+    if after:
+        values = decode_cursor(after, "search")
+        if len(values) != 2 or not isinstance(values[0], int) or values[0] < 0 or not isinstance(values[1], bool):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        offset, fuzzy = values
+
+    dialect = db.get_bind().dialect.name
+    result = await db.execute(build_search_query(dialect, current_user.id, q, fuzzy).offset(offset).limit(limit + 1))
+    contacts = result.scalars().all()
+    if not contacts and not after:
+        fuzzy = True
+        result = await db.execute(build_search_query(dialect, current_user.id, q, fuzzy).limit(limit + 1))
+        contacts = result.scalars().all()
+
+    if len(contacts) > limit:
+        contacts = contacts[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor("search", [offset + limit, fuzzy])
+    return contacts
+
+
+@router.get("/birthdays", response_model=List[ContactResponse])
+async def upcoming_birthdays(
+    days: int = Query(7, ge=0, le=366, description="Кількість днів наперед"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user=Depends(auth_service.get_current_user),
+) -> List[ContactResponse]:
+    """
+    Отримати контакти, у яких день народження протягом найближчих днів.
+
+    Вибірка виконується за індексом ``(user_id, birthday_key)`` одним або двома
+    діапазонами ключів (якщо вікно переходить через Новий рік). Результати
+    впорядковані за датою наступного дня народження.
+
+    :param days: Розмір вікна в днях, включно з сьогоднішнім днем.
+    :param db: Сесія бази даних для читання (репліка або основна база).
+    :param current_user: Поточний авторизований користувач.
+    :return: Список контактів.
+    """
+    ranges = upcoming_birthday_ranges(date.today(), days)
+    start_key = ranges[0][0]
+    result = await db.execute(
+        select(Contact)
+        .where(
+            Contact.user_id == current_user.id,
+            or_(*(Contact.birthday_key.between(low, high) for low, high in ranges)),
+        )
+        .order_by(case((Contact.birthday_key >= start_key, 0), else_=1), Contact.birthday_key, Contact.id)
+    )
     return result.scalars().all()
 
 
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={status.HTTP_200_OK: {"content": {media_type: {} for media_type in exporter.MEDIA_TYPES.values()}}},
+)
+async def export_contacts(
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="Формат експорту"),
+    gzip: bool = Query(False, description="Стискати відповідь gzip (Content-Encoding: gzip)"),
+    fields: Optional[Fields] = Depends(contact_fields),
+    current_user=Depends(auth_service.get_current_user),
+) -> StreamingResponse:
+    """
+    Експортувати всі контакти поточного користувача у NDJSON, CSV або vCard.
+
+    Контакти читаються серверним курсором (з репліки, якщо вона доступна)
+    і передаються клієнту частинами, не накопичуючись у пам'яті.
+
+    :param format: Формат експорту.
+    :param gzip: Чи стискати відповідь.
+    :param fields: Поля NDJSON чи стовпці CSV (None — стандартний набір); для vCard не підтримується.
+    :param current_user: Поточний авторизований користувач.
+    :return: Потокова відповідь з файлом контактів.
+    """
+    if fields and format == ExportFormat.VCF:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="fields is not supported for vcf")
+    headers = {"Content-Disposition": f'attachment; filename="contacts.{format.value}"'}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    use_replica = await replica_router.use_replica(current_user.id)
+    open_session = replica_router.session_with_fallback if use_replica else AsyncSessionLocal
+    return StreamingResponse(
+        exporter.export_contacts(current_user.id, format, gzip, open_session, fields),
+        media_type=exporter.MEDIA_TYPES[format],
+        headers=headers,
+    )
+
+
+def _batch_conditions(user_id: int, selector: ContactBatchSelector) -> list:
+    """
+    Будує умови вибору контактів для пакетної операції.
+
+    Умова власника входить до того ж запиту, тож чужі контакти не змінюються
+    і повертаються як ``not_found``.
+
+    :param user_id: ID поточного користувача.
+    :param selector: Список ID або фільтр.
+    :return: Список умов для WHERE.
+    """
+    conditions = [Contact.user_id == user_id]
+    if selector.ids is not None:
+        conditions.append(Contact.id.in_(selector.ids))
+        return conditions
+    fields = selector.filter.model_fields_set
+    if "first_name" in fields:
+        conditions.append(Contact.first_name == selector.filter.first_name)
+    if "last_name" in fields:
+        conditions.append(Contact.last_name == selector.filter.last_name)
+    if "email_domain" in fields:
+        domain = "@" + selector.filter.email_domain.lower()
+        conditions.append(func.lower(Contact.email).endswith(domain, autoescape=True))
+    return conditions
+
+
+def _batch_result(selector: ContactBatchSelector, affected_ids: List[int], status_: str) -> ContactBatchResult:
+    """
+    Формує підсумок пакетної операції.
+
+    :param selector: Список ID або фільтр із запиту.
+    :param affected_ids: ID змінених або видалених контактів.
+    :param status_: Статус для змінених контактів.
+    :return: Підсумок з результатом для кожного контакту.
+    """
+    affected = set(affected_ids)
+    requested = list(dict.fromkeys(selector.ids)) if selector.ids is not None else sorted(affected)
+    items = [ContactBatchItem(id=i, status=status_ if i in affected else "not_found") for i in requested]
+    return ContactBatchResult(
+        affected=len(affected),
+        not_found=len(requested) - len(affected),
+        items=items,
+    )
+
+
+@router.patch("/batch", response_model=ContactBatchResult)
+async def batch_update_contacts(
+    payload: ContactBatchUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(auth_service.get_current_user),
+) -> ContactBatchResult:
+    """
+    Оновити багато контактів одним запитом UPDATE.
+
+    :param payload: Список ID або фільтр та нові значення полів.
+    :param db: Сесія бази даних.
+    :param current_user: Поточний авторизований користувач.
+    :return: Підсумок з результатом для кожного контакту.
+    """
+    values = payload.changes.dict(exclude_unset=True)
+    if "birthday" in values:
+        values["birthday_key"] = birthday_key(values["birthday"])
+    result = await db.execute(
+        update(Contact)
+        .where(*_batch_conditions(current_user.id, payload))
+        .values(**values)
+        .returning(Contact.id)
+        .execution_options(synchronize_session=False)
+    )
+    ids = result.scalars().all()
+    await db.commit()
+    if ids:
+        await _contacts_changed(current_user.id)
+    return _batch_result(payload, ids, "updated")
+
+
+@router.delete("/batch", response_model=ContactBatchResult)
+async def batch_delete_contacts(
+    payload: ContactBatchSelector,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(auth_service.get_current_user),
+) -> ContactBatchResult:
+    """
+    Видалити багато контактів одним запитом DELETE.
+
+    :param payload: Список ID або фільтр.
+    :param db: Сесія бази даних.
+    :param current_user: Поточний авторизований користувач.
+    :return: Підсумок з результатом для кожного контакту.
+    """
+    result = await db.execute(
+        delete(Contact)
+        .where(*_batch_conditions(current_user.id, payload))
+        .returning(Contact.id)
+        .execution_options(synchronize_session=False)
+    )
+    ids = result.scalars().all()
+    await db.commit()
+    if ids:
+        await _contacts_changed(current_user.id)
+    return _batch_result(payload, ids, "deleted")
+
+
 @router.get("/{contact_id}", response_model=ContactResponse)
 async def read_contact(
     contact_id: int,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    fields: Optional[Fields] = Depends(contact_fields),
+    db: AsyncSession = Depends(get_read_db),
     current_user=Depends(auth_service.get_current_user),
 ) -> ContactResponse:
     """
     Отримати один контакт за ID.
 
+    Відповідь має ETag; якщо він збігається з ``If-None-Match``,
+    повертається 304 без запиту до бази. ``If-None-Match: *`` дає 304 лише
+    для наявного контакту: спершу перевіряється, що він існує. Якщо увімкнено
+    ``RESPONSE_CACHE_ENABLED``, серіалізований контакт кешується в Redis.
+    Параметр ``fields`` обмежує поля відповіді (і стовпці SQL запиту).
+
     :param contact_id: Ідентифікатор контакту.
-    :param db: Сесія бази даних.
+    :param request: Запит із можливим заголовком ``If-None-Match``.
+    :param response: Відповідь, до якої додається ETag.
+    :param fields: Поля відповіді (None — усі).
+    :param db: Сесія бази даних для читання (репліка або основна база).
     :param current_user: Поточний авторизований користувач.
     :return: Контакт або помилка 404.
     """
-    result = await db.execute(
-        select(Contact).where(Contact.id == contact_id, Contact.user_id == current_user.id)
-    )
-    contact = result.scalar_one_or_none()
-    if not contact:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found")
-    return contact
+    owned = (Contact.id == contact_id, Contact.user_id == current_user.id)
+    version = await get_contacts_version(current_user.id)
+    if version is not None and matches_any(request.headers.get("if-none-match")):
+        if await db.scalar(select(Contact.id).where(*owned)) is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found")
+    unchanged = not_modified(request, response, version)
+    if unchanged is not None:
+        return unchanged
+
+    async def load() -> Any:
+        stmt = select(*contact_columns(fields)) if fields else select(Contact)
+        result = await db.execute(stmt.where(*owned))
+        contact = result.one_or_none() if fields else result.scalar_one_or_none()
+        if not contact:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found")
+        return contact
+
+    async def render() -> CachedResponse:
+        return CachedResponse(_dump(contact_adapter(fields) if fields else CONTACT, await load()), {})
+
+    if response_cache.enabled and version is not None:
+        key = response_cache.key(current_user.id, version, request)
+        cached = await response_cache.fetch(key, settings.response_cache_detail_ttl, render)
+        return cached.to_response(response)
+    if fields:
+        return (await render()).to_response(response)
+    return await load()
 
 
 @router.patch("/{contact_id}", response_model=ContactResponse)
@@ -81,7 +515,10 @@ async def update_contact(
     current_user=Depends(auth_service.get_current_user),
 ) -> ContactResponse:
     """
-    Оновити контакт.
+    Оновити контакт одним запитом ``UPDATE ... RETURNING``.
+
+    Повторення email іншого контакту користувача відхиляє унікальний індекс
+    бази даних, тож між перевіркою і записом немає гонки.
 
     :param contact_id: Ідентифікатор контакту.
     :param payload: Дані для оновлення.
@@ -89,26 +526,22 @@ async def update_contact(
     :param current_user: Поточний авторизований користувач.
     :return: Оновлений контакт або помилка.
     """
-    result = await db.execute(
-        select(Contact).where(Contact.id == contact_id, Contact.user_id == current_user.id)
-    )
-    contact = result.scalar_one_or_none()
+    try:
+        result = await db.execute(
+            update(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == current_user.id)
+            .values(**_contact_values(payload, exclude_unset=True))
+            .returning(Contact)
+            .execution_options(synchronize_session=False)
+        )
+        contact = result.scalar_one_or_none()
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=EMAIL_IN_USE)
     if not contact:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found")
-    if payload.email:
-        dup = await db.execute(
-            select(Contact).where(
-                Contact.email == payload.email,
-                Contact.id != contact_id,
-                Contact.user_id == current_user.id
-            )
-        )
-        if dup.scalar_one_or_none():
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already in use")
-    for field, value in payload.dict(exclude_unset=True).items():
-        setattr(contact, field, value)
-    await db.commit()
-    await db.refresh(contact)
+    await _contacts_changed(current_user.id)
     return contact
 
 
@@ -119,7 +552,7 @@ async def delete_contact(
     current_user=Depends(auth_service.get_current_user),
 ) -> None:
     """
-    Видалити контакт за ID.
+    Видалити контакт за ID одним запитом ``DELETE ... RETURNING``.
 
     :param contact_id: Ідентифікатор контакту.
     :param db: Сесія бази даних.
@@ -127,10 +560,13 @@ async def delete_contact(
     :return: None або помилка.
     """
     result = await db.execute(
-        select(Contact).where(Contact.id == contact_id, Contact.user_id == current_user.id)
+        delete(Contact)
+        .where(Contact.id == contact_id, Contact.user_id == current_user.id)
+        .returning(Contact.id)
+        .execution_options(synchronize_session=False)
     )
-    contact = result.scalar_one_or_none()
-    if not contact:
+    deleted = result.scalar_one_or_none()
+    await db.commit()
+    if deleted is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found")
-    await db.delete(contact)
-    await db.commit()
\ No newline at end of file
+    await _contacts_changed(current_user.id)
\ No newline at end of file
@@ -1,14 +1,24 @@
-from fastapi import APIRouter, Depends, UploadFile, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, UploadFile, HTTPException, Query, status
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.db import get_db
+from app.conf.config import settings
+from app.database.db import get_db, pool_metrics
+from app.database.replica import replica_pool_metrics, replica_router
 from app.schemas.schemas import UserResponse, UserUpdate
 from app.repository.users import update_user_data, update_avatar
-from app.services.cloudinary_service import upload_avatar
-from app.services.auth import auth_service
+from app.repository.user_cache import local_users
+from app.services.cloudinary_service import finish_avatar_upload, read_avatar, upload_avatar
+from app.services.auth import auth_service, verified_tokens
+from app.services.rate_limit import rate_limit
+from app.services.response_cache import response_cache
 from app.models.models import UserRole
 
-router = APIRouter(prefix="/users", tags=["Users"])
+router = APIRouter(
+    prefix="/users",
+    tags=["Users"],
+    dependencies=[Depends(rate_limit(settings.rate_limit_default))],
+)
 
 
 @router.get("/me", response_model=UserResponse)
@@ -52,23 +62,64 @@ def get_current_admin(user=Depends(auth_service.get_current_user)):
     return user
 
 
+@router.get("/cache-stats", dependencies=[Depends(get_current_admin)])
+async def user_cache_stats():
+    """
+    Отримати лічильники кешів користувачів і перевірених токенів
+    у пам'яті процесу та кешу відповідей контактів (тільки для адміністратора).
+
+    :return: Для кешів процесу: розмір, влучання, промахи, частка влучань, витіснення
+        та прострочення; для кешу відповідей — влучання, промахи і очікування.
+    """
+    return {"users": local_users.stats(), "tokens": verified_tokens.stats(), "responses": response_cache.stats()}
+
+
+@router.get("/pool-stats", dependencies=[Depends(get_current_admin)])
+async def db_pool_stats():
+    """
+    Отримати стан і лічильники пулу з'єднань з базою даних цього процесу
+    та маршрутизації читань на репліку (тільки для адміністратора).
+
+    :return: Видані й вільні з'єднання, overflow, гістограма очікування на з'єднання,
+        тайм-аути та кількість відкритих і закритих з'єднань; у ключі ``replica`` —
+        стан репліки, лічильники читань і знімок її пулу.
+    """
+    replica = replica_router.stats()
+    if replica_pool_metrics is not None:
+        replica["pool"] = replica_pool_metrics.snapshot()
+    return {**pool_metrics.snapshot(), "replica": replica}
+
+
 @router.patch(
     "/me/avatar",
     response_model=UserResponse,
-    dependencies=[Depends(get_current_admin)]
+    dependencies=[Depends(get_current_admin)],
+    responses={status.HTTP_202_ACCEPTED: {"description": "Завантаження прийнято, аватар оновиться у фоні"}},
 )
 async def change_avatar(
     file: UploadFile,
+    background_tasks: BackgroundTasks,
+    deferred: bool = Query(False, description="Завершити завантаження у фоні та одразу повернути 202"),
     db: AsyncSession = Depends(get_db),
     current_user=Depends(auth_service.get_current_user),
 ):
     """
     Оновити аватар поточного користувача (тільки для адміністратора).
 
+    У відкладеному режимі файл перевіряється та буферизується одразу,
+    а завантаження у сховище й оновлення профілю виконуються у фоні.
+
     :param file: Завантажений файл зображення.
+    :param background_tasks: Фонові задачі FastAPI.
+    :param deferred: Чи завершувати завантаження у фоні.
     :param db: Сесія бази даних.
     :param current_user: Поточний авторизований користувач.
-    :return: Об'єкт користувача з оновленим URL аватару.
+    :return: Об'єкт користувача з оновленим URL аватару або 202 у відкладеному режимі.
     """
+    if deferred:
+        data = await read_avatar(file)
+        background_tasks.add_task(finish_avatar_upload, current_user.id, data, file.content_type)
+        return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content={"detail": "Avatar upload accepted"})
+
     url = await upload_avatar(file)
-    return await update_avatar(current_user, url, db)
\ No newline at end of file
+    return await update_avatar(current_user, url, db)
@@ -1,6 +1,7 @@
 from datetime import date
-from typing import Optional
-from pydantic import BaseModel, EmailStr, Field
+from enum import Enum
+from typing import List, Optional
+from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
 
 
 class ContactBase(BaseModel):
@@ -111,4 +112,159 @@ class TokenData(BaseModel):
 
     :param sub: Email користувача (sub).
     """
-    sub: Optional[str] = None
\ No newline at end of file
+    sub: Optional[str] = None
+
+class ContactSort(str, Enum):
+    """
+    Допустимі ключі сортування списку контактів.
+
+    Префікс ``-`` означає спадний порядок. Кожен ключ має відповідний
+    складений індекс, що починається з ``user_id``.
+    """
+    NAME = "name"
+    NAME_DESC = "-name"
+    EMAIL = "email"
+    EMAIL_DESC = "-email"
+    ID = "id"
+    ID_DESC = "-id"
+
+
+class ImportFormat(str, Enum):
+    """
+    Підтримувані формати імпорту контактів.
+    """
+    CSV = "csv"
+    JSONL = "jsonl"
+
+
+class ExportFormat(str, Enum):
+    """
+    Підтримувані формати експорту контактів.
+    """
+    NDJSON = "ndjson"
+    CSV = "csv"
+    VCF = "vcf"
+
+
+class ContactImportError(BaseModel):
+    """
+    Помилка одного рядка під час імпорту контактів.
+
+    :param row: Номер запису даних (починаючи з 1, без рядка заголовка CSV).
+    :param errors: Опис помилок валідації.
+    """
+    row: int
+    errors: List[str]
+
+
+class ContactImportResult(BaseModel):
+    """
+    Підсумок імпорту контактів.
+
+    :param inserted: Кількість вставлених контактів.
+    :param failed: Кількість відхилених рядків.
+    :param errors: Помилки перших відхилених рядків.
+    """
+    inserted: int
+    failed: int
+    errors: List[ContactImportError]
+
+
+MAX_BATCH_IDS = 10000
+
+
+class ContactBatchFilter(BaseModel):
+    """
+    Фільтр контактів для пакетних операцій (умови поєднуються через AND).
+
+    :param first_name: Точне ім'я.
+    :param last_name: Точне прізвище.
+    :param email_domain: Домен email (частина після ``@``).
+    """
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    email_domain: Optional[str] = Field(None, min_length=1)
+
+    @model_validator(mode="after")
+    def _not_empty(self):
+        if not self.model_fields_set:
+            raise ValueError("filter must contain at least one condition")
+        return self
+
+
+class ContactBatchSelector(BaseModel):
+    """
+    Вибір контактів для пакетної операції: список ID або фільтр.
+
+    :param ids: ID контактів.
+    :param filter: Фільтр контактів.
+    """
+    ids: Optional[List[int]] = Field(None, min_length=1, max_length=MAX_BATCH_IDS)
+    filter: Optional[ContactBatchFilter] = None
+
+    @model_validator(mode="after")
+    def _exactly_one(self):
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("provide either ids or filter")
+        return self
+
+
+class ContactPatch(BaseModel):
+    """
+    Зміни, що застосовуються до кожного вибраного контакту.
+
+    Email не входить до пакетних змін, бо він має бути унікальним.
+    Обов'язкові поля контакту можна пропустити, але не можна очистити
+    значенням ``null``; очистити можна лише ``additional_info``.
+    """
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    phone: Optional[str] = None
+    birthday: Optional[date] = None
+    additional_info: Optional[str] = None
+
+    @field_validator("first_name", "last_name", "phone", "birthday")
+    @classmethod
+    def _not_null(cls, value):
+        if value is None:
+            raise ValueError("field cannot be null")
+        return value
+
+    @model_validator(mode="after")
+    def _not_empty(self):
+        if not self.model_fields_set:
+            raise ValueError("changes must contain at least one field")
+        return self
+
+
+class ContactBatchUpdate(ContactBatchSelector):
+    """
+    Пакетне оновлення контактів.
+
+    :param changes: Нові значення полів.
+    """
+    changes: ContactPatch
+
+
+class ContactBatchItem(BaseModel):
+    """
+    Результат пакетної операції для одного контакту.
+
+    :param id: ID контакту.
+    :param status: ``updated``, ``deleted`` або ``not_found``.
+    """
+    id: int
+    status: str
+
+
+class ContactBatchResult(BaseModel):
+    """
+    Підсумок пакетної операції.
+
+    :param affected: Кількість змінених або видалених контактів.
+    :param not_found: Кількість запитаних ID, яких немає серед контактів користувача.
+    :param items: Результат для кожного контакту.
+    """
+    affected: int
+    not_found: int
+    items: List[ContactBatchItem]
@@ -1,22 +1,24 @@
-import json
-import aioredis
+import hashlib
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import AsyncIterator, Optional
 from jose import jwt, JWTError
-from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.conf.config import settings
 from app.database.db import get_db
+from app.database.replica import SAFE_METHODS, replica_router
 from app.repository.users import get_user_by_email
+from app.repository.user_cache import fill_user_cache, get_cached_user
 from app.models.models import User
+from app.services.hashing import password_hasher
+from app.services.lru import TTLCache
 
-pwd_ctx = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
-redis = aioredis.from_url(settings.redis_url, encoding="utf-8", decode_responses=True)
+verified_tokens = TTLCache(settings.token_cache_size, settings.access_token_expire_minutes * 60)
 
 class AuthService:
     """
@@ -25,24 +27,26 @@ class AuthService:
     а також отримання поточного користувача (з Redis або БД).
     """
 
-    def verify_password(self, plain: str, hashed: str) -> bool:
+    async def verify_password(self, plain: str, hashed: str) -> bool:
         """
         Перевіряє, чи відповідає plain-текст пароля хешу.
+        Виконується в пулі потоків, не блокуючи цикл подій.
 
         :param plain: Пароль у відкритому вигляді.
         :param hashed: Хешований пароль.
         :return: True, якщо паролі збігаються.
         """
-        return pwd_ctx.verify(plain, hashed)
+        return await password_hasher.verify(plain, hashed)
 
-    def hash_password(self, pwd: str) -> str:
+    async def hash_password(self, pwd: str) -> str:
         """
         Хешує пароль.
+        Виконується в пулі потоків, не блокуючи цикл подій.
 
         :param pwd: Пароль у відкритому вигляді.
         :return: Хеш пароля.
         """
-        return pwd_ctx.hash(pwd)
+        return await password_hasher.hash(pwd)
 
     def create_access_token(self, data: dict) -> str:
         """
@@ -72,26 +76,41 @@ class AuthService:
         """
         Декодує токен і повертає email користувача (sub).
 
+        Вже перевірені токени зберігаються в обмеженому LRU-кеші за SHA-256
+        дайджестом токена до настання їхнього ``exp``, тож повторні запити
+        з тим самим токеном не перевіряють підпис і не розбирають JSON.
+
         :param token: JWT токен.
         :return: Email користувача або None, якщо токен недійсний.
         """
+        digest = hashlib.sha256(token.encode()).digest()
+        email = verified_tokens.get(digest)
+        if email is not None:
+            return email
         try:
             payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-            return payload.get("sub")
         except JWTError:
             return None
+        email = payload.get("sub")
+        expires_at = payload.get("exp")
+        if email is not None and expires_at is not None:
+            verified_tokens.set(digest, email, ttl=expires_at - time.time())
+        return email
 
     async def get_current_user(
         self,
         token: str = Depends(oauth2_scheme),
         db: AsyncSession = Depends(get_db),
+        request: Request = None,
     ) -> User:
         """
         Отримує поточного користувача з токена.
         Використовує Redis як кеш для зменшення навантаження на базу даних.
+        Після промаху кешу запити, що лише читають дані, читають користувача з репліки.
 
         :param token: JWT токен доступу.
         :param db: Поточна сесія бази даних.
+        :param request: Поточний запит (FastAPI передає його сам; без нього читання йде з основної бази).
         :return: Об'єкт користувача.
         :raises HTTPException: Якщо токен недійсний або користувача не знайдено.
         """
@@ -99,30 +118,42 @@ class AuthService:
         if not email:
             raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Invalid token")
 
-        key = f"user:{email}"
-        cached = await redis.get(key)
-        if cached:
-            data = json.loads(cached)
-            user = User(**data)
-        else:
-            user = await get_user_by_email(email, db)
+        user = await get_cached_user(email)
+        if user is None:
+            if request is not None and request.method in SAFE_METHODS and await replica_router.use_replica():
+                async with replica_router.session(db) as replica:
+                    user = await get_user_by_email(email, replica)
+            else:
+                user = await get_user_by_email(email, db)
             if not user:
                 raise HTTPException(status.HTTP_401_UNAUTHORIZED, "User not found")
-            if not user.is_verified and not settings.testing:
-                raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Email not verified")
-            await redis.set(
-                key,
-                json.dumps({
-                    "id": user.id,
-                    "email": user.email,
-                    "is_verified": user.is_verified,
-                    "avatar_url": user.avatar_url,
-                    "refresh_token": user.refresh_token,
-                    "role": user.role.value,
-                }),
-                ex=3600 
-            )
+            await fill_user_cache(user)
+        if not user.is_verified and not settings.testing:
+            raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Email not verified")
         return user
 
 
-auth_service = AuthService()
\ No newline at end of file
+auth_service = AuthService()
+
+
+async def get_read_db(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(auth_service.get_current_user),
+) -> AsyncIterator[AsyncSession]:
+    """
+    Генерує сесію для обробників, що лише читають дані поточного користувача.
+
+    Повертає сесію репліки, якщо вона доступна, не відстає і користувач
+    нещодавно не змінював свої дані; інакше — сесію основної бази
+    (ту саму, що й :func:`app.database.db.get_db`). Читання, що впало на
+    репліці з помилкою з'єднання, повторюється на основній базі.
+
+    :param db: Сесія основної бази даних.
+    :param current_user: Поточний авторизований користувач.
+    :yield: Сесія бази даних AsyncSession.
+    """
+    if not await replica_router.use_replica(current_user.id):
+        yield db
+        return
+    async with replica_router.session(db) as session:
+        yield session
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""
+Модуль сховищ аватарів і потокового читання завантажених файлів.
+
+Файл читається частинами у тимчасовий буфер (у пам'яті до 1 МБ, далі на диску)
+з обмеженням максимального розміру, після чого передається сховищу.
+Усі блокуючі операції (запис у буфер, який може перейти на диск, і операції
+сховищ) виконуються поза циклом подій.
+
+Дозволені лише растрові формати з :data:`AVATAR_EXTENSIONS`: SVG та інші
+типи, що можуть містити скрипти, відхиляються, бо локальне сховище
+роздає файли з того самого домену, що й API.
+"""
+
+import asyncio
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import BinaryIO
+
+from fastapi import HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+
+CHUNK_SIZE = 64 * 1024
+SPOOL_MAX_SIZE = 1024 * 1024
+
+AVATAR_EXTENSIONS = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/webp": ".webp",
+}
+
+
+async def read_upload(file: UploadFile, max_bytes: int) -> BinaryIO:
+    """
+    Читає завантажений файл частинами у тимчасовий буфер.
+
+    :param file: Завантажений файл.
+    :param max_bytes: Максимально допустимий розмір у байтах.
+    :return: Буфер, встановлений на початок даних (його потрібно закрити).
+    :raises HTTPException: 413, якщо файл перевищує ``max_bytes``.
+    """
+    buffer = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    size = 0
+    while chunk := await file.read(CHUNK_SIZE):
+        size += len(chunk)
+        if size > max_bytes:
+            buffer.close()
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"File is larger than {max_bytes} bytes",
+            )
+        await run_in_threadpool(buffer.write, chunk)
+    buffer.seek(0)
+    return buffer
+
+
+class AvatarStorage(ABC):
+    """
+    Базовий клас сховища аватарів.
+    """
+
+    @abstractmethod
+    async def save(self, data: BinaryIO, public_id: str, content_type: str) -> str:
+        """
+        Зберігає зображення і повертає його публічний URL.
+
+        :param data: Буфер з даними зображення.
+        :param public_id: Унікальний ідентифікатор зображення.
+        :param content_type: MIME-тип зображення (один із :data:`AVATAR_EXTENSIONS`).
+        :return: URL збереженого зображення.
+        """
+
+
+class LocalAvatarStorage(AvatarStorage):
+    """
+    Сховище аватарів у локальній файловій системі.
+
+    Замінник Cloudinary для локальної розробки та навантажувального тестування.
+
+    :param directory: Каталог для збереження файлів.
+    :param base_url: URL-префікс, за яким каталог роздається застосунком.
+    """
+
+    def __init__(self, directory: str, base_url: str):
+        self.directory = Path(directory)
+        self.base_url = base_url.rstrip("/")
+
+    def _write(self, data: BinaryIO, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as target:
+            shutil.copyfileobj(data, target, CHUNK_SIZE)
+
+    async def save(self, data: BinaryIO, public_id: str, content_type: str) -> str:
+        extension = AVATAR_EXTENSIONS.get(content_type)
+        if extension is None:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Unsupported image type")
+        name = public_id + extension
+        await asyncio.to_thread(self._write, data, self.directory / name)
+        return f"{self.base_url}/{name}"
@@ -0,0 +1,51 @@
+"""
+Модуль пошуку найближчих днів народження.
+
+Дні народження зберігаються з попередньо обчисленим ключем ``birthday_key``
+у форматі ``MMDD`` (наприклад, 5 березня — ``305``). Ключ зростає разом із
+календарною датою в межах року і не залежить від високосності, тож вікно
+«наступні N днів» перетворюється на один або два діапазони ключів, які
+обслуговуються індексом ``(user_id, birthday_key)``.
+"""
+
+import calendar
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
+
+FEB_28 = 228
+FEB_29 = 229
+LAST_KEY = 1231
+FIRST_KEY = 101
+
+
+def birthday_key(birthday: Optional[date]) -> Optional[int]:
+    """
+    Обчислює ключ дня народження ``MMDD``.
+
+    :param birthday: Дата народження.
+    :return: Ключ або None, якщо дата не вказана.
+    """
+    if birthday is None:
+        return None
+    return birthday.month * 100 + birthday.day
+
+
+def upcoming_birthday_ranges(today: date, days: int) -> List[Tuple[int, int]]:
+    """
+    Повертає діапазони ключів для днів народження у вікні ``[today, today + days]``.
+
+    Якщо вікно переходить через Новий рік, повертаються два діапазони.
+    У невисокосному році іменинники 29 лютого святкують 28 лютого,
+    тому вікно, що закінчується 28 лютого, включає і ключ ``229``.
+
+    :param today: Поточна дата.
+    :param days: Кількість днів наперед (0 — лише сьогодні).
+    :return: Список пар (початковий ключ, кінцевий ключ) включно.
+    """
+    end = today + timedelta(days=days)
+    start_key, end_key = birthday_key(today), birthday_key(end)
+    if end_key == FEB_28 and not calendar.isleap(end.year):
+        end_key = FEB_29
+    if end.year == today.year:
+        return [(start_key, end_key)]
+    return [(start_key, LAST_KEY), (FIRST_KEY, end_key)]
@@ -0,0 +1,102 @@
+"""
+Спільний клієнт Redis застосунку та версії контактів користувачів.
+
+Клієнт записує тривалість кожної команди й конвеєра в метрики
+(:data:`app.services.metrics.redis_metrics`).
+
+Версія контактів — випадковий рядок, який замінюється після кожної зміни
+контактів користувача. Читачі використовують її для ETag і як покоління
+кешованих відповідей. Якщо ключ версії зник з Redis, створюється нова
+випадкова версія, тож втрата ключа ніколи не робить застарілі дані «свіжими».
+"""
+
+import logging
+import time
+from typing import Optional
+from uuid import uuid4
+
+import aioredis
+from aioredis.client import Pipeline
+from aioredis.exceptions import RedisError
+
+from app.conf.config import settings
+from app.services.metrics import redis_metrics
+
+logger = logging.getLogger(__name__)
+
+CONTACTS_VERSION_PREFIX = "contacts-version:"
+
+
+
+class InstrumentedPipeline(Pipeline):
+    """
+    Конвеєр Redis, що записує тривалість виконання як команду ``PIPELINE``.
+    """
+
+    async def execute(self, raise_on_error: bool = True):
+        started = time.perf_counter()
+        try:
+            return await super().execute(raise_on_error)
+        finally:
+            redis_metrics.observe("PIPELINE", time.perf_counter() - started)
+
+
+class InstrumentedRedis(aioredis.Redis):
+    """
+    Клієнт Redis, що записує тривалість кожної команди в метрики.
+    """
+
+    async def execute_command(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            redis_metrics.observe(str(args[0]).upper(), time.perf_counter() - started)
+
+    def pipeline(self, transaction: bool = True, shard_hint: Optional[str] = None) -> Pipeline:
+        return InstrumentedPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+
+
+redis = InstrumentedRedis.from_url(settings.redis_url, encoding="utf-8", decode_responses=True)
+
+
+def contacts_version_key(user_id: int) -> str:
+    """
+    Повертає ключ Redis для версії контактів користувача.
+
+    :param user_id: ID користувача.
+    :return: Ключ версії.
+    """
+    return f"{CONTACTS_VERSION_PREFIX}{user_id}"
+
+
+async def get_contacts_version(user_id: int) -> Optional[str]:
+    """
+    Повертає поточну версію контактів користувача, створюючи її за потреби.
+
+    :param user_id: ID користувача.
+    :return: Версія або None, якщо Redis недоступний.
+    """
+    key = contacts_version_key(user_id)
+    try:
+        version = await redis.get(key)
+        if version is None:
+            version = uuid4().hex
+            if not await redis.set(key, version, nx=True):
+                version = await redis.get(key)
+    except (RedisError, OSError):
+        logger.warning("Contacts version is unavailable", exc_info=True)
+        return None
+    return version
+
+
+async def bump_contacts_version(user_id: int) -> None:
+    """
+    Замінює версію контактів користувача після їх зміни.
+
+    :param user_id: ID користувача.
+    """
+    try:
+        await redis.set(contacts_version_key(user_id), uuid4().hex)
+    except (RedisError, OSError):
+        logger.error("Failed to bump contacts version for user %s", user_id, exc_info=True)
@@ -2,14 +2,27 @@
 Модуль для завантаження аватарів користувачів у Cloudinary.
 
 Використовує fastapi UploadFile та cloudinary.uploader для обробки зображень.
+Файл читається частинами з обмеженням розміру, а синхронний SDK Cloudinary
+викликається в пулі потоків, щоб не блокувати цикл подій. Сховище обирається
+налаштуванням ``AVATAR_STORAGE`` (``cloudinary`` або ``local``).
 """
 
+import asyncio
+import logging
+from typing import BinaryIO
+from uuid import uuid4
+
 import cloudinary
 import cloudinary.uploader
 from fastapi import UploadFile, HTTPException, status
-from uuid import uuid4
 
 from app.conf.config import settings
+from app.database.db import AsyncSessionLocal
+from app.models.models import User
+from app.repository.users import update_avatar
+from app.services.avatar_storage import AVATAR_EXTENSIONS, AvatarStorage, LocalAvatarStorage, read_upload
+
+logger = logging.getLogger(__name__)
 
 cloudinary.config(
     cloud_name=settings.cloudinary_name,
@@ -18,39 +31,103 @@ cloudinary.config(
 )
 
 
-async def upload_avatar(file: UploadFile) -> str:
+class CloudinaryAvatarStorage(AvatarStorage):
+    """
+    Сховище аватарів у Cloudinary.
+    """
+
+    async def save(self, data: BinaryIO, public_id: str, content_type: str) -> str:
+        try:
+            result = await asyncio.to_thread(
+                cloudinary.uploader.upload,
+                data,
+                folder="user_avatars",
+                public_id=public_id,
+                overwrite=True,
+                resource_type="image",
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail=f"Cloudinary upload failed: {e}"
+            )
+
+        url = result.get("secure_url")
+        if not url:
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail="Cloudinary did not return a URL"
+            )
+        return url
+
+
+def get_avatar_storage() -> AvatarStorage:
+    """
+    Повертає сховище аватарів відповідно до налаштувань.
+
+    :return: Екземпляр сховища.
+    """
+    if settings.avatar_storage == "local":
+        return LocalAvatarStorage(settings.avatar_local_dir, settings.avatar_local_url)
+    return CloudinaryAvatarStorage()
+
+
+async def read_avatar(file: UploadFile) -> BinaryIO:
     """
-    Завантажує зображення (аватар) користувача у Cloudinary.
+    Перевіряє тип файлу і читає його частинами у тимчасовий буфер.
 
     :param file: Об'єкт зображення типу UploadFile
-    :return: URL завантаженого зображення
-    :raises HTTPException: якщо файл не є зображенням або сталася помилка при завантаженні
+    :return: Буфер з даними зображення (його потрібно закрити).
+    :raises HTTPException: 400, якщо файл не є PNG, JPEG чи WebP; 413, якщо він завеликий.
     """
-    if not file.content_type.startswith("image/"):
+    if file.content_type not in AVATAR_EXTENSIONS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Only image files are allowed"
         )
+    return await read_upload(file, settings.avatar_max_bytes)
+
+
+async def store_avatar(data: BinaryIO, content_type: str) -> str:
+    """
+    Зберігає прочитане зображення у налаштоване сховище і закриває буфер.
 
-    data = await file.read()
+    :param data: Буфер з даними зображення.
+    :param content_type: MIME-тип зображення.
+    :return: URL збереженого зображення.
+    """
     try:
-        result = cloudinary.uploader.upload(
-            data,
-            folder="user_avatars",
-            public_id=str(uuid4()),
-            overwrite=True,
-            resource_type="image",
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=f"Cloudinary upload failed: {e}"
-        )
+        return await get_avatar_storage().save(data, str(uuid4()), content_type)
+    finally:
+        data.close()
 
-    url = result.get("secure_url")
-    if not url:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Cloudinary did not return a URL"
-        )
-    return url
\ No newline at end of file
+
+async def upload_avatar(file: UploadFile) -> str:
+    """
+    Завантажує зображення (аватар) користувача у сховище.
+
+    :param file: Об'єкт зображення типу UploadFile
+    :return: URL завантаженого зображення
+    :raises HTTPException: якщо файл не є зображенням, завеликий або сталася помилка при завантаженні
+    """
+    data = await read_avatar(file)
+    return await store_avatar(data, file.content_type)
+
+
+async def finish_avatar_upload(user_id: int, data: BinaryIO, content_type: str) -> None:
+    """
+    Фонова частина відкладеного завантаження: зберігає зображення
+    та оновлює аватар користувача у власній сесії бази даних.
+
+    :param user_id: ID користувача.
+    :param data: Буфер з даними зображення.
+    :param content_type: MIME-тип зображення.
+    """
+    try:
+        url = await store_avatar(data, content_type)
+        async with AsyncSessionLocal() as db:
+            user = await db.get(User, user_id)
+            if user is not None:
+                await update_avatar(user, url, db)
+    except Exception:
+        logger.exception("Deferred avatar upload failed for user %s", user_id)
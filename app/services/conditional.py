@@ -0,0 +1,76 @@
+"""
+Модуль умовних GET-запитів (ETag / If-None-Match) для читання контактів.
+
+ETag відповіді обчислюється з версії контактів користувача, шляху і параметрів
+запиту, тож для перевірки ``If-None-Match`` не потрібно звертатися до бази
+даних чи серіалізувати контакти. Версія читається до запиту в базу: якщо
+контакти зміняться під час читання, відповідь отримає вже застарілий ETag
+і наступний запит клієнта поверне повні дані, а не 304.
+
+``If-None-Match: *`` означає «будь-яке наявне представлення», тож маршрут
+окремого ресурсу має спершу переконатися, що ресурс існує
+(див. :func:`matches_any`), і лише тоді відповідати 304.
+"""
+
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(version: str, request: Request) -> str:
+    """
+    Формує сильний ETag для відповіді.
+
+    :param version: Версія контактів користувача.
+    :param request: Запит.
+    :return: ETag у лапках.
+    """
+    query = "&".join(sorted(f"{k}={v}" for k, v in request.query_params.multi_items()))
+    digest = hashlib.sha256(f"{version}|{request.url.path}|{query}".encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def matches_any(if_none_match: Optional[str]) -> bool:
+    """
+    Перевіряє, чи заголовок ``If-None-Match`` має значення ``*``.
+
+    :param if_none_match: Значення заголовка.
+    :return: True для ``*``.
+    """
+    return bool(if_none_match) and if_none_match.strip() == "*"
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """
+    Перевіряє заголовок ``If-None-Match`` (слабке порівняння, як вимагає RFC 9110).
+
+    :param etag: ETag поточного представлення.
+    :param if_none_match: Значення заголовка.
+    :return: True, якщо клієнт має актуальну копію.
+    """
+    if not if_none_match:
+        return False
+    if matches_any(if_none_match):
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def not_modified(request: Request, response: Response, version: Optional[str]) -> Optional[Response]:
+    """
+    Додає ETag до відповіді і повертає 304, якщо копія клієнта актуальна.
+
+    :param request: Запит.
+    :param response: Відповідь, до якої додаються заголовки ETag і Cache-Control.
+    :param version: Версія контактів користувача (None — без ETag).
+    :return: Відповідь 304 або None, якщо потрібно повернути повні дані.
+    """
+    if version is None:
+        return None
+    response.headers["ETag"] = make_etag(version, request)
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    if etag_matches(response.headers["ETag"], request.headers.get("if-none-match")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=dict(response.headers))
+    return None
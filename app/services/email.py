@@ -1,61 +1,73 @@
 """
 Модуль для надсилання електронних листів верифікації та скидання пароля.
 
-Використовує FastMail з бібліотеки fastapi-mail.
+Листи не надсилаються під час обробки запиту: вони зберігаються в черзі
+вихідної пошти (таблиця ``email_outbox``), яку розбирає обробник
+:mod:`app.services.outbox` через пул SMTP з'єднань.
 """
 
-from fastapi_mail import FastMail, MessageSchema, ConnectionConfig
 from pydantic import EmailStr
-from app.conf.config import settings
-
-conf = ConnectionConfig(
-    MAIL_USERNAME=settings.mail_username,
-    MAIL_PASSWORD=settings.mail_password,
-    MAIL_FROM=settings.mail_from,
-    MAIL_PORT=settings.mail_port,
-    MAIL_SERVER=settings.mail_server,
-    MAIL_FROM_NAME=settings.mail_from_name,
-    MAIL_STARTTLS=True,
-    MAIL_SSL_TLS=False,
-    USE_CREDENTIALS=True,
-    VALIDATE_CERTS=False,
-)
-
-
-async def send_verification_email(email: EmailStr, token: str):
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import EmailOutbox
+
+
+async def enqueue_email(
+    recipient: str, subject: str, body: str, db: AsyncSession, commit: bool = True
+) -> EmailOutbox:
+    """
+    Зберігає лист у черзі вихідної пошти.
+
+    :param recipient: Адреса отримувача.
+    :param subject: Тема листа.
+    :param body: Текст листа.
+    :param db: Сесія бази даних.
+    :param commit: Чи фіксувати транзакцію; False — лист зберігається разом
+        зі змінами викликача, коли той зафіксує свою транзакцію.
+    :return: Запис черги.
+    """
+    item = EmailOutbox(recipient=recipient, subject=subject, body=body)
+    db.add(item)
+    if commit:
+        await db.commit()
+    return item
+
+
+async def enqueue_verification_email(
+    email: EmailStr, token: str, db: AsyncSession, commit: bool = True
+) -> EmailOutbox:
     """
-    Надсилає лист для підтвердження електронної пошти.
+    Ставить у чергу лист для підтвердження електронної пошти.
 
     :param email: Email користувача
     :param token: Токен для підтвердження
+    :param db: Сесія бази даних.
+    :param commit: Чи фіксувати транзакцію (див. :func:`enqueue_email`).
+    :return: Запис черги.
     """
     link = f"http://localhost:8000/auth/verify?token={token}"
-    message = MessageSchema(
-        subject="Email verification",
-        recipients=[email],
-        body=f"Будь ласка, підтвердіть email за посиланням:\n{link}",
-        subtype="plain"
+    return await enqueue_email(
+        email,
+        "Email verification",
+        f"Будь ласка, підтвердіть email за посиланням:\n{link}",
+        db,
+        commit,
     )
-    fm = FastMail(conf)
-    try:
-        await fm.send_message(message)
-    except Exception:
-        print(f"[DEV] Verification link: {link}")
 
 
-async def send_reset_email(email: EmailStr, token: str):
+async def enqueue_reset_email(email: EmailStr, token: str, db: AsyncSession) -> EmailOutbox:
     """
-    Надсилає лист для скидання пароля.
+    Ставить у чергу лист для скидання пароля.
 
     :param email: Email користувача
     :param token: Токен для скидання пароля
+    :param db: Сесія бази даних.
+    :return: Запис черги.
     """
     link = f"http://localhost:8000/auth/reset-password?token={token}"
-    message = MessageSchema(
-        subject="Password reset",
-        recipients=[email],
-        body=f"Щоб скинути пароль, перейдіть за посиланням:\n{link}",
-        subtype="plain"
+    return await enqueue_email(
+        email,
+        "Password reset",
+        f"Щоб скинути пароль, перейдіть за посиланням:\n{link}",
+        db,
     )
-    fm = FastMail(conf)
-    await fm.send_message(message)
\ No newline at end of file
@@ -0,0 +1,151 @@
+"""
+Модуль потокового експорту контактів у NDJSON, CSV або vCard.
+
+Контакти читаються серверним курсором (``stream``) частинами
+по ``PARTITION_SIZE`` рядків, кожна частина одразу серіалізується
+і віддається клієнту, тож пам'ять не залежить від кількості контактів,
+а перші байти надходять до завершення запиту. За потреби вихідний потік
+стискається gzip на льоту.
+
+SELECT містить лише поля, що потрапляють у файл; для NDJSON і CSV їх можна
+задати параметром ``fields``.
+"""
+
+import csv
+import io
+import json
+import zlib
+from datetime import date
+from typing import Any, AsyncContextManager, AsyncIterator, Callable, Dict, Optional, Sequence
+
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.db import AsyncSessionLocal
+from app.models.models import Contact
+from app.schemas.schemas import ExportFormat
+from app.services.fieldsets import Fields, contact_columns
+
+PARTITION_SIZE = 500
+
+CSV_FIELDS = ["first_name", "last_name", "email", "phone", "birthday", "additional_info"]
+
+DEFAULT_FIELDS: Dict[ExportFormat, Fields] = {
+    ExportFormat.NDJSON: ("id", *CSV_FIELDS),
+    ExportFormat.CSV: tuple(CSV_FIELDS),
+    ExportFormat.VCF: tuple(CSV_FIELDS),
+}
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.VCF: "text/vcard; charset=utf-8",
+}
+
+
+def _value(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, date) else value
+
+
+def _ndjson(rows: Sequence[Row], fields: Fields) -> str:
+    return "".join(
+        json.dumps({name: _value(getattr(row, name)) for name in fields}, ensure_ascii=False) + "\n"
+        for row in rows
+    )
+
+
+def _csv(rows: Sequence[Row], fields: Fields) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([_value(getattr(row, name)) for name in fields])
+    return buffer.getvalue()
+
+
+def _vcard_escape(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\").replace(",", "\\,").replace(";", "\\;")
+        .replace("\r\n", "\\n").replace("\n", "\\n")
+    )
+
+
+def _vcard(rows: Sequence[Row], fields: Fields) -> str:
+    cards = []
+    for c in rows:
+        first, last = _vcard_escape(c.first_name or ""), _vcard_escape(c.last_name or "")
+        lines = [
+            "BEGIN:VCARD",
+            "VERSION:3.0",
+            f"N:{last};{first};;;",
+            f"FN:{(first + ' ' + last).strip()}",
+        ]
+        if c.email:
+            lines.append(f"EMAIL;TYPE=INTERNET:{_vcard_escape(c.email)}")
+        if c.phone:
+            lines.append(f"TEL:{_vcard_escape(c.phone)}")
+        if c.birthday:
+            lines.append(f"BDAY:{c.birthday.isoformat()}")
+        if c.additional_info:
+            lines.append(f"NOTE:{_vcard_escape(c.additional_info)}")
+        lines.append("END:VCARD")
+        cards.append("\r\n".join(lines) + "\r\n")
+    return "".join(cards)
+
+
+SERIALIZERS: Dict[ExportFormat, Callable[[Sequence[Row], Fields], str]] = {
+    ExportFormat.NDJSON: _ndjson,
+    ExportFormat.CSV: _csv,
+    ExportFormat.VCF: _vcard,
+}
+
+
+SessionFactory = Callable[[], AsyncContextManager[AsyncSession]]
+
+
+async def _chunks(
+    user_id: int, fmt: ExportFormat, open_session: SessionFactory, fields: Fields
+) -> AsyncIterator[bytes]:
+    if fmt == ExportFormat.CSV:
+        yield (",".join(fields) + "\r\n").encode()
+    serialize = SERIALIZERS[fmt]
+    stmt = (
+        select(*contact_columns(fields))
+        .where(Contact.user_id == user_id)
+        .order_by(Contact.id)
+        .execution_options(yield_per=PARTITION_SIZE)
+    )
+    async with open_session() as session:
+        result = await session.stream(stmt)
+        async for partition in result.partitions():
+            yield serialize(partition, fields).encode()
+
+
+async def export_contacts(
+    user_id: int,
+    fmt: ExportFormat,
+    gzip: bool = False,
+    open_session: SessionFactory = AsyncSessionLocal,
+    fields: Optional[Fields] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Потоково серіалізує всі контакти користувача.
+
+    Сесія бази даних відкривається всередині генератора, бо відповідь
+    передається вже після завершення залежностей маршруту.
+
+    :param user_id: ID власника контактів.
+    :param fmt: Формат експорту.
+    :param gzip: Чи стискати потік gzip.
+    :param open_session: Фабрика сесій (основна база або репліка).
+    :param fields: Поля NDJSON чи стовпці CSV; None — стандартний набір формату.
+    :return: Асинхронний ітератор частин відповіді.
+    """
+    fields = fields or DEFAULT_FIELDS[fmt]
+    if not gzip:
+        async for chunk in _chunks(user_id, fmt, open_session, fields):
+            yield chunk
+        return
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    async for chunk in _chunks(user_id, fmt, open_session, fields):
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
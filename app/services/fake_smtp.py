@@ -0,0 +1,100 @@
+"""
+Модуль мінімального SMTP сервера в пам'яті процесу.
+
+Приймає листи й зберігає їх у списку, не надсилаючи далі. Використовується
+в тестах і бенчмарках обробника вихідної пошти, а також для локальної
+розробки без справжнього SMTP сервера. Підтримує лише команди, потрібні
+клієнту aiosmtplib, без TLS.
+"""
+
+import asyncio
+import email
+from email import policy
+from email.message import EmailMessage
+from typing import List, Optional
+
+
+class FakeSMTPServer:
+    """
+    SMTP сервер-приймач для тестів.
+
+    :param host: Адреса для прослуховування.
+    :param port: Порт (0 — будь-який вільний).
+    :param latency: Затримка перед підтвердженням кожного листа в секундах.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.messages: List[EmailMessage] = []
+        self.connections = 0
+        self.fail_next = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> "FakeSMTPServer":
+        """
+        Запускає сервер і визначає фактичний порт.
+
+        :return: Цей сервер.
+        """
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        """
+        Зупиняє сервер.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "FakeSMTPServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+
+        async def reply(line: str) -> None:
+            writer.write(line.encode() + b"\r\n")
+            await writer.drain()
+
+        try:
+            await reply("220 fake-smtp ESMTP")
+            while line := await reader.readline():
+                command = line[:4].upper()
+                if command == b"EHLO":
+                    await reply("250-fake-smtp\r\n250-8BITMIME\r\n250-AUTH PLAIN LOGIN\r\n250 SMTPUTF8")
+                elif command == b"AUTH":
+                    await reply("235 2.7.0 Authentication successful")
+                elif command == b"DATA":
+                    await reply("354 End data with <CR><LF>.<CR><LF>")
+                    await reply(await self._receive(reader))
+                elif command == b"QUIT":
+                    await reply("221 Bye")
+                    break
+                elif command in (b"HELO", b"MAIL", b"RCPT", b"RSET", b"NOOP"):
+                    await reply("250 OK")
+                else:
+                    await reply("502 Command not implemented")
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _receive(self, reader: asyncio.StreamReader) -> str:
+        lines = []
+        while (line := await reader.readline()) not in (b".\r\n", b""):
+            lines.append(line[1:] if line.startswith(b"..") else line)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.fail_next > 0:
+            self.fail_next -= 1
+            return "451 4.3.0 Temporary failure"
+        self.messages.append(email.message_from_bytes(b"".join(lines), policy=policy.default))
+        return "250 OK: queued"
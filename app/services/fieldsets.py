@@ -0,0 +1,121 @@
+"""
+Модуль вибіркових полів (sparse fieldsets) відповідей з контактами.
+
+Параметр ``fields`` (наприклад, ``?fields=id,first_name,last_name``) звужує
+і список стовпців у SQL SELECT, і серіалізовану відповідь. Назви полів
+перевіряються за схемою :class:`app.schemas.schemas.ContactResponse`, а для
+кожного набору полів один раз створюється і кешується схема відповіді
+з тими самими полями й типами.
+
+Email у цій схемі — звичайний рядок: він уже перевірений ``EmailStr`` під
+час запису (створення, оновлення, імпорт), а повторна перевірка кожного
+рядка займала більшу частину часу серіалізації списку. Решта полів
+перевіряється як у ``ContactResponse``, тож рядок з NULL в обов'язковому
+полі відхиляється так само.
+"""
+
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple, Type
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel, EmailStr, TypeAdapter, create_model
+
+from app.models.models import Contact
+from app.schemas.schemas import ContactResponse
+
+CONTACT_FIELDS: Tuple[str, ...] = tuple(ContactResponse.model_fields)
+
+Fields = Tuple[str, ...]
+
+
+def parse_fields(value: Optional[str], allowed: Sequence[str] = CONTACT_FIELDS) -> Optional[Fields]:
+    """
+    Розбирає список полів, розділених комами.
+
+    Повтори ігноруються, порядок полів у відповіді відповідає запиту.
+
+    :param value: Значення параметра ``fields``.
+    :param allowed: Допустимі назви полів.
+    :return: Кортеж полів або None, якщо параметр не задано.
+    :raises HTTPException: 422, якщо список порожній або містить невідомі поля.
+    """
+    if value is None:
+        return None
+    fields = tuple(dict.fromkeys(name.strip() for name in value.split(",") if name.strip()))
+    unknown = [name for name in fields if name not in allowed]
+    if not fields or unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown fields: {', '.join(unknown)}; allowed: {', '.join(allowed)}" if unknown
+            else "fields must not be empty",
+        )
+    return fields
+
+
+def contact_fields(
+    fields: Optional[str] = Query(
+        None,
+        description=f"Поля відповіді через кому (за замовчуванням усі): {', '.join(CONTACT_FIELDS)}",
+    ),
+) -> Optional[Fields]:
+    """
+    Залежність FastAPI, що повертає перевірений набір полів контакту.
+
+    :param fields: Значення параметра ``fields``.
+    :return: Кортеж полів або None, якщо потрібні всі поля.
+    """
+    return parse_fields(fields)
+
+
+def contact_columns(fields: Fields, extra: Sequence[str] = ()) -> List:
+    """
+    Повертає стовпці моделі для SELECT.
+
+    :param fields: Поля відповіді.
+    :param extra: Додаткові поля, потрібні запиту (наприклад, ключ курсора).
+    :return: Стовпці моделі :class:`app.models.models.Contact` без повторів.
+    """
+    return [getattr(Contact, name) for name in dict.fromkeys((*fields, *extra))]
+
+
+def _response_annotation(name: str) -> type:
+    annotation = ContactResponse.model_fields[name].annotation
+    return str if annotation is EmailStr else annotation
+
+
+@lru_cache(maxsize=128)
+def contact_model(fields: Fields) -> Type[BaseModel]:
+    """
+    Створює схему відповіді з полями ``fields`` :class:`ContactResponse`.
+
+    Email перевіряється як рядок (див. опис модуля).
+
+    :param fields: Поля відповіді.
+    :return: Клас схеми.
+    """
+    return create_model(
+        "ContactFields",
+        **{name: (_response_annotation(name), ContactResponse.model_fields[name]) for name in fields},
+    )
+
+
+@lru_cache(maxsize=128)
+def contact_adapter(fields: Fields) -> TypeAdapter:
+    """
+    Створює адаптер часткової схеми контакту.
+
+    :param fields: Поля відповіді.
+    :return: Адаптер контакту з полями ``fields``.
+    """
+    return TypeAdapter(contact_model(fields))
+
+
+@lru_cache(maxsize=128)
+def contact_list_adapter(fields: Fields) -> TypeAdapter:
+    """
+    Створює адаптер списку контактів часткової схеми.
+
+    :param fields: Поля відповіді.
+    :return: Адаптер списку контактів з полями ``fields``.
+    """
+    return TypeAdapter(List[contact_model(fields)])
@@ -0,0 +1,124 @@
+"""
+Модуль хешування паролів поза циклом подій.
+
+bcrypt навмисно повільний (десятки–сотні мілісекунд на виклик), тому хешування
+й перевірка виконуються в обмеженому пулі потоків. bcrypt звільняє GIL під час
+обчислення, отже пропускна здатність входу масштабується з кількістю ядер,
+а цикл подій uvicorn залишається вільним для інших запитів.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict
+
+from passlib.context import CryptContext
+
+from app.conf.config import settings
+
+pwd_ctx = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+class PasswordHasher:
+    """
+    Обмежений пул для операцій bcrypt з метриками черги.
+
+    :param workers: Максимальна кількість одночасних операцій хешування.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.started = 0
+        self.completed = 0
+        self.cancelled = 0
+        self.max_queue_depth = 0
+        self.queue_wait_seconds = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Кількість операцій, що очікують вільного потоку.
+        """
+        return self.submitted - self.started - self.cancelled
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Кількість операцій, що виконуються зараз.
+        """
+        return self.started - self.completed
+
+    def _on_done(self, future: Future) -> None:
+        if future.cancelled():
+            with self._lock:
+                self.cancelled += 1
+
+    async def _run(self, fn: Callable, *args):
+        submitted_at = time.perf_counter()
+
+        def job():
+            with self._lock:
+                self.started += 1
+                self.queue_wait_seconds += time.perf_counter() - submitted_at
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self.completed += 1
+
+        with self._lock:
+            self.submitted += 1
+            outstanding = self.submitted - self.completed - self.cancelled
+            self.max_queue_depth = max(self.max_queue_depth, outstanding - self.workers)
+        future = self._executor.submit(job)
+        future.add_done_callback(self._on_done)
+        return await asyncio.wrap_future(future)
+
+    async def hash(self, password: str) -> str:
+        """
+        Хешує пароль у пулі потоків.
+
+        :param password: Пароль у відкритому вигляді.
+        :return: Хеш пароля.
+        """
+        return await self._run(pwd_ctx.hash, password)
+
+    async def verify(self, plain: str, hashed: str) -> bool:
+        """
+        Перевіряє пароль у пулі потоків.
+
+        :param plain: Пароль у відкритому вигляді.
+        :param hashed: Хешований пароль.
+        :return: True, якщо паролі збігаються.
+        """
+        return await self._run(pwd_ctx.verify, plain, hashed)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Повертає знімок метрик пулу.
+
+        :return: Словник з розміром пулу, глибиною черги, кількістю операцій
+            та сумарним часом очікування в черзі.
+        """
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_depth": self.queue_depth,
+                "max_queue_depth": self.max_queue_depth,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "queue_wait_seconds_total": self.queue_wait_seconds,
+            }
+
+    def shutdown(self) -> None:
+        """
+        Зупиняє пул, дочекавшись завершення поточних операцій.
+        """
+        self._executor.shutdown(wait=True)
+
+
+password_hasher = PasswordHasher(settings.password_hash_workers)
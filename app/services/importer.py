@@ -0,0 +1,207 @@
+"""
+Модуль потокового імпорту контактів з CSV або JSON Lines.
+
+Тіло запиту обробляється по частинах: байти декодуються інкрементально
+й діляться на записи, кожен запис перевіряється схемою ``ContactCreate``,
+а валідні рядки вставляються пакетами багаторядковими INSERT. У пам'яті
+одночасно тримається не більше одного пакета, тож споживання пам'яті не
+залежить від розміру файлу. Помилкові рядки і контакти з email, який
+користувач уже має, пропускаються і потрапляють у звіт.
+
+Запис, довший за ``MAX_RECORD_LENGTH`` символів, не буферизується: його
+залишок пропускається до кінця запису (для CSV — до закриття лапок), а сам
+запис потрапляє у звіт як помилковий.
+"""
+
+import codecs
+import csv
+import json
+from collections import Counter
+from typing import AsyncIterator, List, Optional, Tuple, Union
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.db import insert_or_skip
+from app.models.models import Contact
+from app.schemas.schemas import ContactCreate, ContactImportError, ContactImportResult, ImportFormat
+from app.services.birthdays import birthday_key
+
+BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 100
+MAX_RECORD_LENGTH = 64 * 1024
+RECORD_TOO_LONG = f"record exceeds {MAX_RECORD_LENGTH} characters"
+DUPLICATE_EMAIL = "email: already exists"
+
+CONTENT_TYPES = {
+    "text/csv": ImportFormat.CSV,
+    "application/csv": ImportFormat.CSV,
+    "application/jsonl": ImportFormat.JSONL,
+    "application/x-ndjson": ImportFormat.JSONL,
+    "application/x-jsonlines": ImportFormat.JSONL,
+}
+
+
+def format_from_content_type(content_type: Optional[str]) -> Optional[ImportFormat]:
+    """
+    Визначає формат імпорту за заголовком Content-Type.
+
+    :param content_type: Значення заголовка.
+    :return: Формат або None, якщо тип не підтримується.
+    """
+    if not content_type:
+        return None
+    return CONTENT_TYPES.get(content_type.split(";")[0].strip().lower())
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Optional[str]]:
+    """
+    Ділить потік байтів на рядки тексту UTF-8 (BOM на початку ігнорується).
+
+    Рядок, довший за ``MAX_RECORD_LENGTH`` символів, не накопичується в
+    пам'яті: його символи відкидаються до наступного кінця рядка, а замість
+    нього повертається None.
+
+    :param chunks: Асинхронний потік частин тіла запиту.
+    :return: Асинхронний ітератор рядків без символів кінця рядка
+        (None — задовгий рядок).
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    tail = ""
+    skipping = False
+    async for chunk in chunks:
+        lines = (tail + decoder.decode(chunk)).split("\n")
+        tail = lines.pop()
+        for line in lines:
+            too_long = skipping or len(line) > MAX_RECORD_LENGTH
+            skipping = False
+            yield None if too_long else line.rstrip("\r")
+        if skipping or len(tail) > MAX_RECORD_LENGTH:
+            skipping, tail = True, ""
+    tail += decoder.decode(b"", final=True)
+    if skipping or len(tail) > MAX_RECORD_LENGTH:
+        yield None
+    elif tail:
+        yield tail.rstrip("\r")
+
+
+async def _csv_records(lines: AsyncIterator[Optional[str]]) -> AsyncIterator[Union[dict, str]]:
+    header: Optional[List[str]] = None
+    record: List[str] = []
+    length = quotes = 0
+    async for line in lines:
+        if line is None:
+            record, length = [], MAX_RECORD_LENGTH + 1
+        else:
+            quotes += line.count('"')
+            length += len(line) + 1
+            if length > MAX_RECORD_LENGTH:
+                record = []
+            else:
+                record.append(line)
+        if quotes % 2:
+            continue
+        too_long = length > MAX_RECORD_LENGTH
+        text = "\n".join(record)
+        record, length, quotes = [], 0, 0
+        if too_long:
+            yield RECORD_TOO_LONG
+            continue
+        if not text.strip():
+            continue
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield f"expected {len(header)} columns, got {len(values)}"
+            continue
+        yield {name: value or None for name, value in zip(header, values)}
+    if length:
+        yield "unterminated quoted field"
+
+
+async def _jsonl_records(lines: AsyncIterator[Optional[str]]) -> AsyncIterator[Union[dict, str]]:
+    async for line in lines:
+        if line is None:
+            yield RECORD_TOO_LONG
+            continue
+        if not line.strip():
+            continue
+        try:
+            value = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield f"invalid JSON: {e.msg}"
+            continue
+        yield value if isinstance(value, dict) else "expected a JSON object"
+
+
+def _validate(record: Union[dict, str]) -> Tuple[Optional[dict], List[str]]:
+    if isinstance(record, str):
+        return None, [record]
+    try:
+        return ContactCreate(**record).dict(), []
+    except ValidationError as e:
+        return None, [
+            f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors()
+        ]
+
+
+async def import_contacts(
+    chunks: AsyncIterator[bytes],
+    fmt: ImportFormat,
+    user_id: int,
+    db: AsyncSession,
+) -> ContactImportResult:
+    """
+    Імпортує контакти з потоку, вставляючи їх пакетами.
+
+    Кожен пакет фіксується окремою транзакцією. Контакт з email, який
+    користувач уже має (або який повторюється у файлі), пропускається базою
+    (``ON CONFLICT DO NOTHING``) і потрапляє у звіт як помилковий. Номери
+    рядків у звіті рахуються від першого запису даних (рядок заголовка CSV
+    не враховується).
+
+    :param chunks: Асинхронний потік частин тіла запиту.
+    :param fmt: Формат даних.
+    :param user_id: ID власника контактів.
+    :param db: Сесія бази даних.
+    :return: Кількість вставлених і відхилених рядків та перші помилки.
+    """
+    parse = _csv_records if fmt == ImportFormat.CSV else _jsonl_records
+    result = ContactImportResult(inserted=0, failed=0, errors=[])
+    batch: List[dict] = []
+    rows: List[int] = []
+
+    def reject(row: int, errors: List[str]) -> None:
+        result.failed += 1
+        if len(result.errors) < MAX_REPORTED_ERRORS:
+            result.errors.append(ContactImportError(row=row, errors=errors))
+
+    async def flush() -> None:
+        stmt = insert_or_skip(Contact, db, Contact.user_id, Contact.email).returning(Contact.email)
+        inserted = Counter((await db.execute(stmt, batch)).scalars().all())
+        await db.commit()
+        for row, values in zip(rows, batch):
+            if inserted[values["email"]]:
+                inserted[values["email"]] -= 1
+                result.inserted += 1
+            else:
+                reject(row, [DUPLICATE_EMAIL])
+        batch.clear()
+        rows.clear()
+
+    row = 0
+    async for record in parse(iter_lines(chunks)):
+        row += 1
+        values, errors = _validate(record)
+        if errors:
+            reject(row, errors)
+            continue
+        batch.append({**values, "birthday_key": birthday_key(values["birthday"]), "user_id": user_id})
+        rows.append(row)
+        if len(batch) >= BATCH_SIZE:
+            await flush()
+    if batch:
+        await flush()
+    return result
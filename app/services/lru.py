@@ -0,0 +1,107 @@
+"""
+Модуль невеликого LRU-кешу з обмеженим часом життя записів у пам'яті процесу.
+
+Кеш не потокобезпечний і призначений для використання з одного циклу подій.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    LRU-кеш з обмеженою кількістю записів і часом життя кожного запису.
+
+    Коли кеш переповнений, витісняється запис, який найдовше не використовувався.
+    Прострочені записи видаляються під час звернення до них.
+
+    :param maxsize: Максимальна кількість записів.
+    :param ttl: Час життя запису за замовчуванням у секундах.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        item = self._data.get(key)
+        return item is not None and item[0] > time.monotonic()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Повертає значення за ключем і позначає запис як нещодавно використаний.
+
+        :param key: Ключ.
+        :param default: Значення, якщо запису немає або він прострочений.
+        :return: Значення з кешу або ``default``.
+        """
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return default
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Записує значення, за потреби витісняючи найстаріші записи.
+
+        :param key: Ключ.
+        :param value: Значення.
+        :param ttl: Час життя запису в секундах (за замовчуванням — ``self.ttl``).
+        """
+        if self.maxsize <= 0:
+            return
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Видаляє запис, якщо він існує.
+
+        :param key: Ключ.
+        """
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Видаляє всі записи (лічильники зберігаються).
+        """
+        self._data.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Повертає знімок лічильників кешу.
+
+        :return: Словник з розміром, кількістю влучань і промахів, часткою влучань,
+            кількістю витіснених і прострочених записів.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
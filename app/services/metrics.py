@@ -0,0 +1,296 @@
+"""
+Модуль метрик застосунку.
+
+Метрики зберігаються в пам'яті процесу; кожен процес (worker) рахує власні
+значення, а Prometheus збирає їх з ``/metrics`` кожного процесу. Містить
+гістограми, метрики HTTP-запитів за шаблоном маршруту, тривалість викликів
+Redis і бази даних та ASGI middleware, що їх записує. Знімки пулу з'єднань
+і пулу хешування паролів передаються в :func:`render_prometheus` ззовні.
+"""
+
+import bisect
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+STATUS_CLASSES = {1: "1xx", 2: "2xx", 3: "3xx", 4: "4xx", 5: "5xx"}
+UNMATCHED_ROUTE = "<unmatched>"
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class Histogram:
+    """
+    Гістограма з фіксованими межами кошиків (у секундах).
+
+    :param buckets: Верхні межі кошиків у порядку зростання.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Додає спостереження.
+
+        :param value: Значення (наприклад, тривалість у секундах).
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> Dict[str, int]:
+        """
+        Повертає накопичувальні лічильники за верхніми межами кошиків.
+
+        :return: Словник ``{"0.001": n, ..., "+Inf": count}``.
+        """
+        result, total = {}, 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            result["+Inf" if bound == float("inf") else repr(bound)] = total
+        return result
+
+    def snapshot(self) -> Dict[str, object]:
+        """
+        Повертає знімок гістограми.
+
+        :return: Кількість, сума і накопичувальні лічильники кошиків.
+        """
+        return {"count": self.count, "sum": self.sum, "buckets": self.cumulative()}
+
+
+class CallMetrics:
+    """
+    Гістограми тривалості викликів зовнішніх сервісів за назвою операції.
+    """
+
+    def __init__(self):
+        self.histograms: Dict[str, Histogram] = {}
+
+    def observe(self, operation: str, seconds: float) -> None:
+        """
+        Записує тривалість виклику.
+
+        :param operation: Назва операції (команда Redis, тип SQL запиту).
+        :param seconds: Тривалість у секундах.
+        """
+        histogram = self.histograms.get(operation)
+        if histogram is None:
+            histogram = self.histograms[operation] = Histogram()
+        histogram.observe(seconds)
+
+
+class RouteStats:
+    """
+    Лічильники одного маршруту: кількість відповідей за класом статусу і гістограма затримки.
+    """
+
+    __slots__ = ("statuses", "latency")
+
+    def __init__(self):
+        self.statuses = [0] * 7
+        self.latency = Histogram()
+
+    def status_counts(self) -> Dict[str, int]:
+        """
+        Повертає ненульові лічильники відповідей за класом статусу.
+
+        :return: Словник ``{"2xx": n, ...}``.
+        """
+        names = ("other",) + tuple(STATUS_CLASSES.values()) + ("other",)
+        counts: Dict[str, int] = {}
+        for name, count in zip(names, self.statuses):
+            if count:
+                counts[name] = counts.get(name, 0) + count
+        return counts
+
+
+class HTTPMetrics:
+    """
+    Метрики HTTP-запитів за шаблоном маршруту (``/contacts/{contact_id}``).
+
+    Запити, що не відповідають жодному маршруту, об'єднуються під міткою
+    ``UNMATCHED_ROUTE``, щоб довільні шляхи не створювали нових рядів.
+    """
+
+    def __init__(self):
+        self.routes: Dict[Tuple[str, str], RouteStats] = {}
+        self.active: Dict[int, dict] = {}
+
+    def record(self, method: str, route: str, status: int, seconds: float) -> None:
+        """
+        Записує завершений запит.
+
+        :param method: HTTP метод.
+        :param route: Шаблон маршруту.
+        :param status: Код статусу відповіді.
+        :param seconds: Тривалість обробки.
+        """
+        stats = self.routes.get((method, route))
+        if stats is None:
+            stats = self.routes[(method, route)] = RouteStats()
+        stats.statuses[min(max(status // 100, 0), 6)] += 1
+        stats.latency.observe(seconds)
+
+    def in_flight(self) -> Dict[Tuple[str, str], int]:
+        """
+        Рахує запити, що обробляються зараз, за маршрутом.
+
+        Маршрут відомий лише після маршрутизації, тому запити, які ще її
+        не пройшли, рахуються під ``UNMATCHED_ROUTE``.
+
+        :return: Кількість запитів за парою (метод, маршрут).
+        """
+        counts: Dict[Tuple[str, str], int] = {}
+        for scope in list(self.active.values()):
+            key = (scope["method"], route_template(scope))
+            counts[key] = counts.get(key, 0) + 1
+        return counts
+
+
+http_metrics = HTTPMetrics()
+redis_metrics = CallMetrics()
+db_metrics = CallMetrics()
+queries_per_request = Histogram(QUERY_COUNT_BUCKETS)
+
+
+def route_template(scope: dict) -> str:
+    """
+    Повертає шаблон маршруту, знайденого для запиту.
+
+    :param scope: ASGI scope запиту.
+    :return: Шаблон шляху або ``UNMATCHED_ROUTE``.
+    """
+    route = scope.get("route")
+    return getattr(route, "path", UNMATCHED_ROUTE) if route is not None else UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware, що рахує запити, їхню тривалість і кількість запитів в обробці.
+
+    Реалізовано як «чисте» ASGI middleware (без ``BaseHTTPMiddleware``),
+    щоб накладні витрати на запит становили кілька мікросекунд.
+
+    :param app: ASGI застосунок.
+    :param metrics: Сховище метрик.
+    """
+
+    def __init__(self, app, metrics: HTTPMetrics = http_metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        active = self.metrics.active
+        key = id(scope)
+        active[key] = scope
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            del active[key]
+            self.metrics.record(scope["method"], route_template(scope), status, elapsed)
+
+
+def _escape(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: object) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _histogram_lines(name: str, histogram: Histogram, **labels: str) -> List[str]:
+    lines = [f"{name}_bucket{_labels(**labels, le=bound)} {count}" for bound, count in histogram.cumulative().items()]
+    lines.append(f"{name}_sum{_labels(**labels)} {histogram.sum}")
+    lines.append(f"{name}_count{_labels(**labels)} {histogram.count}")
+    return lines
+
+
+def _header(name: str, kind: str, description: str) -> List[str]:
+    return [f"# HELP {name} {description}", f"# TYPE {name} {kind}"]
+
+
+HASHER_METRICS = (
+    ("workers", "password_hash_workers", "gauge", "Password hashing threads."),
+    ("queue_depth", "password_hash_queue_depth", "gauge", "Password hash operations waiting for a thread."),
+    ("max_queue_depth", "password_hash_max_queue_depth", "gauge", "Largest password hash queue depth seen."),
+    ("in_flight", "password_hash_in_flight", "gauge", "Password hash operations running now."),
+    ("completed", "password_hash_completed_total", "counter", "Completed password hash operations."),
+    ("queue_wait_seconds_total", "password_hash_queue_wait_seconds_total", "counter",
+     "Total time password hash operations waited for a thread."),
+)
+
+
+def render_prometheus(pool: Optional[dict] = None, hasher: Optional[dict] = None) -> str:
+    """
+    Формує метрики процесу в текстовому форматі Prometheus.
+
+    :param pool: Знімок пулу з'єднань з базою (:meth:`app.database.pool.PoolMetrics.snapshot`).
+    :param hasher: Знімок пулу хешування паролів (:meth:`app.services.hashing.PasswordHasher.stats`).
+    :return: Текст для відповіді ``/metrics``.
+    """
+    lines = _header("http_requests_total", "counter", "HTTP requests by route template and status class.")
+    routes = sorted(http_metrics.routes.items())
+    for (method, route), stats in routes:
+        for status_class, count in sorted(stats.status_counts().items()):
+            lines.append(f"http_requests_total{_labels(method=method, route=route, status=status_class)} {count}")
+
+    lines += _header("http_request_duration_seconds", "histogram", "HTTP request latency by route template.")
+    for (method, route), stats in routes:
+        lines += _histogram_lines("http_request_duration_seconds", stats.latency, method=method, route=route)
+
+    lines += _header("http_requests_in_flight", "gauge", "HTTP requests being processed.")
+    for (method, route), count in sorted(http_metrics.in_flight().items()):
+        lines.append(f"http_requests_in_flight{_labels(method=method, route=route)} {count}")
+
+    for name, calls, label, description in (
+        ("redis_command_duration_seconds", redis_metrics, "command", "Redis command latency."),
+        ("db_query_duration_seconds", db_metrics, "statement", "SQL statement latency by statement type."),
+    ):
+        lines += _header(name, "histogram", description)
+        for operation, histogram in sorted(calls.histograms.items()):
+            lines += _histogram_lines(name, histogram, **{label: operation})
+
+    lines += _header("db_queries_per_request", "histogram", "SQL statements issued per HTTP request.")
+    lines += _histogram_lines("db_queries_per_request", queries_per_request)
+
+    if pool is not None:
+        for key, kind in (
+            ("checkedout", "gauge"), ("checkedin", "gauge"), ("overflow", "gauge"), ("size", "gauge"),
+            ("checkouts", "counter"), ("timeouts", "counter"),
+            ("connections_opened", "counter"), ("connections_closed", "counter"),
+        ):
+            if pool.get(key) is not None:
+                name = f"db_pool_{key}" + ("_total" if kind == "counter" else "")
+                lines += _header(name, kind, f"Database connection pool {key.replace('_', ' ')}.")
+                lines.append(f"{name} {pool[key]}")
+        wait = pool["wait_seconds"]
+        lines += _header("db_pool_wait_seconds", "histogram", "Time spent waiting for a pooled connection.")
+        lines += [f"db_pool_wait_seconds_bucket{_labels(le=b)} {c}" for b, c in wait["buckets"].items()]
+        lines += [f"db_pool_wait_seconds_sum {wait['sum']}", f"db_pool_wait_seconds_count {wait['count']}"]
+
+    if hasher is not None:
+        for key, name, kind, description in HASHER_METRICS:
+            lines += _header(name, kind, description)
+            lines.append(f"{name} {hasher[key]}")
+    return "\n".join(lines) + "\n"
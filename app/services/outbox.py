@@ -0,0 +1,307 @@
+"""
+Модуль обробника черги вихідної пошти (outbox).
+
+Листи зберігаються в таблиці ``email_outbox`` у момент постановки в чергу,
+а окремий асинхронний обробник забирає їх пакетами й надсилає через пул
+SMTP з'єднань. Пакет захоплюється одним запитом ``UPDATE ... RETURNING``
+(у PostgreSQL — з ``FOR UPDATE SKIP LOCKED``), тож кілька обробників не
+надсилають той самий лист. Захоплений лист «орендується» до
+``next_attempt_at``; якщо обробник зупинився посеред надсилання, лист
+повертається в чергу після завершення оренди (доставка «щонайменше один раз»).
+Оренда розрахована на найгірший час надсилання всього пакета через пул,
+тож вона не закінчується, поки пакет ще надсилається.
+Невдалі спроби повторюються з експоненційною затримкою.
+
+Запуск окремим процесом::
+
+    python -m app.services.outbox
+"""
+
+import asyncio
+import logging
+import math
+import random
+import signal
+import time
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+from email.utils import formataddr
+from typing import Dict, List, Optional
+
+from sqlalchemy import case, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.conf.config import settings
+from app.database.db import AsyncSessionLocal
+from app.models.models import EmailOutbox, OutboxStatus
+from app.services.smtp_pool import SMTPPool
+
+logger = logging.getLogger(__name__)
+
+LEASE_MARGIN_SECONDS = 30
+STATS_INTERVAL = 60
+MAX_ERROR_LENGTH = 500
+
+_worker_task: Optional[asyncio.Task] = None
+_worker_stop: Optional[asyncio.Event] = None
+
+
+def build_message(recipient: str, subject: str, body: str) -> EmailMessage:
+    """
+    Формує лист від імені застосунку.
+
+    :param recipient: Адреса отримувача.
+    :param subject: Тема.
+    :param body: Текст листа.
+    :return: Об'єкт листа.
+    """
+    message = EmailMessage()
+    message["From"] = formataddr((settings.mail_from_name, settings.mail_from))
+    message["To"] = recipient
+    message["Subject"] = subject
+    message.set_content(body)
+    return message
+
+
+def default_pool() -> SMTPPool:
+    """
+    Створює пул SMTP з'єднань з налаштувань застосунку.
+
+    :return: Пул з'єднань.
+    """
+    return SMTPPool(
+        hostname=settings.mail_server,
+        port=settings.mail_port,
+        size=settings.smtp_pool_size,
+        username=settings.mail_username if settings.mail_use_credentials else None,
+        password=settings.mail_password,
+        start_tls=settings.mail_starttls,
+        use_tls=settings.mail_ssl_tls,
+        validate_certs=settings.mail_validate_certs,
+    )
+
+
+class OutboxWorker:
+    """
+    Обробник черги вихідної пошти з метриками доставки.
+
+    :param pool: Пул SMTP з'єднань.
+    :param session_factory: Фабрика сесій бази даних.
+    :param batch_size: Кількість листів за один прохід.
+    :param poll_interval: Пауза між перевірками порожньої черги в секундах.
+    :param max_attempts: Максимальна кількість спроб надсилання.
+    :param backoff_base: Базова затримка повторної спроби в секундах.
+    :param backoff_max: Максимальна затримка повторної спроби в секундах.
+
+    Пул надсилає пакет хвилями по ``pool.size`` листів, і кожен лист обмежений
+    ``pool.message_timeout``, тому оренда пакета ``lease_seconds`` дорівнює
+    ``ceil(batch_size / pool.size) * pool.message_timeout`` плюс запас
+    ``LEASE_MARGIN_SECONDS``.
+    """
+
+    def __init__(
+        self,
+        pool: SMTPPool,
+        session_factory: sessionmaker = AsyncSessionLocal,
+        batch_size: int = settings.outbox_batch_size,
+        poll_interval: float = settings.outbox_poll_interval,
+        max_attempts: int = settings.outbox_max_attempts,
+        backoff_base: float = settings.outbox_backoff_base,
+        backoff_max: float = settings.outbox_backoff_max,
+    ):
+        self.pool = pool
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.lease_seconds = math.ceil(batch_size / pool.size) * pool.message_timeout + LEASE_MARGIN_SECONDS
+        self.batches = 0
+        self.sent = 0
+        self.retried = 0
+        self.failed = 0
+        self.delivery_seconds = 0.0
+
+    def backoff(self, attempts: int) -> float:
+        """
+        Повертає затримку перед наступною спробою (експоненційна з випадковим зсувом).
+
+        :param attempts: Кількість уже виконаних спроб.
+        :return: Затримка в секундах.
+        """
+        delay = min(self.backoff_base * 2 ** (attempts - 1), self.backoff_max)
+        return delay * random.uniform(0.8, 1.2)
+
+    async def _claim(self, db: AsyncSession) -> List:
+        now = datetime.utcnow()
+        await db.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.status == OutboxStatus.SENDING, EmailOutbox.next_attempt_at <= now)
+            .values(status=case(
+                (EmailOutbox.attempts >= self.max_attempts, literal(OutboxStatus.FAILED, EmailOutbox.status.type)),
+                else_=literal(OutboxStatus.PENDING, EmailOutbox.status.type),
+            ))
+            .execution_options(synchronize_session=False)
+        )
+        due = (
+            select(EmailOutbox.id)
+            .where(EmailOutbox.status == OutboxStatus.PENDING, EmailOutbox.next_attempt_at <= now)
+            .order_by(EmailOutbox.next_attempt_at)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        result = await db.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.id.in_(due.scalar_subquery()))
+            .values(
+                status=OutboxStatus.SENDING,
+                attempts=EmailOutbox.attempts + 1,
+                next_attempt_at=now + timedelta(seconds=self.lease_seconds),
+            )
+            .returning(EmailOutbox.id, EmailOutbox.recipient, EmailOutbox.subject, EmailOutbox.body, EmailOutbox.attempts)
+            .execution_options(synchronize_session=False)
+        )
+        rows = result.all()
+        await db.commit()
+        return rows
+
+    async def _deliver(self, row) -> Optional[str]:
+        started = time.perf_counter()
+        try:
+            await self.pool.send(build_message(row.recipient, row.subject, row.body))
+        except Exception as e:
+            return f"{type(e).__name__}: {e}"[:MAX_ERROR_LENGTH]
+        finally:
+            self.delivery_seconds += time.perf_counter() - started
+        return None
+
+    async def run_once(self) -> int:
+        """
+        Захоплює і надсилає один пакет листів.
+
+        :return: Кількість оброблених листів.
+        """
+        async with self.session_factory() as db:
+            rows = await self._claim(db)
+            if not rows:
+                return 0
+            errors = await asyncio.gather(*(self._deliver(row) for row in rows))
+
+            now = datetime.utcnow()
+            sent_ids = [row.id for row, error in zip(rows, errors) if error is None]
+            if sent_ids:
+                await db.execute(
+                    update(EmailOutbox)
+                    .where(EmailOutbox.id.in_(sent_ids))
+                    .values(status=OutboxStatus.SENT, sent_at=now, last_error=None)
+                    .execution_options(synchronize_session=False)
+                )
+            for row, error in zip(rows, errors):
+                if error is None:
+                    continue
+                final = row.attempts >= self.max_attempts
+                await db.execute(
+                    update(EmailOutbox)
+                    .where(EmailOutbox.id == row.id)
+                    .values(
+                        status=OutboxStatus.FAILED if final else OutboxStatus.PENDING,
+                        next_attempt_at=now + timedelta(seconds=self.backoff(row.attempts)),
+                        last_error=error,
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                if final:
+                    self.failed += 1
+                    logger.error("Giving up on email %s to %s: %s", row.id, row.recipient, error)
+                else:
+                    self.retried += 1
+            await db.commit()
+
+        self.batches += 1
+        self.sent += len(sent_ids)
+        return len(rows)
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """
+        Обробляє чергу, доки не буде встановлено ``stop``.
+
+        Повні пакети обробляються без паузи; після неповного пакета обробник
+        чекає ``poll_interval``. Метрики періодично записуються в журнал.
+
+        :param stop: Подія зупинки.
+        """
+        logged_at = time.monotonic()
+        while not stop.is_set():
+            try:
+                processed = await self.run_once()
+            except Exception:
+                logger.exception("Outbox batch failed")
+                processed = 0
+            if time.monotonic() - logged_at >= STATS_INTERVAL:
+                logger.info("Outbox stats: %s", self.stats())
+                logged_at = time.monotonic()
+            if processed < self.batch_size:
+                try:
+                    await asyncio.wait_for(stop.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+        await self.pool.close()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Повертає знімок метрик доставки.
+
+        :return: Кількість пакетів, надісланих, повторених і остаточно невдалих листів,
+            відкритих SMTP з'єднань та сумарний час доставки.
+        """
+        return {
+            "batches": self.batches,
+            "sent": self.sent,
+            "retried": self.retried,
+            "failed": self.failed,
+            "smtp_connections_opened": self.pool.connections_opened,
+            "delivery_seconds_total": self.delivery_seconds,
+        }
+
+
+def start_outbox_worker() -> None:
+    """
+    Запускає обробник у циклі подій веб-застосунку (``OUTBOX_WORKER_IN_APP``).
+    """
+    global _worker_task, _worker_stop
+    if _worker_task is None or _worker_task.done():
+        _worker_stop = asyncio.Event()
+        _worker_task = asyncio.create_task(OutboxWorker(default_pool()).run(_worker_stop))
+
+
+async def stop_outbox_worker() -> None:
+    """
+    Зупиняє обробник, запущений у веб-застосунку, дочекавшись поточного пакета.
+    """
+    global _worker_task, _worker_stop
+    if _worker_task is not None:
+        _worker_stop.set()
+        await _worker_task
+        _worker_task = None
+        _worker_stop = None
+
+
+async def main() -> None:
+    """
+    Точка входу окремого процесу обробника; зупиняється за SIGINT/SIGTERM.
+    """
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    worker = OutboxWorker(default_pool())
+    logger.info("Outbox worker started")
+    await worker.run(stop)
+    logger.info("Outbox worker stopped: %s", worker.stats())
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    asyncio.run(main())
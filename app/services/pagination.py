@@ -0,0 +1,102 @@
+"""
+Модуль курсорної (keyset) пагінації.
+
+Курсор — непрозорий рядок (base64url від JSON), що містить ключ сортування
+та значення стовпців сортування останнього рядка сторінки. Наступна сторінка
+вибирається умовою ``(col1, col2, ...) > (v1, v2, ...)`` замість OFFSET,
+тому вартість сторінки N не залежить від N.
+
+Стовпці сортування можуть містити NULL. Сортування лишається природним
+для бази (щоб працювали індекси): у PostgreSQL NULL більший за будь-яке
+значення, у SQLite — менший. Якщо курсор містить NULL або NULL-рядки
+йдуть після курсора, умова розгортається в лексикографічну форму з
+явними ``IS NULL``.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, List, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, false, or_, tuple_
+
+
+def encode_cursor(sort: str, values: Sequence[Any]) -> str:
+    """
+    Кодує курсор для наступної сторінки.
+
+    :param sort: Ключ сортування, для якого створено курсор.
+    :param values: Значення стовпців сортування останнього рядка сторінки.
+    :return: Непрозорий рядок курсора.
+    """
+    raw = json.dumps({"s": sort, "k": list(values)}, separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> List[Any]:
+    """
+    Декодує курсор і перевіряє, що він відповідає поточному сортуванню.
+
+    :param cursor: Рядок курсора з параметра ``after``.
+    :param sort: Поточний ключ сортування.
+    :return: Значення стовпців сортування.
+    :raises HTTPException: Якщо курсор пошкоджений або створений для іншого сортування.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = data["k"]
+        valid = data["s"] == sort and isinstance(values, list)
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        valid = False
+    if not valid:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return values
+
+
+def nulls_largest(dialect_name: str) -> bool:
+    """
+    Визначає, чи NULL сортується після всіх значень при зростаючому порядку.
+
+    :param dialect_name: Назва діалекту SQLAlchemy.
+    :return: True для PostgreSQL, False для SQLite та інших.
+    """
+    return dialect_name == "postgresql"
+
+
+def _after(column: Any, value: Any, descending: bool, nulls_after: bool):
+    if value is None:
+        return false() if nulls_after else column.is_not(None)
+    after = column < value if descending else column > value
+    return or_(after, column.is_(None)) if nulls_after else after
+
+
+def keyset_condition(
+    columns: Sequence[Any], values: Sequence[Any], descending: bool = False, nulls_last: bool = False
+):
+    """
+    Будує умову «рядки після курсора» для заданих стовпців сортування.
+
+    :param columns: Стовпці сортування (останній має бути унікальним, наприклад id).
+    :param values: Значення з курсора.
+    :param descending: Чи сортування спадне.
+    :param nulls_last: Чи NULL сортується після значень при зростаючому порядку
+        (див. :func:`nulls_largest`).
+    :return: SQL-вираз для ``where``.
+    :raises HTTPException: Якщо значення курсора не відповідають стовпцям.
+    """
+    if len(values) != len(columns) or not all(
+        column.expression.nullable if value is None else isinstance(value, column.type.python_type)
+        for column, value in zip(columns, values)
+    ):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    nulls_after = nulls_last != descending
+    if not nulls_after and None not in values:
+        left, right = tuple_(*columns), tuple_(*values)
+        return left < right if descending else left > right
+    branches = []
+    for i, (column, value) in enumerate(zip(columns, values)):
+        equal = [c.is_(None) if v is None else c == v for c, v in zip(columns[:i], values[:i])]
+        branches.append(and_(*equal, _after(column, value, descending, nulls_after)))
+    return or_(*branches)
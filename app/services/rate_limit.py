@@ -0,0 +1,254 @@
+"""
+Модуль спільного обмеження частоти запитів (rate limiting) на базі Redis.
+
+Використовується алгоритм ковзного вікна з двома лічильниками: кількість
+запитів у поточному фіксованому інтервалі додається до кількості
+в попередньому, зваженої на ту частку попереднього інтервалу, що ще
+потрапляє у вікно. Перевірка і збільшення лічильника виконуються одним
+Lua-скриптом атомарно, а час береться з годинника Redis, тож ліміт спільний
+для всіх процесів і серверів.
+
+Кожен запит коштує не більше одного звернення до Redis: скрипт надсилається
+через ``EVALSHA`` в одному конвеєрі з читанням знімка користувача, якого ще
+немає в кеші пам'яті процесу. Якщо Redis недоступний, ліміти тимчасово
+рахуються в пам'яті процесу (``RATE_LIMIT_BACKEND=local`` вмикає цей режим
+постійно).
+"""
+
+import hashlib
+import logging
+import math
+import time
+from typing import Awaitable, Callable, NamedTuple, Optional, Tuple
+
+from aioredis.exceptions import NoScriptError, RedisError
+from fastapi import HTTPException, Request, Response, status
+
+from app.conf.config import settings
+from app.repository.user_cache import prime_local_user, user_prefetch_key
+from app.services.auth import auth_service
+from app.services.cache import redis
+from app.services.lru import TTLCache
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_PREFIX = "rl:"
+REDIS_RETRY_DELAY = 5.0
+LOCAL_MAX_KEYS = 100_000
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+SLIDING_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local bucket = math.floor(now / window)
+local into = now - bucket * window
+local current_key = KEYS[1] .. ':' .. bucket
+local previous = tonumber(redis.call('GET', KEYS[1] .. ':' .. (bucket - 1)) or '0')
+local current = tonumber(redis.call('GET', current_key) or '0')
+local used = previous * (window - into) / window + current
+if used + 1 > limit then
+    local retry = window - into
+    if previous > 0 and current + 1 <= limit then
+        retry = math.ceil(window * (1 - (limit - current - 1) / previous)) - into
+    end
+    return {0, 0, retry}
+end
+if redis.call('INCR', current_key) == 1 then
+    redis.call('PEXPIRE', current_key, window * 2)
+end
+return {1, math.floor(limit - used - 1), 0}
+"""
+SLIDING_WINDOW_SHA = hashlib.sha1(SLIDING_WINDOW_SCRIPT.encode()).hexdigest()
+
+
+class RateLimitRule(NamedTuple):
+    """
+    Правило ліміту: ``limit`` запитів за ``window`` секунд.
+    """
+
+    limit: int
+    window: int
+
+    @classmethod
+    def parse(cls, rule: str) -> "RateLimitRule":
+        """
+        Розбирає правило у форматі ``"5/minute"`` або ``"100/10 seconds"``.
+
+        :param rule: Текст правила.
+        :return: Правило.
+        :raises ValueError: Якщо правило має неправильний формат.
+        """
+        count, _, period = rule.partition("/")
+        amount, _, unit = period.strip().rpartition(" ")
+        unit = unit.rstrip("s")
+        if unit not in PERIODS or not count.strip().isdigit():
+            raise ValueError(f"Invalid rate limit rule: {rule!r}")
+        return cls(int(count), PERIODS[unit] * int(amount or 1))
+
+
+class RateLimitResult(NamedTuple):
+    """
+    Результат перевірки ліміту.
+    """
+
+    allowed: bool
+    remaining: int
+    retry_after: float
+
+
+class LocalSlidingWindow:
+    """
+    Той самий алгоритм ковзного вікна в пам'яті процесу.
+
+    Використовується як запасний варіант, коли Redis недоступний.
+    Лічильники зберігаються в :class:`app.services.lru.TTLCache`: запис живе
+    два вікна (як ключі в Redis), а кількість ключів обмежена ``maxsize``,
+    тож анонімний трафік з багатьох IP не збільшує пам'ять без меж.
+
+    :param maxsize: Максимальна кількість ключів ліміту в пам'яті.
+    """
+
+    def __init__(self, maxsize: int = LOCAL_MAX_KEYS):
+        self._buckets = TTLCache(maxsize, 0)
+
+    def hit(self, key: str, rule: RateLimitRule) -> RateLimitResult:
+        """
+        Перевіряє ліміт і, якщо запит дозволено, збільшує лічильник.
+
+        :param key: Ключ ліміту.
+        :param rule: Правило.
+        :return: Результат перевірки.
+        """
+        window = rule.window * 1000
+        now = int(time.time() * 1000)
+        bucket, into = divmod(now, window)
+        stored_bucket, previous, current = self._buckets.get(key, (bucket, 0, 0))
+        if stored_bucket != bucket:
+            previous = current if stored_bucket == bucket - 1 else 0
+            current = 0
+        used = previous * (window - into) / window + current
+        if used + 1 > rule.limit:
+            retry = window - into
+            if previous and current + 1 <= rule.limit:
+                retry = math.ceil(window * (1 - (rule.limit - current - 1) / previous)) - into
+            self._buckets.set(key, (bucket, previous, current), rule.window * 2)
+            return RateLimitResult(False, 0, retry / 1000)
+        self._buckets.set(key, (bucket, previous, current + 1), rule.window * 2)
+        return RateLimitResult(True, math.floor(rule.limit - used - 1), 0.0)
+
+    def clear(self) -> None:
+        """
+        Видаляє всі лічильники.
+        """
+        self._buckets.clear()
+
+
+class RateLimiter:
+    """
+    Спільний обмежувач частоти запитів.
+
+    :param backend: ``redis`` — спільні ліміти в Redis; ``local`` — лише в пам'яті процесу.
+    :param enabled: Чи перевіряти ліміти взагалі.
+    """
+
+    def __init__(self, backend: str = "redis", enabled: bool = True):
+        self.backend = backend
+        self.enabled = enabled
+        self.local = LocalSlidingWindow()
+        self._redis_down_until = 0.0
+
+    async def hit(
+        self, key: str, rule: RateLimitRule, prefetch: Optional[str] = None
+    ) -> Tuple[RateLimitResult, Optional[str]]:
+        """
+        Перевіряє ліміт і заодно читає ключ ``prefetch`` в тому ж конвеєрі Redis.
+
+        Після помилки Redis обмежувач на ``REDIS_RETRY_DELAY`` секунд
+        переходить на лічильники в пам'яті процесу, не чекаючи на Redis
+        у кожному запиті.
+
+        :param key: Ключ ліміту (без префікса).
+        :param rule: Правило.
+        :param prefetch: Ключ Redis, який потрібно прочитати наперед.
+        :return: Результат перевірки і значення ключа ``prefetch``.
+        """
+        if self.backend == "local" or time.monotonic() < self._redis_down_until:
+            return self.local.hit(key, rule), None
+        try:
+            return await self._redis_hit(RATE_LIMIT_PREFIX + "{" + key + "}", rule, prefetch)
+        except (RedisError, OSError):
+            logger.warning("Rate limiter falls back to local counters", exc_info=True)
+            self._redis_down_until = time.monotonic() + REDIS_RETRY_DELAY
+            return self.local.hit(key, rule), None
+
+    async def _redis_hit(
+        self, key: str, rule: RateLimitRule, prefetch: Optional[str]
+    ) -> Tuple[RateLimitResult, Optional[str]]:
+        args = (rule.limit, rule.window * 1000)
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.evalsha(SLIDING_WINDOW_SHA, 1, key, *args)
+            if prefetch:
+                pipe.get(prefetch)
+            replies = await pipe.execute(raise_on_error=False)
+        outcome = replies[0]
+        if isinstance(outcome, NoScriptError):
+            outcome = await redis.eval(SLIDING_WINDOW_SCRIPT, 1, key, *args)
+        elif isinstance(outcome, Exception):
+            raise outcome
+        allowed, remaining, retry = outcome
+        cached = replies[1] if prefetch and not isinstance(replies[1], Exception) else None
+        return RateLimitResult(bool(allowed), int(remaining), int(retry) / 1000), cached
+
+
+limiter = RateLimiter(settings.rate_limit_backend, settings.rate_limit_enabled)
+
+
+def _token_subject(request: Request) -> Optional[str]:
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    return auth_service.decode_token(token)
+
+
+def rate_limit(rule: str, scope: Optional[str] = None, per_user: bool = True) -> Callable[..., Awaitable[None]]:
+    """
+    Створює залежність FastAPI, що обмежує частоту запитів до маршруту.
+
+    Ліміт рахується окремо для кожного маршруту (або для спільного ``scope``)
+    і кожного користувача з валідним access токеном, а для анонімних запитів —
+    для кожної IP-адреси. Для користувача, якого немає в кеші пам'яті процесу,
+    його знімок читається в тому ж конвеєрі Redis, тож наступна перевірка
+    токена не звертається до Redis вдруге.
+
+    :param rule: Правило у форматі ``"5/minute"``.
+    :param scope: Назва спільного ліміту (за замовчуванням — метод і шлях маршруту).
+    :param per_user: Рахувати ліміт за користувачем, якщо запит автентифіковано.
+    :return: Залежність, яка додає заголовки ``X-RateLimit-*``.
+    :raises ValueError: Якщо правило має неправильний формат.
+    """
+    parsed = RateLimitRule.parse(rule)
+
+    async def dependency(request: Request, response: Response) -> None:
+        if not limiter.enabled:
+            return
+        route = request.scope.get("route")
+        name = scope or f"{request.method}:{getattr(route, 'path', request.url.path)}"
+        email = _token_subject(request) if per_user else None
+        if email:
+            identity, prefetch = f"user:{email}", user_prefetch_key(email)
+        else:
+            identity, prefetch = f"ip:{request.client.host if request.client else 'unknown'}", None
+
+        result, cached = await limiter.hit(f"{name}:{identity}", parsed, prefetch)
+        if prefetch:
+            prime_local_user(email, cached)
+        headers = {"X-RateLimit-Limit": str(parsed.limit), "X-RateLimit-Remaining": str(result.remaining)}
+        if not result.allowed:
+            headers["Retry-After"] = str(max(1, math.ceil(result.retry_after)))
+            raise HTTPException(status.HTTP_429_TOO_MANY_REQUESTS, "Too many requests", headers=headers)
+        response.headers.update(headers)
+
+    return dependency
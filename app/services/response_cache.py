@@ -0,0 +1,188 @@
+"""
+Модуль кешу серіалізованих відповідей у Redis для читання контактів.
+
+Ключ запису містить ID користувача, версію його контактів (покоління) і хеш
+шляху та параметрів запиту. Зміна контактів замінює версію
+(:func:`app.services.cache.bump_contacts_version`), тож старі записи стають
+недосяжними й видаляються Redis за TTL, а явне очищення не потрібне.
+
+Від «тиснявки» (cache stampede) після промаху захищають два рівні:
+паралельні запити з тим самим ключем в одному процесі чекають на один
+обчислювальний виклик, а між процесами — короткий замок ``SET NX``; процеси,
+які не отримали замок, кілька разів перечитують ключ, перш ніж обчислити
+відповідь самостійно.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from typing import Awaitable, Callable, Dict, NamedTuple, Optional
+
+from aioredis.exceptions import RedisError
+from fastapi import Request, Response
+
+from app.conf.config import settings
+from app.services.cache import redis
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_PREFIX = "resp:"
+LOCK_POLL_INTERVAL = 0.02
+
+
+class CachedResponse(NamedTuple):
+    """
+    Серіалізована відповідь: тіло JSON і додаткові заголовки.
+    """
+
+    body: bytes
+    headers: Dict[str, str]
+
+    def to_response(self, response: Response) -> Response:
+        """
+        Створює відповідь, зберігаючи заголовки, вже додані до ``response``.
+
+        :param response: Відповідь залежностей маршруту (ETag, ліміти тощо).
+        :return: Відповідь JSON.
+        """
+        headers = {k: v for k, v in response.headers.items() if k != "content-length"}
+        return Response(content=self.body, media_type="application/json", headers={**headers, **self.headers})
+
+
+class ResponseCache:
+    """
+    Кеш відповідей з захистом від тиснявки і лічильниками влучань.
+
+    :param enabled: Чи використовувати кеш.
+    :param lock_ttl: Час життя замку обчислення в секундах; стільки ж інші процеси чекають на результат.
+    """
+
+    def __init__(self, enabled: bool, lock_ttl: float):
+        self.enabled = enabled
+        self.lock_ttl = lock_ttl
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.lock_waits = 0
+        self.errors = 0
+
+    @staticmethod
+    def key(user_id: int, version: str, request: Request) -> str:
+        """
+        Повертає ключ запису для запиту.
+
+        :param user_id: ID власника контактів.
+        :param version: Версія контактів користувача.
+        :param request: Запит.
+        :return: Ключ Redis.
+        """
+        query = "&".join(sorted(f"{k}={v}" for k, v in request.query_params.multi_items()))
+        digest = hashlib.sha256(f"{request.url.path}|{query}".encode()).hexdigest()[:32]
+        return f"{RESPONSE_CACHE_PREFIX}{user_id}:{version}:{digest}"
+
+    async def fetch(
+        self, key: str, ttl: int, produce: Callable[[], Awaitable[CachedResponse]]
+    ) -> CachedResponse:
+        """
+        Повертає відповідь з кешу або обчислює і зберігає її.
+
+        Якщо Redis недоступний, відповідь обчислюється без кешу.
+
+        :param key: Ключ запису.
+        :param ttl: Час життя запису в секундах.
+        :param produce: Функція, що обчислює відповідь.
+        :return: Серіалізована відповідь.
+        """
+        try:
+            cached = await self._get(key)
+        except (RedisError, OSError):
+            self.errors += 1
+            logger.warning("Response cache is unavailable", exc_info=True)
+            return await produce()
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.coalesced += 1
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._fill(key, ttl, produce)
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
+    async def _get(self, key: str) -> Optional[CachedResponse]:
+        raw = await redis.get(key)
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        return CachedResponse(data["body"].encode(), data["headers"])
+
+    async def _fill(self, key: str, ttl: int, produce: Callable[[], Awaitable[CachedResponse]]) -> CachedResponse:
+        lock = f"{key}:lock"
+        try:
+            locked = await redis.set(lock, "1", px=int(self.lock_ttl * 1000), nx=True)
+        except (RedisError, OSError):
+            self.errors += 1
+            return await produce()
+
+        if not locked:
+            deadline = time.monotonic() + self.lock_ttl
+            while time.monotonic() < deadline:
+                await asyncio.sleep(LOCK_POLL_INTERVAL)
+                try:
+                    cached = await self._get(key)
+                except (RedisError, OSError):
+                    self.errors += 1
+                    break
+                if cached is not None:
+                    self.lock_waits += 1
+                    return cached
+            return await produce()
+
+        try:
+            result = await produce()
+            payload = json.dumps({"body": result.body.decode(), "headers": result.headers})
+            await redis.set(key, payload, ex=ttl)
+            return result
+        finally:
+            try:
+                await redis.delete(lock)
+            except (RedisError, OSError):
+                self.errors += 1
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Повертає знімок лічильників кешу.
+
+        :return: Влучання, промахи, частка влучань, запити, що дочекалися результату
+            в цьому процесі або від іншого процесу, та помилки Redis.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "coalesced": self.coalesced,
+            "lock_waits": self.lock_waits,
+            "errors": self.errors,
+        }
+
+
+response_cache = ResponseCache(settings.response_cache_enabled, settings.response_cache_lock_ttl)
@@ -0,0 +1,120 @@
+"""
+Модуль повнотекстового та нечіткого пошуку контактів.
+
+Пошук виконується у два етапи:
+    1. точний — слова запиту як цілі слова або підрядки;
+    2. нечіткий — лише якщо точний етап нічого не знайшов; допускає
+       помилки в написанні завдяки триграмам.
+
+Запит будується під діалект бази даних:
+    - PostgreSQL: ``tsvector`` і ``ILIKE`` (точний етап), ``<%`` з pg_trgm
+      (нечіткий етап); ранг — ``ts_rank`` / ``word_similarity``.
+      Усі умови обслуговуються GIN-індексами.
+    - SQLite: FTS5-таблиця з токенізатором trigram; точний етап — усі слова
+      як підрядки, нечіткий — диз'юнкція триграм; ранг — ``bm25``.
+
+Запит має містити щонайменше ``MIN_QUERY_LENGTH`` символів без крайових
+пробілів: коротший рядок не має жодної триграми, тож жоден із індексів
+його не обслуговує і пошук перебирав би всі контакти користувача.
+
+Сторінки результатів вибираються через OFFSET: ранг обчислюється для
+кожного збігу під час запиту і не має індексу, тож база все одно оцінює
+всі збіги користувача, і keyset-умова за ``(rank, id)`` не зменшила б
+роботу. Глибина сторінки обмежена лише кількістю збігів, а не всіх контактів.
+"""
+
+from sqlalchemy import Select, String, and_, column, func, literal, literal_column, or_, select, table
+
+from app.models.models import Contact, SEARCH_DOCUMENT, SEARCH_TABLE
+
+MIN_TRIGRAM_LENGTH = 3
+MIN_QUERY_LENGTH = MIN_TRIGRAM_LENGTH
+
+
+def _quote(term: str) -> str:
+    """
+    Екранує термін для синтаксису запитів FTS5.
+
+    :param term: Довільний рядок користувача.
+    :return: Термін у подвійних лапках.
+    """
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _like_escape(q: str) -> str:
+    """
+    Екранує спеціальні символи шаблону LIKE.
+
+    :param q: Рядок користувача.
+    :return: Рядок, придатний для шаблону з ``escape="\\"``.
+    """
+    return q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def fts5_query(q: str, fuzzy: bool = False) -> str:
+    """
+    Будує FTS5-запит для слів запиту довжиною від 3 символів.
+
+    Точний режим вимагає всі слова як підрядки (AND); нечіткий — будь-яку
+    з їхніх триграм (OR), тож ранжування ``bm25`` відповідає схожості.
+    Якщо всі слова короткі, а весь запит — ні, шукається весь рядок як підрядок.
+
+    :param q: Пошуковий рядок.
+    :param fuzzy: Чи будувати нечіткий запит.
+    :return: Рядок для ``MATCH`` або порожній рядок, якщо всі слова коротші за 3 символи.
+    """
+    words = [w for w in dict.fromkeys(q.lower().split()) if len(w) >= MIN_TRIGRAM_LENGTH]
+    phrase = " ".join(q.lower().split())
+    if not words and len(phrase) >= MIN_TRIGRAM_LENGTH:
+        words = [phrase]
+    if not fuzzy:
+        return " AND ".join(_quote(w) for w in words)
+    trigrams = dict.fromkeys(
+        w[i:i + MIN_TRIGRAM_LENGTH] for w in words for i in range(len(w) - MIN_TRIGRAM_LENGTH + 1)
+    )
+    return " OR ".join(_quote(t) for t in trigrams)
+
+
+def _postgres_search(user_id: int, q: str, fuzzy: bool) -> Select:
+    document = literal_column(f"({SEARCH_DOCUMENT})")
+    stmt = select(Contact).where(Contact.user_id == user_id)
+    if fuzzy:
+        return stmt.where(literal(q, String).op("<%")(document)).order_by(
+            func.word_similarity(q, document).desc(), Contact.id
+        )
+    vector = func.to_tsvector(literal_column("'simple'"), document)
+    query = func.plainto_tsquery(literal_column("'simple'"), q)
+    return stmt.where(
+        or_(vector.op("@@")(query), document.ilike(f"%{_like_escape(q)}%", escape="\\"))
+    ).order_by(func.ts_rank(vector, query).desc(), Contact.id)
+
+
+def _sqlite_search(user_id: int, q: str, fuzzy: bool) -> Select:
+    match = fts5_query(q, fuzzy)
+    fts = table(SEARCH_TABLE, column("rowid"))
+    fts_table = literal_column(SEARCH_TABLE)
+    return (
+        select(Contact)
+        .join(fts, fts.c.rowid == Contact.id)
+        .where(and_(Contact.user_id == user_id, fts_table.op("MATCH")(match)))
+        .order_by(func.bm25(fts_table), Contact.id)
+    )
+
+
+def build_search_query(dialect: str, user_id: int, q: str, fuzzy: bool = False) -> Select:
+    """
+    Будує ранжований пошуковий запит контактів користувача.
+
+    :param dialect: Назва діалекту SQLAlchemy (``postgresql`` або ``sqlite``).
+    :param user_id: ID власника контактів.
+    :param q: Пошуковий рядок (ім'я, прізвище або email, повністю або частково).
+    :param fuzzy: Нечіткий етап (стійкий до помилок у написанні).
+    :return: Запит SELECT, відсортований за релевантністю.
+    :raises ValueError: Якщо рядок коротший за ``MIN_QUERY_LENGTH`` символів.
+    """
+    q = q.strip()
+    if len(q) < MIN_QUERY_LENGTH:
+        raise ValueError(f"Search query must contain at least {MIN_QUERY_LENGTH} characters")
+    if dialect == "postgresql":
+        return _postgres_search(user_id, q, fuzzy)
+    return _sqlite_search(user_id, q, fuzzy)
@@ -0,0 +1,42 @@
+"""
+Модуль швидкої серіалізації рядків контактів у JSON.
+
+Список контактів читається Core-запитом (``select`` стовпців, без ORM
+об'єктів, identity map і відстеження змін), рядки перевіряються схемою
+з полями :class:`app.schemas.schemas.ContactResponse` (email — як рядок,
+див. :mod:`app.services.fieldsets`) і серіалізуються одразу в байти
+Rust-кодувальником ``TypeAdapter.dump_json``, минаючи ``jsonable_encoder``
+і ``json.dumps``.
+
+Рядок, що не відповідає схемі (наприклад, NULL в обов'язковому полі),
+дає :class:`fastapi.exceptions.ResponseValidationError`, як і
+``response_model`` в інших маршрутах.
+"""
+
+from typing import Sequence
+
+from fastapi.exceptions import ResponseValidationError
+from pydantic import ValidationError
+from sqlalchemy import Row
+
+from app.services.fieldsets import CONTACT_FIELDS, Fields, contact_list_adapter
+
+
+def dump_rows(rows: Sequence[Row], fields: Fields = CONTACT_FIELDS) -> bytes:
+    """
+    Перевіряє рядки контактів схемою і серіалізує їх у JSON-масив.
+
+    Рядок має містити стовпці ``fields`` першими і в тому ж порядку;
+    додаткові стовпці після них (наприклад, ключ курсора) не потрапляють у відповідь.
+
+    :param rows: Рядки Core-запиту.
+    :param fields: Поля відповіді.
+    :return: JSON у байтах.
+    :raises ResponseValidationError: Якщо рядок не відповідає схемі.
+    """
+    adapter = contact_list_adapter(tuple(fields))
+    try:
+        contacts = adapter.validate_python([dict(zip(fields, row)) for row in rows])
+    except ValidationError as exc:
+        raise ResponseValidationError(errors=exc.errors(include_url=False), body=rows) from exc
+    return adapter.dump_json(contacts)
@@ -0,0 +1,122 @@
+"""
+Модуль пулу SMTP з'єднань.
+
+З'єднання відкриваються за потреби (не більше ``size`` одночасно), після
+надсилання повертаються в пул і повторно використовуються, тож рукостискання
+SMTP, STARTTLS і автентифікація виконуються один раз на з'єднання, а не на лист.
+"""
+
+import asyncio
+from email.message import EmailMessage
+from typing import List, Optional
+
+import aiosmtplib
+
+MESSAGE_TIMEOUT_STEPS = 3
+
+
+class SMTPPool:
+    """
+    Пул повторно використовуваних SMTP з'єднань.
+
+    :param hostname: Адреса SMTP сервера.
+    :param port: Порт SMTP сервера.
+    :param size: Максимальна кількість одночасних з'єднань.
+    :param username: Ім'я користувача (None — без автентифікації).
+    :param password: Пароль.
+    :param start_tls: Використовувати STARTTLS.
+    :param use_tls: Підключатися через TLS.
+    :param validate_certs: Перевіряти сертифікат сервера.
+    :param timeout: Тайм-аут операцій у секундах.
+
+    Надсилання одного листа (з'єднання, автентифікація і відправлення після
+    отримання вільного з'єднання) обмежене ``message_timeout`` —
+    ``MESSAGE_TIMEOUT_STEPS`` тайм-аутів операцій.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        size: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        start_tls: bool = False,
+        use_tls: bool = False,
+        validate_certs: bool = True,
+        timeout: float = 30,
+    ):
+        self.hostname = hostname
+        self.port = port
+        self.size = size
+        self.username = username
+        self.password = password
+        self.start_tls = start_tls
+        self.use_tls = use_tls
+        self.validate_certs = validate_certs
+        self.timeout = timeout
+        self.message_timeout = MESSAGE_TIMEOUT_STEPS * timeout
+        self._idle: List[aiosmtplib.SMTP] = []
+        self._slots = asyncio.Semaphore(size)
+        self.connections_opened = 0
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        smtp = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            start_tls=self.start_tls,
+            use_tls=self.use_tls,
+            validate_certs=self.validate_certs,
+            timeout=self.timeout,
+        )
+        await smtp.connect()
+        if self.username:
+            await smtp.login(self.username, self.password)
+        self.connections_opened += 1
+        return smtp
+
+    async def send(self, message: EmailMessage) -> None:
+        """
+        Надсилає лист через вільне з'єднання пулу.
+
+        Якщо збережене з'єднання було закрите сервером, лист один раз
+        надсилається повторно через нове з'єднання. Після будь-якої іншої
+        помилки, тайм-ауту чи скасування з'єднання закривається, а не
+        повертається в пул.
+
+        :param message: Лист.
+        :raises aiosmtplib.SMTPException: Якщо сервер відхилив лист.
+        :raises asyncio.TimeoutError: Якщо лист не надіслано за ``message_timeout``.
+        """
+        async with self._slots:
+            smtp = self._idle.pop() if self._idle else None
+            if smtp is not None and not smtp.is_connected:
+                smtp = None
+
+            async def deliver() -> None:
+                nonlocal smtp
+                try:
+                    smtp = smtp or await self._connect()
+                    await smtp.send_message(message)
+                except aiosmtplib.SMTPServerDisconnected:
+                    smtp = await self._connect()
+                    await smtp.send_message(message)
+
+            try:
+                await asyncio.wait_for(deliver(), self.message_timeout)
+            except BaseException:
+                if smtp is not None:
+                    smtp.close()
+                raise
+            self._idle.append(smtp)
+
+    async def close(self) -> None:
+        """
+        Закриває всі вільні з'єднання.
+        """
+        while self._idle:
+            smtp = self._idle.pop()
+            try:
+                await smtp.quit()
+            except Exception:
+                smtp.close()
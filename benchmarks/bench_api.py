@@ -0,0 +1,443 @@
+"""
+Навантажувальний бенчмарк API: пропускна здатність і затримки всіх основних маршрутів.
+
+Конкурентні клієнти (``--concurrency``) виконують запити до кожного сценарію:
+вхід, ``/users/me`` і всі маршрути контактів (список, курсорна сторінка,
+деталі, пошук, дні народження, експорт, імпорт, створення, оновлення,
+пакетне оновлення, видалення і пакетне видалення). Перед вимірюванням
+користувач отримує ``--contacts`` контактів. Для кожного сценарію
+рахуються запити за секунду, p50/p95/p99 і кількість помилок.
+
+Цілі:
+    - за замовчуванням застосунок викликається в цьому ж процесі через ASGI;
+    - ``--uvicorn`` запускає окремий процес uvicorn з тими ж змінними середовища;
+    - ``--base-url`` спрямовує запити на вже запущений сервер (потрібні ``--email``
+      і ``--password`` підтвердженого користувача; контакти імпортуються через API).
+
+Результати зберігаються в JSON (``--output``) і, якщо задано ``--baseline``,
+порівнюються з попереднім запуском: сценарій вважається регресією, якщо p95
+зріс або пропускна здатність впала більше ніж на ``--tolerance``. У такому
+разі скрипт завершується з кодом 1.
+
+У режимі ``TESTING=True`` застосунок працює з SQLite у пам'яті, де всі сесії
+ділять одне з'єднання, тож одночасні записи можуть завершуватися помилками;
+для показових чисел записів запускайте бенчмарк з PostgreSQL. Помилки
+рахуються за HTTP-статусом (599 — виняток клієнта або вичерпаний пул ID
+для видалення, якщо ``--contacts`` замалий).
+
+Запуск (з налаштованими змінними середовища застосунку та Redis)::
+
+    TESTING=True python -m benchmarks.bench_api --contacts 10000 --concurrency 20 --output bench.json
+    TESTING=True python -m benchmarks.bench_api --contacts 10000 --baseline bench.json
+"""
+
+import argparse
+import asyncio
+import csv
+import io
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from httpx import AsyncClient
+
+from benchmarks.common import contact_row, percentile, print_table
+
+logger = logging.getLogger(__name__)
+
+PASSWORD = "BenchPassword123"
+IMPORT_FIELDS = ["first_name", "last_name", "email", "phone", "birthday", "additional_info"]
+IMPORT_CHUNK = 5000
+HEAVY_DIVISOR = 10
+BATCH_UPDATE_SIZE = 20
+BATCH_DELETE_SIZE = 10
+
+
+class Scenario:
+    """
+    Сценарій навантаження.
+
+    :param name: Назва сценарію.
+    :param call: Асинхронна функція, що виконує один запит і повертає HTTP-статус.
+    :param heavy: Важкий сценарій (bcrypt, повний експорт, імпорт) отримує в ``HEAVY_DIVISOR`` разів менше запитів.
+    """
+
+    def __init__(self, name: str, call: Callable[[AsyncClient], Awaitable[int]], heavy: bool = False):
+        self.name = name
+        self.call = call
+        self.heavy = heavy
+
+
+def import_body(start: int, count: int, prefix: str = "seed") -> bytes:
+    """
+    Формує CSV для імпорту контактів.
+
+    :param start: Номер першого контакту.
+    :param count: Кількість контактів.
+    :param prefix: Префікс email, щоб контакти різних імпортів не збігалися.
+    :return: Тіло запиту.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(IMPORT_FIELDS)
+    for i in range(start, start + count):
+        row = contact_row(i, 0)
+        writer.writerow([
+            row["first_name"], row["last_name"], f"{prefix}.{row['email']}",
+            row["phone"], row["birthday"].isoformat(), row["additional_info"],
+        ])
+    return buffer.getvalue().encode()
+
+
+def contact_payload(i: int, prefix: str) -> dict:
+    """
+    Формує тіло запиту створення чи оновлення контакту.
+
+    :param i: Номер контакту.
+    :param prefix: Префікс email.
+    :return: Словник полів контакту.
+    """
+    row = contact_row(i, 0)
+    return {
+        "first_name": row["first_name"],
+        "last_name": row["last_name"],
+        "email": f"{prefix}.{row['email']}",
+        "phone": row["phone"],
+        "birthday": row["birthday"].isoformat(),
+        "additional_info": row["additional_info"],
+    }
+
+
+async def prepare_in_process(email: str, contacts: int) -> None:
+    """
+    Створює схему, підтвердженого користувача і контакти безпосередньо в базі.
+
+    :param email: Email користувача.
+    :param contacts: Кількість контактів.
+    """
+    from sqlalchemy import select
+
+    from app.database.db import AsyncSessionLocal, init_db
+    from app.models.models import User
+    from app.services.auth import auth_service
+    from app.services.rate_limit import limiter
+    from benchmarks.common import seed_contacts
+
+    limiter.enabled = False
+    await init_db()
+    async with AsyncSessionLocal() as session:
+        user = (await session.execute(select(User).where(User.email == email))).scalar_one_or_none()
+        if user is None:
+            user = User(email=email, hashed_password=await auth_service.hash_password(PASSWORD), is_verified=True)
+            session.add(user)
+            await session.commit()
+    await seed_contacts(user.id, contacts)
+
+
+async def seed_through_api(client: AsyncClient, contacts: int) -> None:
+    """
+    Імпортує контакти через ``POST /contacts/import`` частинами.
+
+    :param client: Автентифікований клієнт.
+    :param contacts: Кількість контактів.
+    """
+    for start in range(0, contacts, IMPORT_CHUNK):
+        body = import_body(start, min(IMPORT_CHUNK, contacts - start), prefix=f"api{int(time.time())}")
+        response = await client.post("/contacts/import", content=body, headers={"Content-Type": "text/csv"})
+        response.raise_for_status()
+
+
+async def login(client: AsyncClient, email: str, password: str) -> str:
+    """
+    Отримує access token через ``POST /auth/login``.
+
+    :param client: Клієнт.
+    :param email: Email користувача.
+    :param password: Пароль.
+    :return: Access token.
+    """
+    response = await client.post("/auth/login", data={"username": email, "password": password})
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def contact_ids(client: AsyncClient) -> List[int]:
+    """
+    Збирає ID усіх контактів користувача через потоковий експорт.
+
+    :param client: Автентифікований клієнт.
+    :return: Список ID.
+    """
+    response = await client.get("/contacts/export", params={"format": "ndjson"})
+    response.raise_for_status()
+    return [json.loads(line)["id"] for line in response.text.splitlines() if line]
+
+
+def build_scenarios(
+    email: str, password: str, ids: List[int], cursor: Optional[str], requests: int
+) -> List[Scenario]:
+    """
+    Створює сценарії для всіх маршрутів.
+
+    Сценарії, що видаляють контакти, беруть ID з окремого пулу (до половини
+    набору даних), тож не впливають на ID, які читають і оновлюють інші сценарії.
+
+    :param email: Email користувача.
+    :param password: Пароль.
+    :param ids: ID наявних контактів.
+    :param cursor: Курсор другої сторінки списку.
+    :param requests: Кількість запитів на сценарій (визначає розмір пулу для видалення).
+    :return: Список сценаріїв у порядку запуску.
+    """
+    rng = random.Random(42)
+    reserved = min(len(ids) // 2, requests * (1 + BATCH_DELETE_SIZE))
+    readable = ids[: len(ids) - reserved]
+    deletable = ids[len(ids) - reserved:]
+    counter = iter(range(10 ** 9))
+
+    async def login_call(c):
+        return (await c.post("/auth/login", data={"username": email, "password": password})).status_code
+
+    async def update_call(c):
+        i = next(counter)
+        return (await c.patch(f"/contacts/{rng.choice(readable)}", json=contact_payload(i, f"upd{i}"))).status_code
+
+    async def batch_update_call(c):
+        body = {"ids": rng.sample(readable, min(BATCH_UPDATE_SIZE, len(readable))), "changes": {"additional_info": "batch"}}
+        return (await c.request("PATCH", "/contacts/batch", json=body)).status_code
+
+    async def import_call(c):
+        body = import_body(0, 100, prefix=f"imp{next(counter)}")
+        return (await c.post("/contacts/import", content=body, headers={"Content-Type": "text/csv"})).status_code
+
+    async def delete_call(c):
+        return (await c.delete(f"/contacts/{deletable.pop()}")).status_code if deletable else 599
+
+    async def batch_delete_call(c):
+        if not deletable:
+            return 599
+        chunk = [deletable.pop() for _ in range(min(BATCH_DELETE_SIZE, len(deletable)))]
+        return (await c.request("DELETE", "/contacts/batch", json={"ids": chunk})).status_code
+
+    async def get(c, path, **params):
+        return (await c.get(path, params=params)).status_code
+
+    return [
+        Scenario("auth_login", login_call, heavy=True),
+        Scenario("users_me", lambda c: get(c, "/users/me")),
+        Scenario("contacts_list", lambda c: get(c, "/contacts/", limit=50)),
+        Scenario("contacts_list_cursor", lambda c: get(c, "/contacts/", limit=50, **({"after": cursor} if cursor else {}))),
+        Scenario("contacts_detail", lambda c: get(c, f"/contacts/{rng.choice(readable)}")),
+        Scenario("contacts_search", lambda c: get(c, "/contacts/search", q=rng.choice(["Kravchenko", "maria", "Shevchnko", "ol"]))),
+        Scenario("contacts_birthdays", lambda c: get(c, "/contacts/birthdays")),
+        Scenario("contacts_export", lambda c: get(c, "/contacts/export", format="ndjson", gzip="true"), heavy=True),
+        Scenario("contacts_create", lambda c: _status(c.post("/contacts/", json=contact_payload(next(counter), "new")))),
+        Scenario("contacts_update", update_call),
+        Scenario("contacts_batch_update", batch_update_call),
+        Scenario("contacts_import", import_call, heavy=True),
+        Scenario("contacts_delete", delete_call),
+        Scenario("contacts_batch_delete", batch_delete_call),
+    ]
+
+
+async def _status(request: Awaitable) -> int:
+    return (await request).status_code
+
+
+async def run_scenario(client: AsyncClient, scenario: Scenario, requests: int, concurrency: int) -> dict:
+    """
+    Виконує сценарій конкурентними клієнтами.
+
+    :param client: Автентифікований клієнт.
+    :param scenario: Сценарій.
+    :param requests: Загальна кількість запитів.
+    :param concurrency: Кількість одночасних клієнтів.
+    :return: Пропускна здатність, перцентилі затримки і кількість помилок за HTTP-статусом.
+    """
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                status = await scenario.call(client)
+            except Exception:
+                logger.warning("%s request failed", scenario.name, exc_info=True)
+                status = 599
+            latencies.append((time.perf_counter() - started) * 1000)
+            if status >= 400:
+                errors[str(status)] = errors.get(str(status), 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, requests))))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": requests,
+        "errors": sum(errors.values()),
+        "error_statuses": errors,
+        "rps": requests / elapsed,
+        "mean_ms": sum(latencies) / len(latencies),
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+    }
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> List[dict]:
+    """
+    Порівнює результати з базовим запуском.
+
+    :param results: Результати поточного запуску за сценарієм.
+    :param baseline: Результати базового запуску за сценарієм.
+    :param tolerance: Допустиме погіршення (0.2 — 20%).
+    :return: Рядки порівняння з ознакою регресії.
+    """
+    rows = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        p95_change = current["p95_ms"] / base["p95_ms"] - 1 if base["p95_ms"] else 0.0
+        rps_change = current["rps"] / base["rps"] - 1 if base["rps"] else 0.0
+        rows.append({
+            "scenario": name,
+            "p95_change": p95_change * 100,
+            "rps_change": rps_change * 100,
+            "regression": "YES" if p95_change > tolerance or rps_change < -tolerance else "",
+        })
+    return rows
+
+
+def start_uvicorn(port: int) -> subprocess.Popen:
+    """
+    Запускає uvicorn з поточними змінними середовища і вимкненими лімітами запитів.
+
+    :param port: Порт.
+    :return: Процес сервера.
+    """
+    env = {**os.environ, "RATE_LIMIT_ENABLED": "False"}
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env,
+    )
+
+
+async def wait_ready(client: AsyncClient, timeout: float = 30.0) -> None:
+    """
+    Чекає, доки сервер почне відповідати.
+
+    :param client: Клієнт сервера.
+    :param timeout: Максимальний час очікування в секундах.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            await client.get("/docs")
+            return
+        except Exception:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.2)
+
+
+async def main(args: argparse.Namespace) -> int:
+    server = None
+    if args.base_url:
+        client = AsyncClient(base_url=args.base_url, timeout=60)
+        target = args.base_url
+    elif args.uvicorn:
+        server = start_uvicorn(args.port)
+        target = f"http://127.0.0.1:{args.port}"
+        client = AsyncClient(base_url=target, timeout=60)
+    else:
+        from app.main import app
+
+        await prepare_in_process(args.email, args.contacts)
+        client = AsyncClient(app=app, base_url="http://bench", timeout=60)
+        target = "asgi"
+
+    try:
+        async with client:
+            if server is not None:
+                await wait_ready(client)
+                await client.post("/auth/register", json={"email": args.email, "password": args.password})
+            client.headers["Authorization"] = f"Bearer {await login(client, args.email, args.password)}"
+            if target != "asgi":
+                await seed_through_api(client, args.contacts)
+
+            ids = await contact_ids(client)
+            first_page = await client.get("/contacts/", params={"limit": 50})
+            scenarios = build_scenarios(
+                args.email, args.password, ids, first_page.headers.get("X-Next-Cursor"), args.requests
+            )
+            if args.only:
+                scenarios = [s for s in scenarios if s.name in args.only]
+
+            results = {}
+            for scenario in scenarios:
+                requests = max(args.requests // HEAVY_DIVISOR, 5) if scenario.heavy else args.requests
+                results[scenario.name] = await run_scenario(client, scenario, requests, args.concurrency)
+                print(f"{scenario.name}: {results[scenario.name]['rps']:.0f} req/s", file=sys.stderr)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print_table(
+        [{"scenario": name, **row} for name, row in results.items()],
+        ["scenario", "rps", "p50_ms", "p95_ms", "p99_ms", "errors"],
+    )
+    report = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "target": target,
+            "contacts": args.contacts,
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        rows = compare(results, baseline, args.tolerance)
+        print()
+        print_table(rows, ["scenario", "p95_change", "rps_change", "regression"])
+        if any(row["regression"] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--contacts", type=int, default=10000, help="Кількість контактів користувача")
+    parser.add_argument("--requests", type=int, default=500, help="Кількість запитів на сценарій")
+    parser.add_argument("--concurrency", type=int, default=20, help="Кількість одночасних клієнтів")
+    parser.add_argument("--only", nargs="*", help="Запустити лише вказані сценарії")
+    parser.add_argument("--output", help="Файл для збереження результатів у JSON")
+    parser.add_argument("--baseline", help="JSON попереднього запуску для порівняння")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Допустиме погіршення p95 і пропускної здатності")
+    parser.add_argument("--uvicorn", action="store_true", help="Запустити окремий процес uvicorn")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--base-url", help="URL уже запущеного сервера")
+    parser.add_argument("--email", default="bench@example.com")
+    parser.add_argument("--password", default=PASSWORD)
+    sys.exit(asyncio.run(main(parser.parse_args())))
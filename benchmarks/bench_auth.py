@@ -0,0 +1,68 @@
+"""
+Мікробенчмарк ``AuthService.get_current_user``: з кешем перевірених токенів і без нього.
+
+Користувач попередньо розміщується в кеші пам'яті процесу (L1), тож вимірюється
+лише шлях автентифікації без Redis і бази даних:
+    - ``decode``  — лише ``decode_token``;
+    - ``current`` — повний ``get_current_user``.
+
+Запуск (з налаштованими змінними середовища застосунку)::
+
+    TESTING=True python -m benchmarks.bench_auth --repeat 20000
+"""
+
+import argparse
+import asyncio
+
+from app.models.models import UserRole
+from app.repository.user_cache import local_users
+from app.services.auth import auth_service, verified_tokens
+from benchmarks.common import print_table, summarize, timed
+
+EMAIL = "bench@example.com"
+
+
+async def measure(label: str, cache_size: int, token: str, repeat: int) -> list:
+    """
+    Вимірює decode_token і get_current_user при заданому розмірі кешу токенів.
+
+    :param label: Назва сценарію.
+    :param cache_size: Розмір кешу перевірених токенів (0 вимикає кеш).
+    :param token: Access token.
+    :param repeat: Кількість викликів.
+    :return: Рядки результатів у мікросекундах.
+    """
+    verified_tokens.maxsize = cache_size
+    verified_tokens.clear()
+
+    async def decode():
+        auth_service.decode_token(token)
+
+    async def current():
+        await auth_service.get_current_user(token, db=None)
+
+    rows = []
+    for name, call in (("decode", decode), ("current", current)):
+        await call()
+        stats = summarize(await timed(call, repeat))
+        rows.append({"scenario": f"{label}/{name}", **{k.replace("_ms", "_us"): v * 1000 for k, v in stats.items()}})
+    return rows
+
+
+async def main(repeat: int) -> None:
+    local_users.maxsize = max(local_users.maxsize, 1)
+    local_users.ttl = 3600
+    local_users.set(EMAIL, {
+        "id": 1, "email": EMAIL, "is_verified": True, "avatar_url": None, "role": UserRole.USER.value,
+    })
+    token = auth_service.create_access_token({"sub": EMAIL})
+    size = verified_tokens.maxsize or 4096
+    results = await measure("no-cache", 0, token, repeat) + await measure("cache", size, token, repeat)
+    print_table(results, ["scenario", "mean_us", "p50_us", "p95_us", "p99_us"])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(main(args.repeat))
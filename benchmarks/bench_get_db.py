@@ -0,0 +1,85 @@
+"""
+Бенчмарк шляху запиту ``GET /contacts/``: до і після винесення ``init_db()`` з ``get_db``.
+
+Порівнює затримку запиту та кількість звернень до бази даних на запит для:
+    - ``before`` — стара залежність, що викликала ``create_all`` перед кожною сесією;
+    - ``after``  — поточна ``get_db``, яка лише відкриває сесію.
+
+Автентифікація підміняється фіксованим користувачем, тому Redis не потрібен.
+
+Запуск (з налаштованими змінними середовища застосунку)::
+
+    TESTING=True python -m benchmarks.bench_get_db --requests 500 --contacts 20
+"""
+
+import argparse
+import asyncio
+
+from httpx import AsyncClient
+from sqlalchemy import event
+
+from app.database.db import AsyncSessionLocal, engine, get_db, init_db
+from app.main import app
+from app.models.models import User
+from app.services.auth import auth_service
+from benchmarks.common import print_table, seed_contacts, seed_user, summarize, timed
+
+
+async def legacy_get_db():
+    """
+    Залежність у попередньому вигляді: create_all перед кожною сесією.
+    """
+    await init_db()
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+async def measure(label: str, dependency, user: User, requests: int) -> dict:
+    """
+    Виконує серію запитів GET /contacts/ і збирає статистику.
+
+    :param label: Назва сценарію.
+    :param dependency: Залежність, що підставляється замість get_db.
+    :param user: Поточний користувач.
+    :param requests: Кількість запитів.
+    :return: Словник з результатами.
+    """
+    app.dependency_overrides[get_db] = dependency
+    app.dependency_overrides[auth_service.get_current_user] = lambda: user
+    statements = 0
+
+    def _count(*args):
+        nonlocal statements
+        statements += 1
+
+    async with AsyncClient(app=app, base_url="http://bench") as client:
+        async def call():
+            response = await client.get("/contacts/")
+            response.raise_for_status()
+
+        await call()
+        event.listen(engine.sync_engine, "before_cursor_execute", _count)
+        try:
+            latencies = await timed(call, requests)
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", _count)
+    app.dependency_overrides.clear()
+    return {"scenario": label, **summarize(latencies), "queries/req": statements / requests}
+
+
+async def main(requests: int, contacts: int) -> None:
+    user = await seed_user()
+    await seed_contacts(user.id, contacts)
+    results = [
+        await measure("before", legacy_get_db, user, requests),
+        await measure("after", get_db, user, requests),
+    ]
+    print_table(results, ["scenario", "mean_ms", "p50_ms", "p95_ms", "queries/req"])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--contacts", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.contacts))
@@ -0,0 +1,61 @@
+"""
+Мікробенчмарк накладних витрат ``MetricsMiddleware`` на один запит.
+
+Порівнюється виклик мінімального ASGI застосунку напряму і через middleware;
+різниця середніх затримок — вартість запису метрик:
+    - ``bare``       — застосунок без middleware;
+    - ``middleware`` — той самий застосунок у ``MetricsMiddleware``.
+
+Запуск (з налаштованими змінними середовища застосунку)::
+
+    TESTING=True python -m benchmarks.bench_metrics --repeat 200000
+"""
+
+import argparse
+import asyncio
+from types import SimpleNamespace
+
+from app.services.metrics import HTTPMetrics, MetricsMiddleware
+from benchmarks.common import print_table, summarize, timed
+
+ROUTE = SimpleNamespace(path="/contacts/{contact_id}")
+START = {"type": "http.response.start", "status": 200, "headers": []}
+BODY = {"type": "http.response.body", "body": b"{}"}
+
+
+async def endpoint(scope, receive, send):
+    scope["route"] = ROUTE
+    await send(START)
+    await send(BODY)
+
+
+async def receive():
+    return {"type": "http.request", "body": b""}
+
+
+async def send(message):
+    pass
+
+
+async def main(repeat: int) -> None:
+    rows = []
+    for name, app in (("bare", endpoint), ("middleware", MetricsMiddleware(endpoint, HTTPMetrics()))):
+        async def call():
+            await app({"type": "http", "method": "GET", "path": "/contacts/1"}, receive, send)
+
+        for _ in range(1000):
+            await call()
+        stats = summarize(await timed(call, repeat))
+        rows.append({"scenario": name, **{k.replace("_ms", "_us"): v * 1000 for k, v in stats.items()}})
+    rows.append({
+        "scenario": "overhead",
+        **{key: rows[1][key] - rows[0][key] for key in ("mean_us", "p50_us", "p95_us", "p99_us")},
+    })
+    print_table(rows, ["scenario", "mean_us", "p50_us", "p95_us", "p99_us"])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=200000)
+    args = parser.parse_args()
+    asyncio.run(main(args.repeat))
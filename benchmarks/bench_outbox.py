@@ -0,0 +1,92 @@
+"""
+Бенчмарк доставки листів: окреме SMTP з'єднання на лист проти обробника outbox з пулом.
+
+Листи приймає :class:`app.services.fake_smtp.FakeSMTPServer` із затримкою
+``--latency`` на кожен лист, що імітує віддалений SMTP сервер:
+    - ``per-message`` — нове з'єднання (рукостискання + QUIT) для кожного листа послідовно,
+      як це робив FastMail у фонових задачах;
+    - ``outbox``      — ``OutboxWorker`` пакетами по ``--batch`` листів через ``SMTPPool``.
+
+Запуск (з налаштованими змінними середовища застосунку)::
+
+    TESTING=True python -m benchmarks.bench_outbox --emails 500 --latency 0.005
+"""
+
+import argparse
+import asyncio
+import time
+
+import aiosmtplib
+from sqlalchemy import insert
+
+from app.database.db import AsyncSessionLocal, init_db
+from app.models.models import EmailOutbox
+from app.services.fake_smtp import FakeSMTPServer
+from app.services.outbox import OutboxWorker, build_message
+from app.services.smtp_pool import SMTPPool
+from benchmarks.common import print_table
+
+
+async def per_message(server: FakeSMTPServer, emails: int) -> None:
+    """
+    Надсилає листи послідовно, відкриваючи нове з'єднання для кожного.
+
+    :param server: SMTP сервер-приймач.
+    :param emails: Кількість листів.
+    """
+    for i in range(emails):
+        await aiosmtplib.send(
+            build_message(f"user{i}@example.com", "Bench", "Body"),
+            hostname=server.host, port=server.port, start_tls=False,
+        )
+
+
+async def outbox(server: FakeSMTPServer, emails: int, batch: int, pool_size: int) -> OutboxWorker:
+    """
+    Ставить листи в чергу і розбирає її обробником outbox.
+
+    :param server: SMTP сервер-приймач.
+    :param emails: Кількість листів.
+    :param batch: Розмір пакета обробника.
+    :param pool_size: Розмір пулу SMTP з'єднань.
+    :return: Обробник із накопиченими метриками.
+    """
+    async with AsyncSessionLocal() as session:
+        await session.execute(insert(EmailOutbox), [
+            {"recipient": f"user{i}@example.com", "subject": "Bench", "body": "Body"} for i in range(emails)
+        ])
+        await session.commit()
+    worker = OutboxWorker(SMTPPool(server.host, server.port, size=pool_size), batch_size=batch)
+    while await worker.run_once():
+        pass
+    await worker.pool.close()
+    return worker
+
+
+async def main(emails: int, latency: float, batch: int, pool_size: int) -> None:
+    await init_db()
+    rows = []
+    async with FakeSMTPServer(latency=latency) as server:
+        start = time.perf_counter()
+        await per_message(server, emails)
+        elapsed = time.perf_counter() - start
+        rows.append({"scenario": "per-message", "seconds": elapsed, "emails_per_s": emails / elapsed,
+                     "connections": server.connections})
+
+        server.connections = 0
+        start = time.perf_counter()
+        worker = await outbox(server, emails, batch, pool_size)
+        elapsed = time.perf_counter() - start
+        rows.append({"scenario": "outbox", "seconds": elapsed, "emails_per_s": worker.sent / elapsed,
+                     "connections": server.connections})
+    print_table(rows, ["scenario", "seconds", "emails_per_s", "connections"])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--emails", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--batch", type=int, default=50)
+    parser.add_argument("--pool-size", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main(args.emails, args.latency, args.batch, args.pool_size))
@@ -0,0 +1,63 @@
+"""
+Бенчмарк пошуку контактів ``GET /contacts/search``.
+
+Заповнює таблицю ``contacts`` заданою кількістю рядків (за замовчуванням 1 000 000,
+усі належать одному користувачу — найгірший випадок для фільтра за ``user_id``)
+і вимірює затримку ранжованого пошуку для набору типових запитів:
+повне ім'я, підрядок email, слово з помилкою та найкоротший дозволений
+(3 символи) запит.
+
+Мета — p95 < 50 мс. Запуск проти PostgreSQL (з міграціями) або SQLite::
+
+    python -m benchmarks.bench_search --rows 1000000 --requests 50
+    TESTING=True python -m benchmarks.bench_search --rows 200000
+"""
+
+import argparse
+import asyncio
+import time
+
+from httpx import AsyncClient
+
+from app.main import app
+from app.services.auth import auth_service
+from app.services.rate_limit import limiter
+from benchmarks.common import print_table, seed_contacts, seed_user, summarize, timed
+
+QUERIES = {
+    "surname": "Kravchenko7",
+    "email_part": "kravchenko7123",
+    "typo": "Kravchneko7",
+    "short": "ole",
+    "two_words": "maria savko",
+}
+
+
+async def main(rows: int, requests: int, limit: int) -> None:
+    user = await seed_user()
+    started = time.perf_counter()
+    await seed_contacts(user.id, rows)
+    print(f"seeded {rows} contacts in {time.perf_counter() - started:.1f}s")
+
+    app.dependency_overrides[auth_service.get_current_user] = lambda: user
+    limiter.enabled = False
+    results = []
+    async with AsyncClient(app=app, base_url="http://bench") as client:
+        for label, q in QUERIES.items():
+            async def call():
+                response = await client.get("/contacts/search", params={"q": q, "limit": limit})
+                response.raise_for_status()
+
+            await call()
+            results.append({"query": label, **summarize(await timed(call, requests))})
+    app.dependency_overrides.clear()
+    print_table(results, ["query", "mean_ms", "p50_ms", "p95_ms", "p99_ms"])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.requests, args.limit))
@@ -0,0 +1,117 @@
+"""
+Бенчмарк серіалізації списку контактів: ORM + ``response_model`` проти Core-рядків.
+
+Порівнює шлях від запиту до готового тіла відповіді для ``--contacts`` контактів:
+    - ``orm``  — попередній шлях ``GET /contacts/``: ``select(Contact)`` з ORM
+      об'єктами, валідація ``List[ContactResponse]`` з ``orm_mode`` у FastAPI
+      і кодування ``JSONResponse`` (``json.dumps``);
+    - ``core`` — поточний шлях: Core-запит стовпців і
+      :func:`app.services.serialization.dump_rows`.
+
+Для кожного шляху друкуються рядки за секунду і пікова пам'ять (``tracemalloc``)
+у перерахунку на 10 000 контактів. Перед вимірюванням тіла обох шляхів
+порівнюються: вони мають бути однаковими JSON-документами.
+
+Запуск::
+
+    TESTING=True python -m benchmarks.bench_serialization --contacts 10000 --repeat 10
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+from typing import List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from sqlalchemy import select
+
+from app.database.db import AsyncSessionLocal
+from app.models.models import Contact
+from app.schemas.schemas import ContactResponse
+from app.services.fieldsets import CONTACT_FIELDS, contact_columns
+from app.services.serialization import dump_rows
+from benchmarks.common import print_table, seed_contacts, seed_user
+
+PER = 10_000
+RESPONSE_FIELD = create_response_field(name="Response_read_contacts", type_=List[ContactResponse])
+
+
+async def orm_body(user_id: int) -> bytes:
+    """
+    Попередній шлях: ORM об'єкти, ``response_model`` і ``JSONResponse``.
+    """
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(select(Contact).where(Contact.user_id == user_id).order_by(Contact.id))
+        contacts = result.scalars().all()
+    content = await serialize_response(field=RESPONSE_FIELD, response_content=contacts, is_coroutine=True)
+    return JSONResponse(content).body
+
+
+async def core_body(user_id: int) -> bytes:
+    """
+    Поточний шлях: Core-рядки і :func:`dump_rows`.
+    """
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(*contact_columns(CONTACT_FIELDS)).where(Contact.user_id == user_id).order_by(Contact.id)
+        )
+        rows = result.all()
+    return dump_rows(rows)
+
+
+PATHS = {"orm": orm_body, "core": core_body}
+
+
+async def measure(label: str, user_id: int, contacts: int, repeat: int) -> dict:
+    """
+    Вимірює пропускну здатність і пікову пам'ять одного шляху.
+
+    :param label: Назва шляху.
+    :param user_id: ID власника контактів.
+    :param contacts: Кількість контактів у відповіді.
+    :param repeat: Кількість повторів для вимірювання часу.
+    :return: Рядок результатів.
+    """
+    build = PATHS[label]
+    await build(user_id)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await build(user_id)
+    elapsed = (time.perf_counter() - started) / repeat
+
+    tracemalloc.start()
+    await build(user_id)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        "path": label,
+        "rows_per_s": contacts / elapsed,
+        "ms_per_10k": elapsed * 1000 * PER / contacts,
+        "peak_mb_per_10k": peak / 2 ** 20 * PER / contacts,
+    }
+
+
+async def main(contacts: int, repeat: int) -> None:
+    user = await seed_user()
+    await seed_contacts(user.id, contacts)
+
+    orm, core = await orm_body(user.id), await core_body(user.id)
+    if json.loads(orm) != json.loads(core):
+        raise SystemExit("core path output differs from ContactResponse serialization")
+    print(f"{contacts} contacts, {len(core)} bytes, outputs are equivalent")
+
+    results = [await measure(label, user.id, contacts, repeat) for label in PATHS]
+    print_table(results, ["path", "rows_per_s", "ms_per_10k", "peak_mb_per_10k"])
+    print(f"speedup: {results[1]['rows_per_s'] / results[0]['rows_per_s']:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--contacts", type=int, default=PER)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.contacts, args.repeat))
@@ -0,0 +1,137 @@
+"""
+Спільні допоміжні функції для бенчмарків.
+"""
+
+import statistics
+import time
+from datetime import date
+from typing import Awaitable, Callable, Dict, List, Sequence
+
+from sqlalchemy import insert
+
+from app.database.db import AsyncSessionLocal, init_db
+from app.models.models import Contact, User
+
+FIRST_NAMES = [
+    "Anna", "Bohdan", "Iryna", "John", "Maria", "Oleh", "Petro", "Sofia", "Taras", "Olena",
+    "Andrii", "Daria", "Yurii", "Kateryna", "Mykola", "Nadiia", "Roman", "Viktoriia", "Serhii", "Zoriana",
+]
+SURNAME_STEMS = [
+    "Shevch", "Koval", "Bondar", "Tkach", "Kravch", "Meln", "Lys", "Mor", "Sav", "Rud",
+    "Pavl", "Hon", "Moroz", "Kuz", "Kost", "Ivan", "Petr", "Sydor", "Fed", "Hryts",
+]
+SURNAME_ENDINGS = ["enko", "uk", "iak", "ko", "chuk", "ovych", "yshyn", "ets", "ych", "ak"]
+
+
+def _surname(i: int) -> str:
+    stem = SURNAME_STEMS[i % len(SURNAME_STEMS)]
+    ending = SURNAME_ENDINGS[(i // len(SURNAME_STEMS)) % len(SURNAME_ENDINGS)]
+    return f"{stem}{ending}{i // 200 % 50 or ''}"
+
+
+async def seed_user(email: str = "bench@example.com") -> User:
+    """
+    Створює схему (якщо потрібно) і користувача для бенчмарку.
+
+    :param email: Email користувача.
+    :return: Створений користувач.
+    """
+    await init_db()
+    async with AsyncSessionLocal() as session:
+        user = User(email=email, hashed_password="x", is_verified=True)
+        session.add(user)
+        await session.commit()
+        return user
+
+
+def contact_row(i: int, user_id: int) -> dict:
+    """
+    Генерує детермінований рядок контакту.
+
+    :param i: Порядковий номер контакту.
+    :param user_id: ID власника.
+    :return: Словник значень стовпців.
+    """
+    first = FIRST_NAMES[i * 7 % len(FIRST_NAMES)]
+    last = _surname(i)
+    return {
+        "first_name": first,
+        "last_name": last,
+        "email": f"{first.lower()}.{last.lower()}{i}@example.com",
+        "phone": f"+380{i:09d}",
+        "birthday": date(1970 + i % 40, 1 + i % 12, 1 + i % 28),
+        "additional_info": "benchmark contact",
+        "user_id": user_id,
+    }
+
+
+async def seed_contacts(user_id: int, count: int, batch_size: int = 10_000) -> None:
+    """
+    Масово вставляє контакти багаторядковими INSERT.
+
+    :param user_id: ID власника.
+    :param count: Кількість контактів.
+    :param batch_size: Розмір пакета.
+    """
+    async with AsyncSessionLocal() as session:
+        for start in range(0, count, batch_size):
+            rows = [contact_row(i, user_id) for i in range(start, min(start + batch_size, count))]
+            await session.execute(insert(Contact), rows)
+        await session.commit()
+
+
+async def timed(call: Callable[[], Awaitable], repeat: int) -> List[float]:
+    """
+    Виконує асинхронний виклик задану кількість разів і повертає затримки в мс.
+
+    :param call: Асинхронна функція без аргументів.
+    :param repeat: Кількість повторів.
+    :return: Відсортований список затримок у мілісекундах.
+    """
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await call()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return sorted(latencies)
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """
+    Повертає перцентиль відсортованої вибірки (метод найближчого рангу).
+
+    :param sorted_values: Відсортовані значення.
+    :param pct: Перцентиль від 0 до 100.
+    :return: Значення перцентиля.
+    """
+    index = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies: Sequence[float]) -> Dict[str, float]:
+    """
+    Рахує основні статистики затримок.
+
+    :param latencies: Відсортовані затримки в мс.
+    :return: Словник із mean/p50/p95/p99.
+    """
+    return {
+        "mean_ms": statistics.fmean(latencies),
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+    }
+
+
+def print_table(rows: List[Dict], columns: Sequence[str]) -> None:
+    """
+    Друкує результати у вигляді таблиці.
+
+    :param rows: Рядки результатів.
+    :param columns: Назви стовпців для виводу.
+    """
+    print("".join(f"{c:>16}" for c in columns))
+    for row in rows:
+        print("".join(
+            f"{row[c]:>16.3f}" if isinstance(row[c], float) else f"{row[c]:>16}" for c in columns
+        ))
@@ -0,0 +1,84 @@
+"""
+Середовище виконання міграцій Alembic.
+
+Підтримує два режими:
+    - запуск з командного рядка (``alembic upgrade head``) — створює власний
+      асинхронний рушій за ``DATABASE_URL``;
+    - запуск із застосунку — використовує з'єднання, передане через
+      ``config.attributes["connection"]`` (див. :mod:`app.database.schema`).
+"""
+
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import pool
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.database.db import Base, DATABASE_URL
+from app.database.schema import include_name
+import app.models.models  # noqa: F401  реєструє моделі в Base.metadata
+
+config = context.config
+
+if config.config_file_name is not None and config.attributes.get("connection") is None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    """
+    Генерує SQL міграцій без підключення до бази даних.
+    """
+    context.configure(
+        url=DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection) -> None:
+    """
+    Застосовує міграції на переданому синхронному з'єднанні.
+
+    :param connection: З'єднання SQLAlchemy.
+    """
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_name=include_name,
+        render_as_batch=connection.dialect.name == "sqlite",
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    """
+    Створює тимчасовий асинхронний рушій і застосовує міграції.
+    """
+    connectable = create_async_engine(DATABASE_URL, poolclass=pool.NullPool)
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+    await connectable.dispose()
+
+
+def run_migrations_online() -> None:
+    """
+    Застосовує міграції на живій базі даних.
+    """
+    connection = config.attributes.get("connection")
+    if connection is None:
+        asyncio.run(run_async_migrations())
+    else:
+        do_run_migrations(connection)
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
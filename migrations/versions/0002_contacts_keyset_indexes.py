@@ -0,0 +1,29 @@
+"""composite indexes for contacts keyset pagination
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_contacts_user_id_name", "contacts", ["user_id", "last_name", "first_name", "id"], unique=False)
+    op.create_index("ix_contacts_user_id_email", "contacts", ["user_id", "email", "id"], unique=False)
+    op.create_index("ix_contacts_user_id_id", "contacts", ["user_id", "id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_contacts_user_id_id", table_name="contacts")
+    op.drop_index("ix_contacts_user_id_email", table_name="contacts")
+    op.drop_index("ix_contacts_user_id_name", table_name="contacts")
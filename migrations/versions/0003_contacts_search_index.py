@@ -0,0 +1,69 @@
+"""contacts search index: tsvector/pg_trgm on PostgreSQL, FTS5 on SQLite
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_DOCUMENT = "coalesce(first_name, '') || ' ' || coalesce(last_name, '') || ' ' || coalesce(email, '')"
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+        op.execute(
+            "CREATE INDEX ix_contacts_search_fts ON contacts "
+            f"USING gin (user_id, to_tsvector('simple', {SEARCH_DOCUMENT}))"
+        )
+        op.execute(
+            "CREATE INDEX ix_contacts_search_trgm ON contacts "
+            f"USING gin (user_id, ({SEARCH_DOCUMENT}) gin_trgm_ops)"
+        )
+    elif dialect == "sqlite":
+        op.execute(
+            "CREATE VIRTUAL TABLE contacts_fts USING fts5("
+            "first_name, last_name, email, content='contacts', content_rowid='id', tokenize='trigram')"
+        )
+        op.execute(
+            "CREATE TRIGGER contacts_fts_ai AFTER INSERT ON contacts BEGIN "
+            "INSERT INTO contacts_fts(rowid, first_name, last_name, email) "
+            "VALUES (new.id, new.first_name, new.last_name, new.email); END"
+        )
+        op.execute(
+            "CREATE TRIGGER contacts_fts_ad AFTER DELETE ON contacts BEGIN "
+            "INSERT INTO contacts_fts(contacts_fts, rowid, first_name, last_name, email) "
+            "VALUES ('delete', old.id, old.first_name, old.last_name, old.email); END"
+        )
+        op.execute(
+            "CREATE TRIGGER contacts_fts_au AFTER UPDATE ON contacts BEGIN "
+            "INSERT INTO contacts_fts(contacts_fts, rowid, first_name, last_name, email) "
+            "VALUES ('delete', old.id, old.first_name, old.last_name, old.email); "
+            "INSERT INTO contacts_fts(rowid, first_name, last_name, email) "
+            "VALUES (new.id, new.first_name, new.last_name, new.email); END"
+        )
+        op.execute("INSERT INTO contacts_fts(contacts_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_contacts_search_trgm")
+        op.execute("DROP INDEX IF EXISTS ix_contacts_search_fts")
+    elif dialect == "sqlite":
+        op.execute("DROP TRIGGER IF EXISTS contacts_fts_au")
+        op.execute("DROP TRIGGER IF EXISTS contacts_fts_ad")
+        op.execute("DROP TRIGGER IF EXISTS contacts_fts_ai")
+        op.execute("DROP TABLE IF EXISTS contacts_fts")
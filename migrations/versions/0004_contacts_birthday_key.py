@@ -0,0 +1,38 @@
+"""contacts.birthday_key (MMDD) with (user_id, birthday_key) index
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("contacts", sa.Column("birthday_key", sa.Integer(), nullable=True))
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            "UPDATE contacts SET birthday_key = "
+            "EXTRACT(MONTH FROM birthday)::int * 100 + EXTRACT(DAY FROM birthday)::int"
+        )
+    else:
+        op.execute(
+            "UPDATE contacts SET birthday_key = "
+            "CAST(strftime('%m', birthday) AS INTEGER) * 100 + CAST(strftime('%d', birthday) AS INTEGER)"
+        )
+    op.create_index("ix_contacts_user_id_birthday_key", "contacts", ["user_id", "birthday_key"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_contacts_user_id_birthday_key", table_name="contacts")
+    op.drop_column("contacts", "birthday_key")
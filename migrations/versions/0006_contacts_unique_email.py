@@ -0,0 +1,52 @@
+"""unique contact email per user
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 17:00:00.000000
+
+Earlier versions allowed the same email twice in one user's contacts.
+The upgrade does not delete any contacts. If duplicates exist, it stops and
+lists each (user_id, email) group and its contact ids. Merge or delete
+those contacts, then run the migration again.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+DUPLICATES_REPORT_LIMIT = 50
+
+
+def upgrade() -> None:
+    duplicates = op.get_bind().execute(sa.text(
+        "SELECT user_id, email, COUNT(*) FROM contacts WHERE email IS NOT NULL "
+        "GROUP BY user_id, email HAVING COUNT(*) > 1 ORDER BY user_id, email"
+    )).all()
+    if duplicates:
+        groups = []
+        for user_id, email, _ in duplicates[:DUPLICATES_REPORT_LIMIT]:
+            ids = op.get_bind().execute(
+                sa.text("SELECT id FROM contacts WHERE user_id = :user_id AND email = :email ORDER BY id"),
+                {"user_id": user_id, "email": email},
+            ).scalars().all()
+            groups.append(f"  user_id={user_id} email={email!r} contact ids={ids}")
+        if len(duplicates) > DUPLICATES_REPORT_LIMIT:
+            groups.append(f"  ... and {len(duplicates) - DUPLICATES_REPORT_LIMIT} more groups")
+        raise RuntimeError(
+            f"Cannot create uq_contacts_user_id_email: {len(duplicates)} duplicate (user_id, email) groups.\n"
+            + "\n".join(groups)
+            + "\nMerge or delete the duplicate contacts and run the migration again."
+        )
+    op.create_index("uq_contacts_user_id_email", "contacts", ["user_id", "email"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("uq_contacts_user_id_email", table_name="contacts")
@@ -0,0 +1,38 @@
+"""drop single-column contact indexes superseded by user_id composites
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 18:00:00.000000
+
+Every contacts query filters by user_id, so the single-column indexes on
+first_name, last_name and email are never chosen and only slow down writes.
+ix_contacts_id and ix_users_id duplicate the primary keys.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DROPPED = [
+    ("contacts", "ix_contacts_first_name", ["first_name"]),
+    ("contacts", "ix_contacts_last_name", ["last_name"]),
+    ("contacts", "ix_contacts_email", ["email"]),
+    ("contacts", "ix_contacts_id", ["id"]),
+    ("users", "ix_users_id", ["id"]),
+]
+
+
+def upgrade() -> None:
+    for table, name, _ in DROPPED:
+        op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    for table, name, columns in reversed(DROPPED):
+        op.create_index(name, table, columns, unique=False)
@@ -0,0 +1,29 @@
+"""drop ix_contacts_user_id_email superseded by the unique email index
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 19:00:00.000000
+
+uq_contacts_user_id_email (user_id, email) serves the same lookups and the
+email sort order of the contact list, so the (user_id, email, id) index only
+doubled the write cost. Within one email only NULLs can repeat, and the id
+tie-break is sorted on top of the unique index scan.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_contacts_user_id_email", table_name="contacts")
+
+
+def downgrade() -> None:
+    op.create_index("ix_contacts_user_id_email", "contacts", ["user_id", "email", "id"], unique=False)
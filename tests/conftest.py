@@ -5,9 +5,12 @@ from sqlalchemy import update
 
 from app.main import app
 from app.database.db import get_db, AsyncSessionLocal, engine, Base
-from app.models.models import User
-from app.services.auth import auth_service
+from app.models.models import User, UserRole
+from app.services.auth import auth_service, verified_tokens
+from app.services.cache import redis
 from app.repository.users import create_user
+from app.repository.user_cache import local_users
+from app.services.rate_limit import limiter
 
 @pytest.fixture(scope="function", autouse=True)
 def override_db_url(monkeypatch):
@@ -22,6 +25,15 @@ async def prepare_database():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
+@pytest.fixture(scope="function", autouse=True)
+async def reset_redis():
+    await redis.flushdb()
+    local_users.clear()
+    verified_tokens.clear()
+    limiter.local.clear()
+    yield
+    await redis.connection_pool.disconnect()
+
 @pytest.fixture
 async def db_session():
     async with AsyncSessionLocal() as session:
@@ -39,7 +51,7 @@ async def client(db_session):
 async def current_user(client: AsyncClient, db_session: AsyncSession):
     email = "testuser@example.com"
     password = "Secret123"
-    hashed = auth_service.hash_password(password)
+    hashed = await auth_service.hash_password(password)
     user = await create_user(type("U", (), {"email": email, "password": password}), hashed, db_session)
     await db_session.execute(update(User).where(User.email == email).values(is_verified=True))
     await db_session.commit()
@@ -47,4 +59,37 @@ async def current_user(client: AsyncClient, db_session: AsyncSession):
     login = await client.post("/auth/login", data={"username": email, "password": password})
     token = login.json()["access_token"]
     client.headers["Authorization"] = f"Bearer {token}"
-    return user
\ No newline at end of file
+    return user
+
+@pytest.fixture
+async def admin_user(client: AsyncClient, db_session: AsyncSession):
+    email = "admin@example.com"
+    password = "Secret123"
+    hashed = await auth_service.hash_password(password)
+    user = await create_user(type("U", (), {"email": email, "password": password}), hashed, db_session)
+    await db_session.execute(
+        update(User).where(User.email == email).values(is_verified=True, role=UserRole.ADMIN)
+    )
+    await db_session.commit()
+
+    login = await client.post("/auth/login", data={"username": email, "password": password})
+    token = login.json()["access_token"]
+    client.headers["Authorization"] = f"Bearer {token}"
+    return user
+
+CONTACT_PAYLOAD = {
+    "first_name": "Anna", "last_name": "Koval", "email": "anna@example.com",
+    "phone": "+380501112233", "birthday": "1990-05-01", "additional_info": None,
+}
+
+@pytest.fixture
+def contact_payload():
+    return dict(CONTACT_PAYLOAD)
+
+@pytest.fixture
+def create_contact(client: AsyncClient, current_user: User):
+    async def _create(**changes):
+        response = await client.post("/contacts/", json={**CONTACT_PAYLOAD, **changes})
+        assert response.status_code == 201
+        return response.json()
+    return _create
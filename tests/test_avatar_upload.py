@@ -0,0 +1,116 @@
+import asyncio
+import io
+import time
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+
+from app.conf.config import settings
+from app.models.models import User
+from app.services import cloudinary_service
+from app.services.avatar_storage import CHUNK_SIZE, AvatarStorage, LocalAvatarStorage, read_upload
+from tests.test_cloudinary_service import DummyUploadFile
+
+
+@pytest.fixture
+def local_storage(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "avatar_storage", "local")
+    monkeypatch.setattr(settings, "avatar_local_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "avatar_local_url", "/media/avatars")
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_read_upload_streams_in_chunks():
+    content = b"x" * (CHUNK_SIZE * 2 + 10)
+    data = await read_upload(DummyUploadFile("image/png", content), max_bytes=len(content))
+    assert data.read() == content
+    data.close()
+
+
+@pytest.mark.asyncio
+async def test_read_upload_rejects_oversized_file():
+    with pytest.raises(HTTPException) as exc_info:
+        await read_upload(DummyUploadFile("image/png", b"x" * 101), max_bytes=100)
+    assert exc_info.value.status_code == 413
+
+
+@pytest.mark.asyncio
+async def test_local_storage_writes_file(local_storage):
+    url = await cloudinary_service.upload_avatar(DummyUploadFile("image/png", b"png-bytes"))
+    assert url.startswith("/media/avatars/") and url.endswith(".png")
+    assert (local_storage / url.rsplit("/", 1)[1]).read_bytes() == b"png-bytes"
+
+
+@pytest.mark.asyncio
+async def test_cloudinary_upload_does_not_block_event_loop(monkeypatch):
+    def slow_upload(data, **kwargs):
+        time.sleep(0.1)
+        return {"secure_url": "https://fake.cloudinary.com/image.jpg"}
+
+    monkeypatch.setattr(cloudinary_service.cloudinary.uploader, "upload", slow_upload)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(ticker())
+    await cloudinary_service.upload_avatar(DummyUploadFile("image/jpeg", b"img"))
+    task.cancel()
+    assert ticks > 3
+
+
+@pytest.mark.asyncio
+async def test_deferred_avatar_upload(client, db_session, admin_user, local_storage):
+    user_id = admin_user.id
+
+    response = await client.patch(
+        "/users/me/avatar",
+        params={"deferred": "true"},
+        files={"file": ("a.png", b"png-bytes", "image/png")},
+    )
+    assert response.status_code == 202
+
+    db_session.expire_all()
+    avatar_url = (await db_session.execute(
+        select(User.avatar_url).where(User.id == user_id)
+    )).scalar_one()
+    assert avatar_url.startswith("/media/avatars/")
+    assert (local_storage / avatar_url.rsplit("/", 1)[1]).read_bytes() == b"png-bytes"
+
+
+@pytest.mark.asyncio
+async def test_deferred_upload_validates_before_accepting(client, admin_user, monkeypatch):
+    monkeypatch.setattr(settings, "avatar_max_bytes", 4)
+
+    response = await client.patch(
+        "/users/me/avatar",
+        params={"deferred": "true"},
+        files={"file": ("a.png", b"too-large", "image/png")},
+    )
+    assert response.status_code == 413
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("content_type", ["image/svg+xml", "text/html", "image/gif"])
+async def test_avatar_upload_rejects_unsafe_types(client, admin_user, local_storage, content_type):
+    response = await client.patch("/users/me/avatar", files={"file": ("a.svg", b"<svg onload=alert(1)>", content_type)})
+    assert response.status_code == 400
+    assert list(local_storage.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_local_storage_rejects_unknown_type(tmp_path):
+    storage = LocalAvatarStorage(str(tmp_path), "/media/avatars")
+    with pytest.raises(HTTPException) as exc_info:
+        await storage.save(io.BytesIO(b"<svg/>"), "id", "image/svg+xml")
+    assert exc_info.value.status_code == 400
+
+
+def test_avatar_storage_is_abstract():
+    with pytest.raises(TypeError):
+        AvatarStorage()
@@ -7,9 +7,13 @@ class DummyUploadFile:
     def __init__(self, content_type, content):
         self.content_type = content_type
         self._content = content
+        self._offset = 0
 
-    async def read(self):
-        return self._content
+    async def read(self, size=-1):
+        end = len(self._content) if size < 0 else self._offset + size
+        chunk = self._content[self._offset:end]
+        self._offset += len(chunk)
+        return chunk
 
 @pytest.mark.asyncio
 async def test_upload_avatar_success():
@@ -28,3 +28,38 @@ async def test_read_contact_not_found(client: AsyncClient, current_user: User):
     response = await client.get("/contacts/999999") 
     assert response.status_code == 404
     assert response.json()["detail"] == "Contact not found"
+
+
+@pytest.mark.asyncio
+async def test_duplicate_email_is_rejected_by_database(client: AsyncClient, current_user: User, contact_payload):
+    first = await client.post("/contacts/", json=contact_payload)
+    assert first.status_code == 201
+    assert first.json()["birthday"] == "1990-05-01"
+
+    duplicate = await client.post("/contacts/", json={**contact_payload, "first_name": "Other"})
+    assert duplicate.status_code == 400
+    assert duplicate.json()["detail"] == "Email already in use"
+
+    second = (await client.post("/contacts/", json={**contact_payload, "email": "olena@example.com"})).json()
+    conflict = await client.patch(f"/contacts/{second['id']}", json=contact_payload)
+    assert conflict.status_code == 400
+    assert conflict.json()["detail"] == "Email already in use"
+
+    renamed = await client.patch(f"/contacts/{second['id']}", json={**contact_payload, "email": "new@example.com", "birthday": "1991-12-31"})
+    assert renamed.status_code == 200
+    assert renamed.json()["email"] == "new@example.com"
+
+
+@pytest.mark.asyncio
+async def test_update_sets_birthday_key(client: AsyncClient, db_session: AsyncSession, create_contact, contact_payload):
+    created = await create_contact()
+    await client.patch(f"/contacts/{created['id']}", json={**contact_payload, "birthday": "1991-12-31"})
+    contact = await db_session.get(Contact, created["id"])
+    assert contact.birthday_key == 1231
+
+
+@pytest.mark.asyncio
+async def test_missing_contact_update_and_delete(client: AsyncClient, current_user: User, contact_payload):
+    assert (await client.patch("/contacts/999999", json=contact_payload)).status_code == 404
+    assert (await client.delete("/contacts/999999")).status_code == 404
+
@@ -0,0 +1,103 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import event, select
+
+from app.database.db import engine
+from app.models.models import Contact, User
+
+
+@pytest.fixture
+async def contacts(db_session, current_user):
+    other = User(email="other@example.com", hashed_password="x", is_verified=True)
+    db_session.add(other)
+    await db_session.flush()
+    rows = [
+        Contact(first_name="Anna", last_name="Koval", email="anna@corp.com", phone="1",
+                birthday=date(1990, 1, 1), additional_info=None, user_id=current_user.id),
+        Contact(first_name="Olena", last_name="Lys", email="olena@CORP.com", phone="2",
+                birthday=date(1991, 2, 2), additional_info=None, user_id=current_user.id),
+        Contact(first_name="Petro", last_name="Moroz", email="petro@home.net", phone="3",
+                birthday=date(1992, 3, 3), additional_info=None, user_id=current_user.id),
+        Contact(first_name="Foreign", last_name="Owner", email="x@corp.com", phone="4",
+                birthday=date(1993, 4, 4), additional_info=None, user_id=other.id),
+    ]
+    db_session.add_all(rows)
+    await db_session.commit()
+    return [c.id for c in rows]
+
+
+@pytest.mark.asyncio
+async def test_batch_update_by_ids_reports_each_item(client, db_session, contacts):
+    anna, olena, _, foreign = contacts
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    try:
+        response = await client.patch("/contacts/batch", json={
+            "ids": [anna, foreign, 9999, olena],
+            "changes": {"additional_info": "colleague", "birthday": "1990-12-25"},
+        })
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["affected"], body["not_found"]) == (2, 2)
+    assert [item["status"] for item in body["items"]] == ["updated", "not_found", "not_found", "updated"]
+    assert [s.split()[0] for s in statements if s.split()[0] in ("SELECT", "UPDATE")] == ["UPDATE"]
+
+    db_session.expire_all()
+    rows = (await db_session.execute(select(Contact).order_by(Contact.id))).scalars().all()
+    assert [r.additional_info for r in rows] == ["colleague", "colleague", None, None]
+    assert [r.birthday_key for r in rows[:2]] == [1225, 1225]
+
+
+@pytest.mark.asyncio
+async def test_batch_delete_by_filter_respects_ownership(client, db_session, contacts):
+    anna, olena, petro, foreign = contacts
+    response = await client.request("DELETE", "/contacts/batch", json={"filter": {"email_domain": "corp.com"}})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["affected"] == 2
+    assert body["items"] == [{"id": anna, "status": "deleted"}, {"id": olena, "status": "deleted"}]
+
+    remaining = (await db_session.execute(select(Contact.id).order_by(Contact.id))).scalars().all()
+    assert remaining == [petro, foreign]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("payload", [
+    {},
+    {"ids": [1], "filter": {"last_name": "Lys"}},
+    {"filter": {}},
+    {"ids": []},
+])
+async def test_batch_selector_validation(client, current_user, payload):
+    response = await client.request("DELETE", "/contacts/batch", json=payload)
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_batch_update_requires_changes(client, contacts):
+    response = await client.patch("/contacts/batch", json={"ids": [contacts[0]], "changes": {}})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("changes", [{"first_name": None}, {"birthday": None}, {"phone": None, "additional_info": "x"}])
+async def test_batch_update_rejects_null_required_fields(client, db_session, contacts, changes):
+    response = await client.patch("/contacts/batch", json={"ids": [contacts[0]], "changes": changes})
+    assert response.status_code == 422
+
+    detail = await client.get(f"/contacts/{contacts[0]}")
+    assert detail.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_batch_update_can_clear_additional_info(client, contacts):
+    response = await client.patch("/contacts/batch", json={"ids": [contacts[0]], "changes": {"additional_info": None}})
+    assert response.status_code == 200
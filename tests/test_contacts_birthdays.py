@@ -0,0 +1,58 @@
+import pytest
+from datetime import date, timedelta
+
+from app.models.models import Contact
+from app.services.birthdays import birthday_key, upcoming_birthday_ranges
+
+
+def test_ranges_within_year():
+    assert upcoming_birthday_ranges(date(2026, 6, 10), 7) == [(610, 617)]
+
+
+def test_ranges_wrap_around_new_year():
+    assert upcoming_birthday_ranges(date(2026, 12, 28), 7) == [(1228, 1231), (101, 104)]
+
+
+def test_feb_29_included_when_window_ends_on_feb_28_of_common_year():
+    assert upcoming_birthday_ranges(date(2027, 2, 21), 7) == [(221, 229)]
+    assert upcoming_birthday_ranges(date(2028, 2, 21), 7) == [(221, 228)]
+    assert upcoming_birthday_ranges(date(2027, 2, 25), 7) == [(225, 304)]
+
+
+def test_birthday_key_is_kept_in_sync_on_model():
+    contact = Contact(first_name="A", birthday=date(1992, 2, 29))
+    assert contact.birthday_key == 229
+    contact.birthday = date(1992, 12, 1)
+    assert contact.birthday_key == birthday_key(date(1992, 12, 1)) == 1201
+
+
+@pytest.mark.asyncio
+async def test_upcoming_birthdays_endpoint(client, db_session, current_user):
+    today = date.today()
+
+    def born(offset):
+        day = today + timedelta(days=offset)
+        return date(1990, day.month, min(day.day, 28) if day.month == 2 else day.day)
+
+    for name, offset in [("InThree", 3), ("Today", 0), ("InTwenty", 20)]:
+        db_session.add(Contact(
+            first_name=name,
+            last_name="B",
+            email=f"{name.lower()}@example.com",
+            phone="1",
+            birthday=born(offset),
+            user_id=current_user.id,
+        ))
+    await db_session.commit()
+
+    response = await client.get("/contacts/birthdays", params={"days": 7})
+    assert response.status_code == 200
+    assert [c["first_name"] for c in response.json()] == ["Today", "InThree"]
+
+    updated = await client.patch(
+        f"/contacts/{response.json()[1]['id']}",
+        json={**response.json()[1], "birthday": str(born(30))},
+    )
+    assert updated.status_code == 200
+    response = await client.get("/contacts/birthdays", params={"days": 7})
+    assert [c["first_name"] for c in response.json()] == ["Today"]
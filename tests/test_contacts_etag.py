@@ -0,0 +1,76 @@
+from unittest.mock import patch
+
+import pytest
+
+from app.services.cache import contacts_version_key, redis
+from app.services.conditional import etag_matches
+
+
+def test_etag_matches():
+    assert etag_matches('"a"', '"b", "a"')
+    assert etag_matches('"a"', 'W/"a"')
+    assert etag_matches('"a"', "*")
+    assert not etag_matches('"a"', '"b"')
+    assert not etag_matches('"a"', None)
+
+
+@pytest.mark.asyncio
+async def test_list_returns_304_without_querying(client, create_contact):
+    await create_contact()
+    first = await client.get("/contacts/")
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    with patch("app.routes.contacts.select") as select:
+        second = await client.get("/contacts/", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.headers["ETag"] == etag
+    assert second.content == b""
+    select.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_etag_depends_on_query(client, current_user):
+    a = await client.get("/contacts/", params={"limit": 10})
+    b = await client.get("/contacts/", params={"limit": 20})
+    assert a.headers["ETag"] != b.headers["ETag"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("change", ["create", "update", "delete", "batch"])
+async def test_writes_invalidate_etag(client, create_contact, contact_payload, change):
+    created = await create_contact()
+    list_etag = (await client.get("/contacts/")).headers["ETag"]
+    detail_etag = (await client.get(f"/contacts/{created['id']}")).headers["ETag"]
+
+    if change == "create":
+        await create_contact(email="other@example.com")
+    elif change == "update":
+        await client.patch(f"/contacts/{created['id']}", json={**contact_payload, "phone": "+380509999999"})
+    elif change == "delete":
+        await client.delete(f"/contacts/{created['id']}")
+    else:
+        await client.request("PATCH", "/contacts/batch", json={"ids": [created["id"]], "changes": {"last_name": "X"}})
+
+    assert (await client.get("/contacts/", headers={"If-None-Match": list_etag})).status_code == 200
+    detail = await client.get(f"/contacts/{created['id']}", headers={"If-None-Match": detail_etag})
+    assert detail.status_code == (404 if change == "delete" else 200)
+
+
+@pytest.mark.asyncio
+async def test_lost_version_never_revalidates_stale_copy(client, current_user):
+    etag = (await client.get("/contacts/")).headers["ETag"]
+    await redis.delete(contacts_version_key(current_user.id))
+    r = await client.get("/contacts/", headers={"If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_wildcard_matches_only_existing_contact(client, create_contact):
+    created = await create_contact()
+    assert (await client.get(f"/contacts/{created['id']}", headers={"If-None-Match": "*"})).status_code == 304
+
+    missing = await client.get("/contacts/999999", headers={"If-None-Match": "*"})
+    assert missing.status_code == 404
+    assert missing.json()["detail"] == "Contact not found"
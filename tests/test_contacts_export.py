@@ -0,0 +1,69 @@
+import csv
+import io
+import json
+from datetime import date
+
+import pytest
+
+from app.models.models import Contact
+from app.services import exporter
+
+
+@pytest.fixture
+async def contacts(db_session, current_user):
+    rows = [
+        Contact(first_name="Anna", last_name="Koval", email="anna@example.com", phone="+380501",
+                birthday=date(1990, 5, 3), additional_info=None, user_id=current_user.id),
+        Contact(first_name="Olena", last_name="Lys", email="olena@example.com", phone="+380502",
+                birthday=date(1985, 12, 31), additional_info="two\nlines, with; punctuation", user_id=current_user.id),
+        Contact(first_name="Petro", last_name="Moroz", email="petro@example.com", phone="+380503",
+                birthday=date(1970, 1, 1), additional_info="Київ", user_id=current_user.id),
+    ]
+    db_session.add_all(rows)
+    await db_session.commit()
+    return rows
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson_streams_all_partitions(client, contacts, monkeypatch):
+    monkeypatch.setattr(exporter, "PARTITION_SIZE", 2)
+    response = await client.get("/contacts/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["first_name"] for r in rows] == ["Anna", "Olena", "Petro"]
+    assert rows[2]["additional_info"] == "Київ"
+
+
+@pytest.mark.asyncio
+async def test_export_csv_matches_import_header(client, contacts):
+    response = await client.get("/contacts/export", params={"format": "csv"})
+    assert response.headers["content-disposition"] == 'attachment; filename="contacts.csv"'
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert list(rows[0].keys()) == exporter.CSV_FIELDS
+    assert rows[1]["additional_info"] == "two\nlines, with; punctuation"
+    assert rows[0]["birthday"] == "1990-05-03"
+
+
+@pytest.mark.asyncio
+async def test_export_vcard_escapes_values(client, contacts):
+    response = await client.get("/contacts/export", params={"format": "vcf"})
+    cards = response.text.split("END:VCARD\r\n")[:-1]
+    assert len(cards) == 3
+    assert "N:Lys;Olena;;;\r\n" in cards[1]
+    assert "NOTE:two\\nlines\\, with\\; punctuation\r\n" in cards[1]
+    assert "BDAY:1985-12-31\r\n" in cards[1]
+
+
+@pytest.mark.asyncio
+async def test_export_gzip(client, contacts):
+    response = await client.get("/contacts/export", params={"gzip": "true"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.text.splitlines()) == 3
+
+
+@pytest.mark.asyncio
+async def test_export_only_own_contacts(client, current_user):
+    response = await client.get("/contacts/export")
+    assert response.status_code == 200
+    assert response.text == ""
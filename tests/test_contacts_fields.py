@@ -0,0 +1,106 @@
+import csv
+import io
+import json
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+
+from app.database.db import engine
+from app.database.explain import record_statements
+from app.models.models import Contact
+from app.services.fieldsets import contact_adapter, parse_fields
+
+
+@pytest.fixture
+async def contacts(db_session, current_user):
+    rows = [
+        Contact(first_name=name, last_name="Koval", email=f"{name.lower()}@example.com", phone="+380501",
+                birthday=date(1990, 5, 3), additional_info=None, user_id=current_user.id)
+        for name in ("Anna", "Olena", "Petro")
+    ]
+    db_session.add_all(rows)
+    await db_session.commit()
+    return rows
+
+
+def _selects(statements):
+    return [s.statement for s in statements if s.statement.lstrip().upper().startswith("SELECT")]
+
+
+def test_parse_fields_keeps_order_and_drops_repeats():
+    assert parse_fields(None) is None
+    assert parse_fields("last_name, id,last_name") == ("last_name", "id")
+
+
+@pytest.mark.parametrize("value", ["", " , ", "id,password"])
+def test_parse_fields_rejects_empty_and_unknown(value):
+    with pytest.raises(HTTPException) as error:
+        parse_fields(value)
+    assert error.value.status_code == 422
+
+
+def test_partial_schema_validates_types():
+    adapter = contact_adapter(("id", "birthday"))
+    assert adapter.validate_python({"id": 1, "birthday": "1990-05-03"}).birthday == date(1990, 5, 3)
+    assert contact_adapter(("id", "birthday")) is adapter
+
+
+@pytest.mark.asyncio
+async def test_list_returns_only_requested_fields(client, contacts):
+    with record_statements(engine) as statements:
+        response = await client.get("/contacts/", params={"fields": "id,first_name", "limit": 2})
+    assert response.status_code == 200
+    assert response.json() == [{"id": contacts[0].id, "first_name": "Anna"}, {"id": contacts[1].id, "first_name": "Olena"}]
+    assert "additional_info" not in _selects(statements)[-1]
+
+    rest = await client.get(
+        "/contacts/", params={"fields": "id,first_name", "limit": 2, "after": response.headers["X-Next-Cursor"]}
+    )
+    assert rest.json() == [{"id": contacts[2].id, "first_name": "Petro"}]
+
+
+@pytest.mark.asyncio
+async def test_list_sort_column_is_not_returned(client, contacts):
+    response = await client.get("/contacts/", params={"fields": "phone", "sort": "-email", "limit": 1})
+    assert response.json() == [{"phone": "+380501"}]
+    assert "X-Next-Cursor" in response.headers
+
+
+@pytest.mark.asyncio
+async def test_detail_returns_only_requested_fields(client, contacts):
+    response = await client.get(f"/contacts/{contacts[1].id}", params={"fields": "birthday,email"})
+    assert response.status_code == 200
+    assert response.json() == {"birthday": "1990-05-03", "email": "olena@example.com"}
+    assert "ETag" in response.headers
+
+    missing = await client.get("/contacts/999999", params={"fields": "id"})
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_unknown_field_is_rejected(client, contacts):
+    response = await client.get("/contacts/", params={"fields": "id,password"})
+    assert response.status_code == 422
+    assert "password" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson_and_csv_with_fields(client, contacts):
+    with record_statements(engine) as statements:
+        response = await client.get("/contacts/export", params={"fields": "email,birthday"})
+    assert [json.loads(line) for line in response.text.splitlines()][0] == {
+        "email": "anna@example.com", "birthday": "1990-05-03",
+    }
+    assert "first_name" not in _selects(statements)[-1]
+
+    response = await client.get("/contacts/export", params={"format": "csv", "fields": "last_name,id"})
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == ["last_name", "id"]
+    assert rows[1] == ["Koval", str(contacts[0].id)]
+
+
+@pytest.mark.asyncio
+async def test_export_vcard_rejects_fields(client, contacts):
+    response = await client.get("/contacts/export", params={"format": "vcf", "fields": "email"})
+    assert response.status_code == 422
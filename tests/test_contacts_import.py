@@ -0,0 +1,115 @@
+import json
+
+import pytest
+from sqlalchemy import select
+
+from app.models.models import Contact
+from app.services import importer
+
+
+async def chunked(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+@pytest.mark.asyncio
+async def test_iter_lines_handles_split_multibyte_characters():
+    data = "﻿ім'я\r\nПетро\nОлена".encode()
+    lines = [line async for line in importer.iter_lines(chunked(data, 3))]
+    assert lines == ["ім'я", "Петро", "Олена"]
+
+
+@pytest.mark.asyncio
+async def test_iter_lines_drops_overlong_lines(monkeypatch):
+    monkeypatch.setattr(importer, "MAX_RECORD_LENGTH", 8)
+    data = b"short\n" + b"x" * 30 + b"\nnext\n" + b"y" * 9 + b"\n" + b"z" * 20
+    lines = [line async for line in importer.iter_lines(chunked(data, 4))]
+    assert lines == ["short", None, "next", None, None]
+
+
+@pytest.mark.asyncio
+async def test_csv_import_reports_row_errors(client, db_session, current_user):
+    body = (
+        "first_name,last_name,email,phone,birthday,additional_info\n"
+        "Anna,Koval,anna@example.com,+380501,1990-05-03,\n"
+        "Bad,Email,not-an-email,+380502,1990-05-03,\n"
+        'Olena,Lys,olena@example.com,+380503,1985-12-31,"two\nlines, with ""quotes"""\n'
+        "Short,Row\n"
+    )
+    response = await client.post("/contacts/import", content=body.encode(), headers={"Content-Type": "text/csv"})
+    assert response.status_code == 200
+    result = response.json()
+    assert result["inserted"] == 2
+    assert result["failed"] == 2
+    assert [e["row"] for e in result["errors"]] == [2, 4]
+    assert result["errors"][0]["errors"][0].startswith("email:")
+
+    contacts = (await db_session.execute(
+        select(Contact).where(Contact.user_id == current_user.id).order_by(Contact.id)
+    )).scalars().all()
+    assert [c.first_name for c in contacts] == ["Anna", "Olena"]
+    assert contacts[0].additional_info is None
+    assert contacts[1].additional_info == 'two\nlines, with "quotes"'
+    assert [c.birthday_key for c in contacts] == [503, 1231]
+
+
+@pytest.mark.asyncio
+async def test_jsonl_import_in_batches(client, db_session, current_user, monkeypatch):
+    monkeypatch.setattr(importer, "BATCH_SIZE", 2)
+    rows = [
+        json.dumps({
+            "first_name": f"N{i}", "last_name": "L", "email": f"n{i}@example.com",
+            "phone": "1", "birthday": "1990-01-01", "additional_info": None,
+        })
+        for i in range(5)
+    ]
+    body = "\n".join(rows[:2] + ["{broken", "[1, 2]"] + rows[2:])
+    response = await client.post("/contacts/import", params={"format": "jsonl"}, content=body.encode())
+    assert response.status_code == 200
+    result = response.json()
+    assert (result["inserted"], result["failed"]) == (5, 2)
+    assert result["errors"][0]["errors"][0].startswith("invalid JSON")
+    assert result["errors"][1]["errors"] == ["expected a JSON object"]
+
+
+@pytest.mark.asyncio
+async def test_import_skips_duplicate_emails(client, current_user):
+    header = "first_name,last_name,email,phone,birthday,additional_info\n"
+    first = header + "Anna,Koval,anna@example.com,+380501,1990-05-03,\n"
+    await client.post("/contacts/import", content=first.encode(), headers={"Content-Type": "text/csv"})
+
+    body = header + (
+        "Anna,Koval,anna@example.com,+380501,1990-05-03,\n"
+        "Olena,Lys,olena@example.com,+380503,1985-12-31,\n"
+        "Olena,Again,olena@example.com,+380504,1985-12-31,\n"
+    )
+    response = await client.post("/contacts/import", content=body.encode(), headers={"Content-Type": "text/csv"})
+    result = response.json()
+    assert (result["inserted"], result["failed"]) == (1, 2)
+    assert [(e["row"], e["errors"]) for e in result["errors"]] == [
+        (1, [importer.DUPLICATE_EMAIL]), (3, [importer.DUPLICATE_EMAIL]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_import_requires_known_format(client, current_user):
+    response = await client.post("/contacts/import", content=b"x", headers={"Content-Type": "application/xml"})
+    assert response.status_code == 415
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_overlong_records(client, current_user, monkeypatch):
+    monkeypatch.setattr(importer, "MAX_RECORD_LENGTH", 80)
+    body = (
+        "first_name,last_name,email,phone,birthday,additional_info\n"
+        "Anna,Koval,anna@example.com,+380501,1990-05-03,\n"
+        f"Long,Row,long@example.com,+380502,1990-05-03,{'x' * 100}\n"
+        'Open,Quote,open@example.com,+380503,1990-05-03,"' + "line\n" * 20 + '"\n'
+        "Olena,Lys,olena@example.com,+380504,1985-12-31,\n"
+    )
+    response = await client.post("/contacts/import", content=body.encode(), headers={"Content-Type": "text/csv"})
+    result = response.json()
+    assert result["inserted"] == 2
+    assert [(e["row"], e["errors"]) for e in result["errors"]] == [
+        (2, [importer.RECORD_TOO_LONG]), (3, [importer.RECORD_TOO_LONG]),
+    ]
@@ -0,0 +1,125 @@
+import pytest
+from datetime import date
+
+from sqlalchemy import select
+
+from app.models.models import Contact
+from app.services.pagination import keyset_condition
+
+
+async def _seed(db_session, user, names):
+    for first, last in names:
+        db_session.add(Contact(
+            first_name=first,
+            last_name=last,
+            email=f"{first.lower()}.{last.lower()}@example.com",
+            phone="123456789",
+            birthday=date(1990, 1, 1),
+            user_id=user.id,
+        ))
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_keyset_pages_cover_all_contacts(client, db_session, current_user):
+    names = [("Ann", "Brown"), ("Bob", "Adams"), ("Cid", "Brown"), ("Dan", "Clark"), ("Eve", "Adams")]
+    await _seed(db_session, current_user, names)
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["after"] = cursor
+        response = await client.get("/contacts/", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page) <= 2
+        seen += [(c["last_name"], c["first_name"]) for c in page]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert seen == sorted((last, first) for first, last in names)
+
+
+@pytest.mark.asyncio
+async def test_keyset_descending_email_sort(client, db_session, current_user):
+    await _seed(db_session, current_user, [("Ann", "Brown"), ("Bob", "Adams"), ("Cid", "Clark")])
+
+    first = await client.get("/contacts/", params={"limit": 2, "sort": "-email"})
+    second = await client.get(
+        "/contacts/", params={"limit": 2, "sort": "-email", "after": first.headers["X-Next-Cursor"]}
+    )
+
+    emails = [c["email"] for c in first.json() + second.json()]
+    assert emails == sorted(emails, reverse=True)
+    assert len(emails) == 3
+    assert "X-Next-Cursor" not in second.headers
+
+
+@pytest.mark.asyncio
+async def test_cursor_from_other_sort_is_rejected(client, db_session, current_user):
+    await _seed(db_session, current_user, [("Ann", "Brown"), ("Bob", "Adams")])
+    first = await client.get("/contacts/", params={"limit": 1, "sort": "email"})
+
+    response = await client.get("/contacts/", params={"after": first.headers["X-Next-Cursor"]})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+    response = await client.get("/contacts/", params={"after": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+NULL_NAMES = [("Ann", "Brown"), (None, "Brown"), ("Bob", None), (None, None), ("Cid", None), ("Dan", "Adams")]
+
+
+async def _seed_with_nulls(db_session, user):
+    for i, (first, last) in enumerate(NULL_NAMES):
+        db_session.add(Contact(
+            first_name=first, last_name=last, email=None if i % 2 else f"c{i}@example.com",
+            phone="123456789", birthday=date(1990, 1, 1), user_id=user.id,
+        ))
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sort", ["name", "-name", "email", "-email"])
+async def test_keyset_pages_across_null_sort_keys(client, db_session, current_user, sort):
+    await _seed_with_nulls(db_session, current_user)
+    full = await client.get("/contacts/", params={"sort": sort, "fields": "id"})
+    expected = [c["id"] for c in full.json()]
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 1, "sort": sort, "fields": "id"}
+        if cursor:
+            params["after"] = cursor
+        response = await client.get("/contacts/", params=params)
+        assert response.status_code == 200
+        seen += [c["id"] for c in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert seen == expected
+    assert len(seen) == len(NULL_NAMES)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("nulls_last", [False, True])
+async def test_keyset_condition_matches_null_ordering(db_session, current_user, descending, nulls_last):
+    await _seed_with_nulls(db_session, current_user)
+    columns = (Contact.last_name, Contact.first_name, Contact.id)
+
+    def ordered(column):
+        column = column.desc() if descending else column.asc()
+        return column.nulls_last() if nulls_last != descending else column.nulls_first()
+
+    stmt = select(*columns).order_by(*(ordered(c) for c in columns))
+    rows = (await db_session.execute(stmt)).all()
+    for i, boundary in enumerate(rows):
+        after = (await db_session.execute(
+            stmt.where(keyset_condition(columns, list(boundary), descending, nulls_last))
+        )).all()
+        assert after == rows[i + 1:]
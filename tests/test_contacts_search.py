@@ -0,0 +1,95 @@
+import pytest
+from datetime import date
+from sqlalchemy.dialects import postgresql
+
+from app.models.models import Contact, User
+from app.services.search import build_search_query, fts5_query
+
+
+async def _seed(db_session, user_id, people):
+    for first, last, email in people:
+        db_session.add(Contact(
+            first_name=first,
+            last_name=last,
+            email=email,
+            phone="123456789",
+            birthday=date(1990, 1, 1),
+            user_id=user_id,
+        ))
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_exact_match_first(client, db_session, current_user):
+    await _seed(db_session, current_user.id, [
+        ("Annette", "Moss", "annette@example.com"),
+        ("Anna", "Lee", "lee@example.com"),
+        ("Bob", "Stone", "bob@example.com"),
+    ])
+
+    response = await client.get("/contacts/search", params={"q": "anna"})
+    assert response.status_code == 200
+    names = [c["first_name"] for c in response.json()]
+    assert names[0] == "Anna"
+    assert "Bob" not in names
+
+
+@pytest.mark.asyncio
+async def test_search_matches_substring_typo_and_prefix(client, db_session, current_user):
+    await _seed(db_session, current_user.id, [
+        ("Jonathan", "Smith", "jsmith@corp.io"),
+        ("Bob", "Stone", "bob@example.com"),
+    ])
+
+    by_email = await client.get("/contacts/search", params={"q": "corp.io"})
+    assert [c["last_name"] for c in by_email.json()] == ["Smith"]
+
+    typo = await client.get("/contacts/search", params={"q": "jonathon"})
+    assert typo.json()[0]["first_name"] == "Jonathan"
+
+    prefix = await client.get("/contacts/search", params={"q": "bob"})
+    assert [c["first_name"] for c in prefix.json()] == ["Bob"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("q", ["   ", "bo", " bo  "])
+async def test_short_or_blank_query_is_rejected(client, current_user, q):
+    response = await client.get("/contacts/search", params={"q": q})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_search_is_scoped_to_user_and_paginated(client, db_session, current_user):
+    other = User(email="other@example.com", hashed_password="x", is_verified=True)
+    db_session.add(other)
+    await db_session.commit()
+    await _seed(db_session, other.id, [("Mark", "Other", "mark@other.com")])
+    await _seed(db_session, current_user.id, [
+        ("Mark", "One", "mark1@example.com"),
+        ("Mark", "Two", "mark2@example.com"),
+    ])
+
+    first = await client.get("/contacts/search", params={"q": "mark", "limit": 1})
+    second = await client.get(
+        "/contacts/search", params={"q": "mark", "limit": 1, "after": first.headers["X-Next-Cursor"]}
+    )
+    found = first.json() + second.json()
+    assert sorted(c["last_name"] for c in found) == ["One", "Two"]
+    assert "X-Next-Cursor" not in second.headers
+
+
+def test_fts5_query_escapes_quotes():
+    assert fts5_query('a"bc') == '"a""bc"'
+    assert fts5_query('a"bc', fuzzy=True) == '"a""b" OR """bc"'
+    assert fts5_query("ab") == ""
+    assert fts5_query("ab  cd") == '"ab cd"'
+    with pytest.raises(ValueError):
+        build_search_query("sqlite", 1, " ab ")
+
+
+def test_postgres_query_uses_indexed_expressions():
+    exact = str(build_search_query("postgresql", 1, "john").compile(dialect=postgresql.dialect()))
+    assert "to_tsvector('simple', (coalesce(first_name, '')" in exact
+    assert "ILIKE" in exact
+    fuzzy = str(build_search_query("postgresql", 1, "jonh", fuzzy=True).compile(dialect=postgresql.dialect()))
+    assert "<%% (coalesce(first_name, '')" in fuzzy
@@ -0,0 +1,59 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.database.db import pool_options
+from app.database.pool import InstrumentedQueuePool, PoolMetrics
+
+
+def test_pool_options_from_settings():
+    options = pool_options("postgresql+asyncpg://u:p@db/contacts")
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert options["pool_pre_ping"] is True
+    assert {"pool_size", "max_overflow", "pool_timeout", "pool_recycle"} <= options.keys()
+    assert "poolclass" not in pool_options("sqlite+aiosqlite:///:memory:")
+
+
+@pytest.mark.asyncio
+async def test_metrics_track_checkouts_overflow_and_timeouts(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool, pool_size=1, max_overflow=1, pool_timeout=0.05,
+    )
+    metrics = PoolMetrics().attach(engine)
+    try:
+        first = await engine.connect()
+        second = await engine.connect()
+        await first.execute(text("select 1"))
+        state = metrics.snapshot()
+        assert state["checkedout"] == 2
+        assert state["overflow"] == 1
+        with pytest.raises(PoolTimeoutError):
+            await engine.connect()
+        await first.close()
+        await second.close()
+
+        state = metrics.snapshot()
+        assert state["checkedout"] == 0
+        assert state["peak_checked_out"] == 2
+        assert state["peak_overflow"] == 1
+        assert state["timeouts"] == 1
+        assert state["checkouts"] == 2
+        assert state["wait_seconds"]["count"] == 2
+        assert state["connections_opened"] == 2
+        assert state["connections_closed"] == 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_endpoint_is_admin_only(client, current_user):
+    assert (await client.get("/users/pool-stats")).status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_endpoint(client, admin_user):
+    response = await client.get("/users/pool-stats")
+    assert response.status_code == 200
+    assert {"checkouts", "wait_seconds", "connections_opened"} <= response.json().keys()
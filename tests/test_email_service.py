@@ -1,23 +1,22 @@
 import pytest
-from unittest.mock import AsyncMock, patch
-from app.services.email import send_verification_email, send_reset_email
+from sqlalchemy import select
 
-@pytest.mark.asyncio
-@patch("app.services.email.FastMail")
-async def test_send_verification_email(mock_fastmail):
-    mock_send = AsyncMock()
-    mock_fastmail.return_value.send_message = mock_send
+from app.models.models import EmailOutbox, OutboxStatus
+from app.services.email import enqueue_verification_email, enqueue_reset_email
 
-    await send_verification_email("test@example.com", "fake-token")
+@pytest.mark.asyncio
+async def test_send_verification_email(db_session):
+    await enqueue_verification_email("test@example.com", "fake-token", db_session)
 
-    mock_send.assert_awaited_once()
+    item = (await db_session.execute(select(EmailOutbox))).scalar_one()
+    assert item.recipient == "test@example.com"
+    assert item.status == OutboxStatus.PENDING
+    assert "/auth/verify?token=fake-token" in item.body
 
 @pytest.mark.asyncio
-@patch("app.services.email.FastMail")
-async def test_send_reset_email(mock_fastmail):
-    mock_send = AsyncMock()
-    mock_fastmail.return_value.send_message = mock_send
-
-    await send_reset_email("test@example.com", "fake-reset-token")
+async def test_send_reset_email(db_session):
+    await enqueue_reset_email("test@example.com", "fake-reset-token", db_session)
 
-    mock_send.assert_awaited_once()
\ No newline at end of file
+    item = (await db_session.execute(select(EmailOutbox))).scalar_one()
+    assert item.subject == "Password reset"
+    assert "fake-reset-token" in item.body
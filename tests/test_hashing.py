@@ -0,0 +1,47 @@
+import asyncio
+import time
+
+import pytest
+
+from app.services.auth import auth_service
+from app.services.hashing import PasswordHasher
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_roundtrip():
+    hashed = await auth_service.hash_password("Secret123")
+    assert await auth_service.verify_password("Secret123", hashed)
+    assert not await auth_service.verify_password("Wrong", hashed)
+
+
+@pytest.mark.asyncio
+async def test_hashing_does_not_block_event_loop():
+    hasher = PasswordHasher(workers=2)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    task = asyncio.create_task(ticker())
+    await hasher.hash("Secret123")
+    task.cancel()
+    hasher.shutdown()
+    assert ticks > 1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_and_queue_metrics():
+    hasher = PasswordHasher(workers=1)
+    await asyncio.gather(*(hasher._run(time.sleep, 0.02) for _ in range(3)))
+    stats = hasher.stats()
+    hasher.shutdown()
+
+    assert stats["workers"] == 1
+    assert stats["completed"] == 3
+    assert stats["max_queue_depth"] == 2
+    assert stats["queue_depth"] == 0
+    assert stats["in_flight"] == 0
+    assert stats["queue_wait_seconds_total"] > 0.02
@@ -0,0 +1,104 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.cache import redis
+from app.services.metrics import (
+    Histogram, HTTPMetrics, MetricsMiddleware, UNMATCHED_ROUTE, db_metrics, http_metrics, redis_metrics,
+    render_prometheus,
+)
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+    assert histogram.cumulative() == {"0.1": 2, "1.0": 3, "+Inf": 4}
+    assert histogram.count == 4 and histogram.sum == pytest.approx(3.65)
+
+
+@pytest.mark.asyncio
+async def test_middleware_records_route_template_status_and_in_flight():
+    metrics = HTTPMetrics()
+    release = asyncio.Event()
+
+    async def app(scope, receive, send):
+        scope["route"] = SimpleNamespace(path="/contacts/{contact_id}")
+        await release.wait()
+        await send({"type": "http.response.start", "status": 404, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def send(message):
+        pass
+
+    middleware = MetricsMiddleware(app, metrics)
+    tasks = [
+        asyncio.create_task(middleware({"type": "http", "method": "GET", "path": f"/contacts/{i}"}, None, send))
+        for i in range(3)
+    ]
+    await asyncio.sleep(0)
+    assert metrics.in_flight() == {("GET", "/contacts/{contact_id}"): 3}
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert metrics.in_flight() == {}
+    stats = metrics.routes[("GET", "/contacts/{contact_id}")]
+    assert stats.status_counts() == {"4xx": 3}
+    assert stats.latency.count == 3
+
+
+@pytest.mark.asyncio
+async def test_unhandled_error_is_counted_as_server_error():
+    metrics = HTTPMetrics()
+
+    async def app(scope, receive, send):
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await MetricsMiddleware(app, metrics)({"type": "http", "method": "POST", "path": "/x"}, None, None)
+    assert metrics.routes[("POST", UNMATCHED_ROUTE)].status_counts() == {"5xx": 1}
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(client, current_user):
+    await client.get("/contacts/123")
+    await redis.get("metrics-test")
+    response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'http_requests_total{method="GET",route="/contacts/{contact_id}",status="4xx"}' in body
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/contacts/{contact_id}",le="+Inf"}' in body
+    assert 'http_requests_in_flight{method="GET",route="/metrics"} 1' in body
+    assert 'redis_command_duration_seconds_count{command="GET"}' in body
+    assert 'db_query_duration_seconds_count{statement="SELECT"}' in body
+    assert "db_pool_checkouts_total" in body
+    assert "# TYPE password_hash_queue_depth gauge" in body
+    assert "# TYPE password_hash_queue_wait_seconds_total counter" in body
+    assert "password_hash_in_flight 0" in body
+
+
+@pytest.mark.asyncio
+async def test_redis_and_db_calls_are_timed(client, current_user):
+    pipelines = redis_metrics.histograms.get("PIPELINE", Histogram()).count
+    inserts = db_metrics.histograms.get("INSERT", Histogram()).count
+    await client.post("/contacts/", json={
+        "first_name": "A", "last_name": "B", "email": "a@example.com",
+        "phone": "1", "birthday": "1990-01-01", "additional_info": None,
+    })
+    assert redis_metrics.histograms["PIPELINE"].count > pipelines
+    assert db_metrics.histograms["INSERT"].count == inserts + 1
+    assert http_metrics.routes[("POST", "/contacts/")].latency.count >= 1
+
+
+def test_password_hasher_stats_are_exported():
+    body = render_prometheus(hasher={
+        "workers": 4, "queue_depth": 3, "max_queue_depth": 5, "in_flight": 4,
+        "completed": 10, "queue_wait_seconds_total": 1.5,
+    })
+    assert "password_hash_queue_depth 3" in body
+    assert "password_hash_in_flight 4" in body
+    assert "password_hash_completed_total 10" in body
+    assert "password_hash_queue_wait_seconds_total 1.5" in body
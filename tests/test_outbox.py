@@ -0,0 +1,167 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select, update
+
+from app.conf.config import settings
+from app.models.models import EmailOutbox, OutboxStatus, User
+from app.routes import auth as auth_routes
+from app.services.email import enqueue_email
+from app.services.fake_smtp import FakeSMTPServer
+from app.services.outbox import LEASE_MARGIN_SECONDS, OutboxWorker
+from app.services.smtp_pool import SMTPPool
+
+
+@pytest.fixture
+async def smtp_server():
+    async with FakeSMTPServer() as server:
+        yield server
+
+
+def make_worker(server, **kwargs):
+    pool = SMTPPool("127.0.0.1", server.port, size=2)
+    return OutboxWorker(pool, batch_size=kwargs.pop("batch_size", 10), backoff_base=0, **kwargs)
+
+
+async def statuses(db_session):
+    db_session.expire_all()
+    rows = (await db_session.execute(select(EmailOutbox).order_by(EmailOutbox.id))).scalars().all()
+    return [row.status for row in rows]
+
+
+@pytest.mark.asyncio
+async def test_worker_delivers_batch_over_pooled_connections(db_session, smtp_server):
+    for i in range(12):
+        await enqueue_email(f"user{i}@example.com", "Hello", f"Привіт {i}", db_session)
+    worker = make_worker(smtp_server)
+
+    assert await worker.run_once() == 10
+    assert await worker.run_once() == 2
+    assert await worker.run_once() == 0
+
+    assert await statuses(db_session) == [OutboxStatus.SENT] * 12
+    assert len(smtp_server.messages) == 12
+    assert smtp_server.messages[0]["To"] == "user0@example.com"
+    assert smtp_server.messages[0].get_content().strip() == "Привіт 0"
+    assert worker.stats()["sent"] == 12
+    assert smtp_server.connections == worker.stats()["smtp_connections_opened"] <= 2
+    await worker.pool.close()
+
+
+@pytest.mark.asyncio
+async def test_worker_retries_then_gives_up(db_session, smtp_server):
+    await enqueue_email("retry@example.com", "S", "B", db_session)
+    await enqueue_email("dead@example.com", "S", "B", db_session)
+    worker = make_worker(smtp_server, max_attempts=2)
+
+    smtp_server.fail_next = 2
+    await worker.run_once()
+    assert await statuses(db_session) == [OutboxStatus.PENDING, OutboxStatus.PENDING]
+    row = (await db_session.execute(select(EmailOutbox).limit(1))).scalar_one()
+    assert row.attempts == 1 and "451" in row.last_error
+
+    smtp_server.fail_next = 1
+    await worker.run_once()
+    result = await statuses(db_session)
+    assert sorted(s.value for s in result) == ["failed", "sent"]
+    assert (worker.retried, worker.failed, worker.sent) == (2, 1, 1)
+    await worker.pool.close()
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_reclaimed(db_session, smtp_server):
+    item = await enqueue_email("lease@example.com", "S", "B", db_session)
+    await db_session.execute(
+        update(EmailOutbox).where(EmailOutbox.id == item.id).values(
+            status=OutboxStatus.SENDING, attempts=1, next_attempt_at=datetime.utcnow() - timedelta(seconds=1),
+        )
+    )
+    await db_session.commit()
+    worker = make_worker(smtp_server)
+
+    assert await worker.run_once() == 1
+    assert await statuses(db_session) == [OutboxStatus.SENT]
+    await worker.pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_reconnects_after_server_drops_connection(smtp_server):
+    pool = SMTPPool("127.0.0.1", smtp_server.port, size=1)
+    from app.services.outbox import build_message
+
+    await pool.send(build_message("a@example.com", "S", "B"))
+    pool._idle[0].close()
+    await pool.send(build_message("b@example.com", "S", "B"))
+
+    assert len(smtp_server.messages) == 2
+    assert pool.connections_opened == 2
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_run_stops_on_event(db_session, smtp_server):
+    await enqueue_email("loop@example.com", "S", "B", db_session)
+    worker = make_worker(smtp_server, poll_interval=0.01)
+    stop = asyncio.Event()
+    task = asyncio.create_task(worker.run(stop))
+    for _ in range(100):
+        if smtp_server.messages:
+            break
+        await asyncio.sleep(0.01)
+    stop.set()
+    await asyncio.wait_for(task, 1)
+    assert len(smtp_server.messages) == 1
+
+
+@pytest.mark.asyncio
+async def test_lease_covers_worst_case_batch(db_session, smtp_server):
+    item = await enqueue_email("lease@example.com", "S", "B", db_session)
+    pool = SMTPPool("127.0.0.1", smtp_server.port, size=4, timeout=30)
+    worker = OutboxWorker(pool, batch_size=50)
+    assert worker.lease_seconds == 13 * 90 + LEASE_MARGIN_SECONDS
+
+    async with worker.session_factory() as db:
+        claimed_at = datetime.utcnow()
+        assert [row.id for row in await worker._claim(db)] == [item.id]
+    await db_session.refresh(item)
+    assert item.next_attempt_at >= claimed_at + timedelta(seconds=worker.lease_seconds - 1)
+
+
+@pytest.mark.asyncio
+async def test_slow_message_times_out_and_is_retried(db_session):
+    async with FakeSMTPServer(latency=0.5) as server:
+        await enqueue_email("slow@example.com", "S", "B", db_session)
+        pool = SMTPPool("127.0.0.1", server.port, size=1, timeout=0.05)
+        worker = OutboxWorker(pool, batch_size=10, backoff_base=0)
+        await worker.run_once()
+        await pool.close()
+    db_session.expire_all()
+    row = (await db_session.execute(select(EmailOutbox))).scalar_one()
+    assert row.status == OutboxStatus.PENDING
+    assert "TimeoutError" in row.last_error
+    assert pool._idle == []
+
+
+@pytest.mark.asyncio
+async def test_register_stores_user_and_email_in_one_transaction(client, db_session, monkeypatch):
+    monkeypatch.setattr(settings, "testing", False)
+
+    async def crash(*args, **kwargs):
+        await enqueue_email(*args[:1], "S", "B", db_session, commit=False)
+        raise RuntimeError("crash before commit")
+
+    monkeypatch.setattr(auth_routes, "enqueue_verification_email", crash)
+    with pytest.raises(RuntimeError):
+        await client.post("/auth/register", json={"email": "crash@example.com", "password": "secret123"})
+    await db_session.rollback()
+    assert (await db_session.execute(select(User).where(User.email == "crash@example.com"))).first() is None
+    assert (await db_session.execute(select(EmailOutbox))).first() is None
+
+    monkeypatch.undo()
+    monkeypatch.setattr(settings, "testing", False)
+    response = await client.post("/auth/register", json={"email": "new@example.com", "password": "secret123"})
+    assert response.status_code == 201
+    await db_session.rollback()
+    assert (await db_session.execute(select(User).where(User.email == "new@example.com"))).first() is not None
+    assert (await db_session.execute(select(EmailOutbox.recipient))).scalars().all() == ["new@example.com"]
@@ -0,0 +1,75 @@
+import logging
+
+import pytest
+from sqlalchemy import select, text
+
+from app.conf.config import settings
+from app.database.instrumentation import normalize_sql, track_queries
+from app.models.models import Contact
+
+
+@pytest.fixture
+def debug_headers(monkeypatch):
+    monkeypatch.setattr(settings, "query_debug_headers", True)
+
+
+def test_normalize_sql():
+    sql = "SELECT *\n  FROM contacts WHERE id IN (?, ?, ?) AND name = 'O''Neil' AND user_id = $1 LIMIT 10"
+    assert normalize_sql(sql) == "SELECT * FROM contacts WHERE id IN (?...) AND name = ? AND user_id = ? LIMIT ?"
+    assert normalize_sql("SELECT a::text FROM t WHERE b = :b_1") == "SELECT a::text FROM t WHERE b = ?"
+
+
+@pytest.mark.asyncio
+async def test_track_queries_counts_statements(db_session):
+    with track_queries() as queries:
+        await db_session.execute(select(Contact))
+        await db_session.execute(text("SELECT 1"))
+    assert queries.count == 2
+    assert queries.seconds > 0
+
+
+@pytest.mark.asyncio
+async def test_query_count_header(client, create_contact, contact_payload, debug_headers):
+    created = await create_contact()
+    response = await client.get(f"/contacts/{created['id']}")
+    assert response.status_code == 200
+    assert int(response.headers["X-DB-Query-Count"]) <= 1
+    assert float(response.headers["X-DB-Query-Time-Ms"]) >= 0
+
+    updated = await client.patch(f"/contacts/{created['id']}", json={**contact_payload, "phone": "+380500000000"})
+    assert int(updated.headers["X-DB-Query-Count"]) == 1
+
+    deleted = await client.delete(f"/contacts/{created['id']}")
+    assert int(deleted.headers["X-DB-Query-Count"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_headers_are_off_by_default(client, current_user):
+    response = await client.get("/contacts/")
+    assert "X-DB-Query-Count" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_and_repeated_selects_are_logged(client, current_user, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "slow_query_ms", 0.0)
+    monkeypatch.setattr(settings, "n_plus_one_threshold", 2)
+    caplog.set_level(logging.WARNING, logger="app.database.instrumentation")
+    from app.main import app
+
+    @app.get("/test-n-plus-one", include_in_schema=False)
+    async def n_plus_one():
+        from app.database.db import AsyncSessionLocal
+
+        async with AsyncSessionLocal() as session:
+            for contact_id in range(3):
+                await session.execute(select(Contact).where(Contact.id == contact_id))
+        return {}
+
+    try:
+        await client.get("/test-n-plus-one")
+    finally:
+        app.router.routes.pop()
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert any(m.startswith("Slow query") and "WHERE contacts.id = ?" in m for m in messages)
+    assert any(m.startswith("Possible N+1 in GET /test-n-plus-one: 3 x SELECT") for m in messages)
@@ -0,0 +1,101 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import insert, text
+
+from app.database.db import engine
+from app.database.explain import record_statements, sequential_scans
+from app.models.models import Contact, User
+from app.repository.user_cache import local_users
+from app.services.cache import redis
+
+CONTACTS_PER_USER = 300
+
+
+def _rows(user_id: int):
+    for i in range(CONTACTS_PER_USER):
+        birthday = date(1970 + i % 40, 1 + i % 12, 1 + i % 28)
+        yield {
+            "first_name": ["Anna", "Oleh", "Maria", "Taras"][i % 4],
+            "last_name": f"Kovalenko{i % 50}",
+            "email": f"user{user_id}.contact{i}@example.com",
+            "phone": f"+380{i:09d}",
+            "birthday": birthday,
+            "birthday_key": birthday.month * 100 + birthday.day,
+            "user_id": user_id,
+        }
+
+
+@pytest.fixture
+async def seeded(db_session, current_user):
+    other = User(email="other@example.com", hashed_password="x", is_verified=True)
+    db_session.add(other)
+    await db_session.commit()
+    for user_id in (current_user.id, other.id):
+        await db_session.execute(insert(Contact), list(_rows(user_id)))
+    await db_session.commit()
+    await db_session.execute(text("ANALYZE"))
+    ids = (await db_session.execute(
+        text("SELECT id FROM contacts WHERE user_id = :u ORDER BY id"), {"u": current_user.id}
+    )).scalars().all()
+    return ids
+
+
+async def _list_pages(client, ids, contact):
+    for sort in ("name", "-name", "email", "-email", "id", "-id"):
+        first = await client.get("/contacts/", params={"limit": 20, "sort": sort})
+        await client.get("/contacts/", params={"limit": 20, "sort": sort, "after": first.headers["X-Next-Cursor"]})
+    return first
+
+
+async def _me_from_database(client, ids, contact):
+    local_users.clear()
+    await redis.flushdb()
+    return await client.get("/users/me")
+
+
+ROUTES = {
+    "list": _list_pages,
+    "detail": lambda client, ids, contact: client.get(f"/contacts/{ids[0]}"),
+    "search": lambda client, ids, contact: client.get("/contacts/search", params={"q": "Kovalenko7"}),
+    "search_fuzzy": lambda client, ids, contact: client.get("/contacts/search", params={"q": "Kovalneko"}),
+    "birthdays": lambda client, ids, contact: client.get("/contacts/birthdays", params={"days": 30}),
+    "export": lambda client, ids, contact: client.get("/contacts/export"),
+    "update": lambda client, ids, contact: client.patch(f"/contacts/{ids[1]}", json=contact),
+    "delete": lambda client, ids, contact: client.delete(f"/contacts/{ids[2]}"),
+    "batch_update_ids": lambda client, ids, contact: client.request(
+        "PATCH", "/contacts/batch", json={"ids": ids[3:8], "changes": {"additional_info": "x"}}
+    ),
+    "batch_update_filter": lambda client, ids, contact: client.request(
+        "PATCH", "/contacts/batch", json={"filter": {"first_name": "Oleh"}, "changes": {"additional_info": "x"}}
+    ),
+    "batch_delete_filter": lambda client, ids, contact: client.request(
+        "DELETE", "/contacts/batch", json={"filter": {"email_domain": "example.com", "last_name": "Kovalenko3"}}
+    ),
+    "users_me": _me_from_database,
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("route", ROUTES)
+async def test_route_queries_use_indexes(client, seeded, contact_payload, route):
+    with record_statements(engine) as statements:
+        response = await ROUTES[route](client, seeded, contact_payload)
+    assert response.status_code < 400
+    assert statements
+
+    scans = {}
+    async with engine.connect() as conn:
+        for recorded in statements:
+            tables = await conn.run_sync(sequential_scans, recorded)
+            if tables:
+                scans[recorded.statement] = tables
+    assert scans == {}
+
+
+@pytest.mark.asyncio
+async def test_sequential_scan_is_reported(db_session):
+    with record_statements(engine) as statements:
+        await db_session.execute(text("SELECT * FROM contacts WHERE phone = '1'"))
+    async with engine.connect() as conn:
+        assert await conn.run_sync(sequential_scans, statements[0]) == ["contacts"]
@@ -0,0 +1,113 @@
+from unittest.mock import patch
+
+import pytest
+from aioredis.exceptions import ConnectionError as RedisConnectionError
+
+from app.repository.user_cache import local_users
+from app.services import rate_limit
+from app.services.cache import redis
+from app.services.rate_limit import LocalSlidingWindow, RateLimiter, RateLimitRule, limiter
+
+
+def test_parse_rule():
+    assert RateLimitRule.parse("5/minute") == RateLimitRule(5, 60)
+    assert RateLimitRule.parse("100/10 seconds") == RateLimitRule(100, 10)
+    with pytest.raises(ValueError):
+        RateLimitRule.parse("five per minute")
+
+
+def test_local_window_weights_previous_interval(monkeypatch):
+    window = LocalSlidingWindow()
+    rule = RateLimitRule(4, 10)
+    monkeypatch.setattr(rate_limit.time, "time", lambda: 1000.0)
+    assert [window.hit("k", rule).allowed for _ in range(5)] == [True, True, True, True, False]
+
+    monkeypatch.setattr(rate_limit.time, "time", lambda: 1012.5)
+    result = window.hit("k", rule)
+    assert result.allowed and result.remaining == 0
+    denied = window.hit("k", rule)
+    assert not denied.allowed and denied.retry_after == pytest.approx(2.5)
+
+    monkeypatch.setattr(rate_limit.time, "time", lambda: 1030.0)
+    assert window.hit("k", rule).remaining == 3
+
+
+def test_local_window_keeps_bounded_number_of_keys():
+    window = LocalSlidingWindow(maxsize=3)
+    rule = RateLimitRule(1, 60)
+    for ip in range(10):
+        assert window.hit(f"ip:{ip}", rule).allowed
+    assert len(window._buckets) == 3
+    assert not window.hit("ip:9", rule).allowed
+
+
+@pytest.mark.asyncio
+async def test_redis_counters_are_shared_between_limiters():
+    rule = RateLimitRule(3, 60)
+    first, second = RateLimiter(), RateLimiter()
+    results = [(await limiter_.hit("shared", rule))[0] for limiter_ in (first, second, first, second)]
+    assert [r.allowed for r in results] == [True, True, True, False]
+    assert results[-1].retry_after > 0
+
+
+@pytest.mark.asyncio
+async def test_redis_script_is_loaded_on_first_use():
+    await redis.script_flush()
+    result, _ = await RateLimiter().hit("fresh", RateLimitRule(1, 60))
+    assert result.allowed
+    result, _ = await RateLimiter().hit("fresh", RateLimitRule(1, 60))
+    assert not result.allowed
+
+
+@pytest.mark.asyncio
+async def test_register_is_limited_per_ip(client):
+    for i in range(5):
+        r = await client.post("/auth/register", json={"email": f"u{i}@example.com", "password": "Secret123"})
+        assert r.status_code == 201
+    assert r.headers["X-RateLimit-Remaining"] == "0"
+
+    r = await client.post("/auth/register", json={"email": "u5@example.com", "password": "Secret123"})
+    assert r.status_code == 429
+    assert int(r.headers["Retry-After"]) >= 1
+
+
+@pytest.mark.asyncio
+async def test_user_lookup_shares_round_trip_with_limit(client, current_user):
+    local_users.clear()
+    with patch.object(redis, "get", wraps=redis.get) as get:
+        r = await client.get("/users/me")
+    assert r.status_code == 200
+    assert r.headers["X-RateLimit-Limit"] == "120"
+    assert get.call_count == 0
+
+
+@pytest.mark.asyncio
+async def test_limits_are_per_user_and_route(client, current_user, monkeypatch):
+    monkeypatch.setattr(limiter, "hit", wraps_hit := _recording(limiter.hit))
+    await client.get("/users/me")
+    await client.get("/contacts/")
+    keys = [call[0] for call in wraps_hit.calls]
+    assert keys == ["GET:/users/me:user:testuser@example.com", "GET:/contacts/:user:testuser@example.com"]
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_local_counters_when_redis_is_down(client, monkeypatch):
+    def broken_pipeline(*args, **kwargs):
+        raise RedisConnectionError("down")
+
+    monkeypatch.setattr(redis, "pipeline", broken_pipeline)
+    monkeypatch.setattr(limiter, "_redis_down_until", 0.0)
+    codes = []
+    for i in range(6):
+        r = await client.post("/auth/register", json={"email": f"d{i}@example.com", "password": "Secret123"})
+        codes.append(r.status_code)
+    assert codes == [201] * 5 + [429]
+
+
+def _recording(hit):
+    async def wrapper(key, rule, prefetch=None):
+        wrapper.calls.append((key, rule, prefetch))
+        return await hit(key, rule, prefetch)
+
+    wrapper.calls = []
+    return wrapper
@@ -0,0 +1,182 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database.db import Base
+from app.database.replica import RECENT_WRITES_SIZE, ReplicaRouter, replica_router
+from app.models.models import Contact, User
+from app.repository.user_cache import local_users
+from app.services.auth import auth_service
+from app.services.cache import redis
+from app.services.lru import TTLCache
+
+
+@pytest.fixture
+async def replica_db():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+def replica(replica_db, monkeypatch):
+    monkeypatch.setattr(replica_router, "replica", replica_db)
+    monkeypatch.setattr(replica_router, "lag", None)
+    monkeypatch.setattr(replica_router, "_checked_at", float("-inf"))
+    monkeypatch.setattr(replica_router, "_down_until", 0.0)
+    monkeypatch.setattr(replica_router, "_probe", None)
+    monkeypatch.setattr(replica_router, "_recent_writes", TTLCache(RECENT_WRITES_SIZE, replica_router.window))
+    return replica_db
+
+
+@pytest.mark.asyncio
+async def test_disabled_router_reads_from_primary():
+    router = ReplicaRouter(None, max_lag=5, check_interval=1, retry_delay=10)
+    assert await router.use_replica(1) is False
+    await router.record_write(1)
+    assert router.stats()["enabled"] is False
+
+
+@pytest.mark.asyncio
+async def test_recent_write_keeps_user_on_primary(replica_db):
+    router = ReplicaRouter(replica_db, max_lag=5, check_interval=1, retry_delay=10)
+    assert await router.use_replica(1) is True
+    assert router.lag == 0.0
+
+    await router.record_write(1)
+    assert await router.use_replica(1) is False
+    assert await router.use_replica(2) is True
+    assert await redis.pttl("recent-write:1") > 0
+
+    router._recent_writes.clear()
+    assert await router.use_replica(1) is False, "other processes see the write through Redis"
+    assert router.stats()["fallbacks"]["read_your_writes"] == 2
+
+
+@pytest.mark.asyncio
+async def test_lagging_replica_is_skipped(replica_db, monkeypatch):
+    router = ReplicaRouter(replica_db, max_lag=5, check_interval=0, retry_delay=10)
+
+    async def lag(session):
+        return 30.0
+
+    monkeypatch.setattr(router, "_measure_lag", lag)
+    assert await router.use_replica(1) is False
+    assert router.stats()["fallbacks"]["lag"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unavailable_replica_falls_back(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    router = ReplicaRouter(sessionmaker(bind=engine, class_=AsyncSession), max_lag=5, check_interval=1, retry_delay=10)
+    try:
+        assert await router.use_replica(1) is False
+        assert await router.use_replica(1) is False
+        stats = router.stats()
+        assert stats["available"] is False
+        assert stats["fallbacks"]["unavailable"] == 2
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_query_error_on_replica_marks_it_down(replica_db):
+    router = ReplicaRouter(replica_db, max_lag=5, check_interval=1, retry_delay=10)
+    assert await router.use_replica(1) is True
+    with pytest.raises(OperationalError):
+        async with router.session() as session:
+            await session.execute(text("SELECT * FROM missing_table"))
+    assert await router.use_replica(1) is False
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_replica_until_user_writes(client, current_user, create_contact, replica):
+    async with replica() as session:
+        session.add(Contact(
+            first_name="Replica", last_name="Only", email="replica@example.com",
+            phone="+380500000000", birthday=date(1990, 1, 1), user_id=current_user.id,
+        ))
+        await session.commit()
+
+    listed = await client.get("/contacts/")
+    assert [c["first_name"] for c in listed.json()] == ["Replica"]
+
+    await create_contact()
+    listed = await client.get("/contacts/")
+    assert [c["first_name"] for c in listed.json()] == ["Anna"]
+
+    assert replica_router.stats()["fallbacks"]["read_your_writes"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_user_cache_miss_reads_replica(client, current_user, replica):
+    async with replica() as session:
+        session.add(User(
+            id=current_user.id, email=current_user.email, hashed_password="x",
+            is_verified=True, avatar_url="https://replica/avatar.png",
+        ))
+        await session.commit()
+    local_users.clear()
+    await redis.delete(f"user:{current_user.email}")
+
+    response = await client.get("/users/me")
+    assert response.status_code == 200
+    assert response.json()["avatar_url"] == "https://replica/avatar.png"
+
+
+@pytest.fixture
+async def broken_replica(monkeypatch):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    monkeypatch.setattr(replica_router, "replica", sessionmaker(bind=engine, class_=AsyncSession))
+    monkeypatch.setattr(replica_router, "lag", 0.0)
+    monkeypatch.setattr(replica_router, "_checked_at", float("inf"))
+    monkeypatch.setattr(replica_router, "_down_until", 0.0)
+    monkeypatch.setattr(replica_router, "_recent_writes", TTLCache(RECENT_WRITES_SIZE, replica_router.window))
+    yield
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_failed_replica_read_is_retried_on_primary(client, db_session, current_user, broken_replica):
+    db_session.add(Contact(
+        first_name="Primary", last_name="Only", email="primary@example.com",
+        phone="+380500000000", birthday=date(1990, 1, 1), user_id=current_user.id,
+    ))
+    await db_session.commit()
+
+    listed = await client.get("/contacts/")
+    assert listed.status_code == 200
+    assert [c["first_name"] for c in listed.json()] == ["Primary"]
+    assert replica_router.stats()["available"] is False
+
+    exported = await client.get("/contacts/export")
+    assert exported.status_code == 200
+    assert "Primary" in exported.text
+
+
+@pytest.mark.asyncio
+async def test_failed_replica_user_read_is_retried_on_primary(client, current_user, broken_replica):
+    local_users.clear()
+    await redis.delete(f"user:{current_user.email}")
+
+    response = await client.get("/users/me")
+    assert response.status_code == 200
+    assert response.json()["email"] == current_user.email
+
+
+@pytest.mark.asyncio
+async def test_current_user_without_request_reads_primary(current_user, db_session, replica):
+    local_users.clear()
+    await redis.delete(f"user:{current_user.email}")
+    token = auth_service.create_access_token({"sub": current_user.email})
+    reads = replica_router.stats()["replica_reads"]
+
+    user = await auth_service.get_current_user(token, db=db_session)
+    assert user.email == current_user.email
+    assert replica_router.stats()["replica_reads"] == reads
@@ -5,7 +5,7 @@ from app.services.auth import auth_service
 @pytest.mark.asyncio
 async def test_create_and_get_user(db_session):
     user_in = UserCreate(email="test@ex.com", password="Password123")
-    hashed = auth_service.hash_password(user_in.password)  
+    hashed = await auth_service.hash_password(user_in.password)  
     user = await create_user(user_in, hashed, db=db_session)
     assert user.id
     assert user.email == user_in.email
@@ -17,7 +17,7 @@ async def test_create_and_get_user(db_session):
 @pytest.mark.asyncio
 async def test_update_token(db_session):
     user_in = UserCreate(email="foo@bar.com", password="pass")
-    hashed = auth_service.hash_password(user_in.password)  
+    hashed = await auth_service.hash_password(user_in.password)  
     user = await create_user(user_in, hashed, db=db_session)
 
     token = "some.jwt.token"
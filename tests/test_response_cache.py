@@ -0,0 +1,93 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.services.cache import redis
+from app.services.response_cache import CachedResponse, ResponseCache, response_cache
+
+
+@pytest.fixture
+def enabled_cache(monkeypatch):
+    monkeypatch.setattr(response_cache, "enabled", True)
+    for counter in ("hits", "misses", "coalesced", "lock_waits", "errors"):
+        monkeypatch.setattr(response_cache, counter, 0)
+    return response_cache
+
+
+@pytest.mark.asyncio
+async def test_list_and_detail_are_served_from_cache(client, create_contact, enabled_cache):
+    created = await create_contact()
+    first = await client.get("/contacts/")
+    detail = await client.get(f"/contacts/{created['id']}")
+
+    with patch("app.routes.contacts.select") as select:
+        again = await client.get("/contacts/")
+        detail_again = await client.get(f"/contacts/{created['id']}")
+    select.assert_not_called()
+    assert again.json() == first.json() == [created]
+    assert detail_again.json() == detail.json() == created
+    assert again.headers["ETag"] == first.headers["ETag"]
+    assert again.headers["X-RateLimit-Limit"] == "120"
+    assert (enabled_cache.hits, enabled_cache.misses) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_next_cursor_header_is_cached(client, create_contact, enabled_cache):
+    for i in range(3):
+        await create_contact(email=f"a{i}@example.com")
+    first = await client.get("/contacts/", params={"limit": 2})
+    again = await client.get("/contacts/", params={"limit": 2})
+    assert enabled_cache.hits == 1
+    assert again.headers["X-Next-Cursor"] == first.headers["X-Next-Cursor"]
+
+
+@pytest.mark.asyncio
+async def test_write_moves_to_new_generation(client, create_contact, contact_payload, enabled_cache):
+    created = await create_contact()
+    await client.get("/contacts/")
+    await client.patch(f"/contacts/{created['id']}", json={**contact_payload, "last_name": "Bondar"})
+    after = await client.get("/contacts/")
+    assert after.json()[0]["last_name"] == "Bondar"
+    assert enabled_cache.hits == 0
+
+
+@pytest.mark.asyncio
+async def test_missing_contact_is_not_cached(client, current_user, enabled_cache):
+    assert (await client.get("/contacts/999")).status_code == 404
+    assert (await client.get("/contacts/999")).status_code == 404
+    assert enabled_cache.hits == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_are_computed_once():
+    cache = ResponseCache(enabled=True, lock_ttl=1.0)
+    calls = 0
+
+    async def produce():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return CachedResponse(b"[]", {})
+
+    results = await asyncio.gather(*(cache.fetch("resp:test:stampede", 60, produce) for _ in range(10)))
+    assert calls == 1
+    assert all(r.body == b"[]" for r in results)
+    assert cache.coalesced == 9
+
+
+@pytest.mark.asyncio
+async def test_waits_for_result_from_lock_holder():
+    await redis.set("resp:test:locked:lock", "1", px=1000)
+    cache = ResponseCache(enabled=True, lock_ttl=1.0)
+
+    async def produce():
+        raise AssertionError("must not compute while another process holds the lock")
+
+    async def other_process():
+        await asyncio.sleep(0.05)
+        await redis.set("resp:test:locked", '{"body": "[1]", "headers": {}}')
+
+    result, _ = await asyncio.gather(cache.fetch("resp:test:locked", 60, produce), other_process())
+    assert result.body == b"[1]"
+    assert cache.lock_waits == 1
@@ -0,0 +1,79 @@
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.database import schema
+from app.database.db import Base, engine, get_db
+from app.database.schema import alembic_config, include_name, is_at_head, run_migrations, is_schema_ready, reset_schema_state
+
+
+@pytest.mark.asyncio
+async def test_migrations_match_models(tmp_path):
+    test_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'migrated.db'}")
+    async with test_engine.begin() as conn:
+        await conn.run_sync(run_migrations)
+        assert await conn.run_sync(is_at_head)
+        diff = await conn.run_sync(
+            lambda sync_conn: compare_metadata(
+                MigrationContext.configure(sync_conn, opts={"include_name": include_name}), Base.metadata
+            )
+        )
+    await test_engine.dispose()
+    assert diff == []
+
+
+@pytest.mark.asyncio
+async def test_unique_email_migration_reports_duplicates(tmp_path):
+    test_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'duplicates.db'}")
+
+    def upgrade(sync_conn, revision):
+        cfg = alembic_config()
+        cfg.attributes["connection"] = sync_conn
+        command.upgrade(cfg, revision)
+
+    async with test_engine.begin() as conn:
+        await conn.run_sync(upgrade, "0005")
+        await conn.execute(text(
+            "INSERT INTO users (id, email, hashed_password, is_verified, role) VALUES (1, 'u@example.com', 'x', 1, 'USER')"
+        ))
+        await conn.execute(text(
+            "INSERT INTO contacts (id, first_name, email, user_id) VALUES "
+            "(1, 'Anna', 'anna@example.com', 1), (2, 'Anna', 'anna@example.com', 1), (3, 'Olena', 'olena@example.com', 1)"
+        ))
+    async with test_engine.connect() as conn:
+        with pytest.raises(RuntimeError, match=r"user_id=1 email='anna@example.com' contact ids=\[1, 2\]"):
+            await conn.run_sync(upgrade, "head")
+        await conn.rollback()
+        assert (await conn.execute(text("SELECT COUNT(*) FROM contacts"))).scalar() == 3
+    await test_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_schema_ready_check_is_cached(monkeypatch):
+    reset_schema_state()
+    monkeypatch.setattr(schema, "is_at_head", lambda conn: True)
+    assert await is_schema_ready()
+
+    monkeypatch.setattr(schema, "is_at_head", lambda conn: pytest.fail("schema checked twice"))
+    assert await is_schema_ready()
+    reset_schema_state()
+
+
+@pytest.mark.asyncio
+async def test_get_db_issues_no_statements():
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        gen = get_db()
+        session = await gen.__anext__()
+        await session.close()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _record)
+    assert statements == []
@@ -0,0 +1,89 @@
+import json
+from datetime import date
+from typing import List
+
+import pytest
+from fastapi.exceptions import ResponseValidationError
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+from app.models.models import Contact
+from app.schemas.schemas import ContactResponse
+from app.services.fieldsets import CONTACT_FIELDS, contact_columns
+from app.services.serialization import dump_rows
+
+CONTACT_LIST = TypeAdapter(List[ContactResponse])
+
+
+@pytest.fixture
+async def contacts(db_session, current_user):
+    rows = [
+        Contact(first_name="Anna", last_name="Koval", email="anna@example.com", phone="+380501",
+                birthday=date(1990, 5, 3), additional_info=None, user_id=current_user.id),
+        Contact(first_name="Олена", last_name="Лис", email="olena@example.com", phone="+380502",
+                birthday=date(1985, 12, 31), additional_info='лапки " і \\ та\nрядки', user_id=current_user.id),
+    ]
+    db_session.add_all(rows)
+    await db_session.commit()
+    return rows
+
+
+@pytest.mark.asyncio
+async def test_dump_rows_matches_contact_response(db_session, contacts):
+    orm = (await db_session.execute(select(Contact).order_by(Contact.id))).scalars().all()
+    expected = CONTACT_LIST.dump_json(CONTACT_LIST.validate_python(orm, from_attributes=True))
+
+    rows = (await db_session.execute(select(*contact_columns(CONTACT_FIELDS)).order_by(Contact.id))).all()
+    assert dump_rows(rows) == expected
+
+
+@pytest.mark.asyncio
+async def test_dump_rows_skips_extra_columns(db_session, contacts):
+    rows = (await db_session.execute(
+        select(*contact_columns(("email",), ["last_name", "id"])).order_by(Contact.id)
+    )).all()
+    assert json.loads(dump_rows(rows, ("email",))) == [{"email": "anna@example.com"}, {"email": "olena@example.com"}]
+
+
+@pytest.mark.asyncio
+async def test_list_response_is_schema_equivalent(client, contacts):
+    response = await client.get("/contacts/", params={"sort": "id"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    body = response.json()
+    assert body == json.loads(CONTACT_LIST.dump_json(CONTACT_LIST.validate_python(body)))
+    assert list(body[0]) == list(CONTACT_FIELDS)
+    assert body[1]["additional_info"] == 'лапки " і \\ та\nрядки'
+
+
+@pytest.fixture
+async def invalid_contact(db_session, current_user):
+    contact = Contact(first_name=None, last_name="Koval", email="broken@example.com", phone="+380509",
+                      birthday=date(1990, 5, 3), user_id=current_user.id)
+    db_session.add(contact)
+    await db_session.commit()
+    return contact
+
+
+@pytest.mark.asyncio
+async def test_invalid_row_is_rejected_by_list_and_detail(client, invalid_contact):
+    with pytest.raises(ResponseValidationError) as detail:
+        await client.get(f"/contacts/{invalid_contact.id}")
+    with pytest.raises(ResponseValidationError) as listed:
+        await client.get("/contacts/")
+    assert [e["loc"][-1] for e in listed.value.errors()] == [e["loc"][-1] for e in detail.value.errors()] == ["first_name"]
+
+
+@pytest.mark.asyncio
+async def test_invalid_row_outside_requested_fields_is_served(client, invalid_contact):
+    response = await client.get("/contacts/", params={"fields": "id,email"})
+    assert response.json() == [{"id": invalid_contact.id, "email": "broken@example.com"}]
+
+
+@pytest.mark.asyncio
+async def test_stored_email_is_not_revalidated(db_session, current_user):
+    db_session.add(Contact(first_name="Legacy", last_name="Row", email="not-an-email", phone="+380509",
+                           birthday=date(1990, 5, 3), user_id=current_user.id))
+    await db_session.commit()
+    rows = (await db_session.execute(select(*contact_columns(("email",))))).all()
+    assert json.loads(dump_rows(rows, ("email",))) == [{"email": "not-an-email"}]
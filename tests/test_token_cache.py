@@ -0,0 +1,48 @@
+import time
+from unittest.mock import patch
+
+from jose import jwt
+
+from app.conf.config import settings
+from app.services import auth
+from app.services.auth import auth_service, verified_tokens
+
+
+def test_repeat_decode_skips_signature_verification():
+    token = auth_service.create_access_token({"sub": "cached@example.com"})
+    hits = verified_tokens.hits
+    with patch("app.services.auth.jwt.decode", wraps=jwt.decode) as decode:
+        assert auth_service.decode_token(token) == "cached@example.com"
+        assert auth_service.decode_token(token) == "cached@example.com"
+    assert decode.call_count == 1
+    assert verified_tokens.hits == hits + 1
+
+
+def test_cached_entry_expires_with_token(monkeypatch):
+    token = auth_service.create_access_token({"sub": "expiring@example.com"})
+    exp = jwt.get_unverified_claims(token)["exp"]
+    monkeypatch.setattr(auth.time, "time", lambda: exp - 0.01)
+    auth_service.decode_token(token)
+    expirations = verified_tokens.expirations
+    time.sleep(0.02)
+
+    with patch("app.services.auth.jwt.decode", wraps=jwt.decode) as decode:
+        assert auth_service.decode_token(token) == "expiring@example.com"
+    assert decode.call_count == 1
+    assert verified_tokens.expirations == expirations + 1
+
+
+def test_invalid_tokens_are_not_cached():
+    forged = jwt.encode({"sub": "x@example.com", "exp": int(time.time()) + 60}, "wrong", algorithm=settings.algorithm)
+    assert auth_service.decode_token(forged) is None
+    assert auth_service.decode_token(forged) is None
+    assert len(verified_tokens) == 0
+
+
+def test_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(verified_tokens, "maxsize", 2)
+    evictions = verified_tokens.evictions
+    for i in range(3):
+        auth_service.decode_token(auth_service.create_access_token({"sub": f"u{i}@example.com"}))
+    assert len(verified_tokens) == 2
+    assert verified_tokens.evictions == evictions + 1
@@ -18,7 +18,7 @@ async def db_session():
 async def test_user(db_session: AsyncSession):
     email = "contactuser@example.com"
     password = "Secret123"
-    hashed = auth_service.hash_password(password)
+    hashed = await auth_service.hash_password(password)
     user = await create_user(type("U", (), {"email": email, "password": password}), hashed, db_session)
     await db_session.execute(
         update(User).where(User.email == email).values(is_verified=True)
@@ -60,11 +60,11 @@ async def test_get_contacts(authorized_client):
 
 @pytest.mark.asyncio
 async def test_search_contacts(authorized_client):
-    response = await authorized_client.get("/contacts/search?query=john")
+    response = await authorized_client.get("/contacts/search?q=john")
     assert response.status_code == 200
 
 @pytest.mark.asyncio
 async def test_get_birthday_contacts(authorized_client):
-    response = await authorized_client.get("/contacts/birthday")
+    response = await authorized_client.get("/contacts/birthdays")
     assert response.status_code == 200
 
@@ -0,0 +1,131 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from app.models.models import User, UserRole
+from app.repository.user_cache import (
+    USER_CACHE_CHANNEL, WORKER_ID, apply_invalidation, fill_user_cache, get_cached_user,
+    local_users, start_invalidation_listener, stop_invalidation_listener, user_cache_key,
+    write_user_cache,
+)
+from app.repository.users import confirm_user, create_user
+from app.services.cache import redis
+
+
+async def cached(email):
+    raw = await redis.get(user_cache_key(email))
+    return json.loads(raw) if raw else None
+
+
+@pytest.mark.asyncio
+async def test_login_primes_cache(client, current_user):
+    snapshot = await cached("testuser@example.com")
+    assert snapshot["id"] == current_user.id
+    assert snapshot["is_verified"] is True
+
+
+@pytest.mark.asyncio
+async def test_profile_update_writes_through(client, current_user):
+    await client.get("/users/me")
+    response = await client.patch("/users/me", json={
+        "email": "testuser@example.com", "password": None, "avatar_url": "https://img/new.png",
+    })
+    assert response.status_code == 200
+
+    assert (await cached("testuser@example.com"))["avatar_url"] == "https://img/new.png"
+    me = await client.get("/users/me")
+    assert me.json()["avatar_url"] == "https://img/new.png"
+
+
+@pytest.mark.asyncio
+async def test_email_change_drops_old_entry(client, current_user):
+    response = await client.patch("/users/me", json={
+        "email": "renamed@example.com", "password": None, "avatar_url": None,
+    })
+    assert response.status_code == 200
+
+    assert await cached("testuser@example.com") is None
+    assert (await cached("renamed@example.com"))["id"] == current_user.id
+
+
+@pytest.mark.asyncio
+async def test_avatar_update_with_cached_user(client, admin_user):
+    with patch("app.services.cloudinary_service.cloudinary.uploader.upload") as mock_upload:
+        mock_upload.return_value = {"secure_url": "https://fake.cloudinary.com/a.png"}
+        response = await client.patch("/users/me/avatar", files={"file": ("a.png", b"png", "image/png")})
+
+    assert response.status_code == 200
+    assert response.json()["avatar_url"] == "https://fake.cloudinary.com/a.png"
+    assert (await cached("admin@example.com"))["avatar_url"] == "https://fake.cloudinary.com/a.png"
+
+
+@pytest.mark.asyncio
+async def test_confirm_user_refreshes_cached_status(db_session):
+    user = await create_user(type("U", (), {"email": "new@example.com"}), "hash", db_session)
+    await fill_user_cache(user)
+    assert (await cached("new@example.com"))["is_verified"] is False
+
+    await confirm_user(await get_cached_user("new@example.com"), db_session)
+    assert (await cached("new@example.com"))["is_verified"] is True
+
+
+@pytest.mark.asyncio
+async def test_fill_does_not_overwrite_fresher_snapshot(db_session):
+    user = await create_user(type("U", (), {"email": "race@example.com"}), "hash", db_session)
+    stale = {"id": user.id, "email": user.email, "is_verified": False, "avatar_url": None, "role": "user"}
+
+    user.avatar_url = "https://img/fresh.png"
+    await write_user_cache(user)
+    await fill_user_cache(User(**{**stale, "role": UserRole.USER}))
+
+    assert (await cached("race@example.com"))["avatar_url"] == "https://img/fresh.png"
+
+
+@pytest.mark.asyncio
+async def test_l1_serves_repeat_lookups_without_redis(db_session):
+    user = await create_user(type("U", (), {"email": "l1@example.com"}), "hash", db_session)
+    await write_user_cache(user)
+    await redis.delete(user_cache_key("l1@example.com"))
+
+    assert (await get_cached_user("l1@example.com")).id == user.id
+    assert local_users.stats()["hits"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_invalidation_from_other_worker_clears_l1(db_session):
+    user = await create_user(type("U", (), {"email": "pubsub@example.com"}), "hash", db_session)
+    await write_user_cache(user)
+    start_invalidation_listener()
+    try:
+        for _ in range(50):
+            if await redis.pubsub_numsub(USER_CACHE_CHANNEL) != [(USER_CACHE_CHANNEL, 0)]:
+                break
+            await asyncio.sleep(0.01)
+        local_users.set("pubsub@example.com", {"id": user.id})
+
+        await redis.publish(USER_CACHE_CHANNEL, json.dumps({"origin": "other", "emails": ["pubsub@example.com"]}))
+        for _ in range(50):
+            if local_users.get("pubsub@example.com") is None:
+                break
+            await asyncio.sleep(0.01)
+        assert local_users.get("pubsub@example.com") is None
+    finally:
+        await stop_invalidation_listener()
+
+
+def test_own_invalidations_are_ignored():
+    local_users.set("self@example.com", {"id": 1})
+    apply_invalidation(json.dumps({"origin": WORKER_ID, "emails": ["self@example.com"]}))
+    assert local_users.get("self@example.com") == {"id": 1}
+
+
+@pytest.mark.asyncio
+async def test_cache_stats_endpoint(client, admin_user):
+    await client.get("/users/me")
+    response = await client.get("/users/cache-stats")
+    assert response.status_code == 200
+    assert response.json()["users"]["hits"] >= 1
+    assert response.json()["tokens"]["hits"] >= 1
+    assert {"hit_ratio", "evictions", "size"} <= response.json()["users"].keys()